@@ -1,8 +1,9 @@
 from typing import List, Dict, Set
 import time
 from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QColor, QPen
+from PyQt5.QtGui import QColor
 from core.matrices.graph_matrices import GraphMatrices
+from ui.style_palette import PALETTE
 
 class GreedyColoringVisualizer:
     def __init__(self, graph_matrices: GraphMatrices, graph_canvas):
@@ -31,7 +32,7 @@ class GreedyColoringVisualizer:
         for vertex in self.graph_matrices.vertices:
             vertex.set_color(self.colors['default'])
         for edge in self.graph_canvas.edges:
-            edge[2].setPen(QPen(self.colors['edge_default'], 2))
+            edge[2].setPen(PALETTE.pen(self.colors['edge_default'], 2))
         self.vertex_color_map.clear()
 
     def get_available_color(self, vertex) -> int:
@@ -59,18 +60,22 @@ class GreedyColoringVisualizer:
         for vertex in self.graph_matrices.vertices:
             # Visualiser le sommet courant
             vertex.set_color(self.colors['current'])
-            self.graph_canvas.scene.update()
+            self.graph_canvas.flush_styles()
             time.sleep(0.5)  # Animation delay
             
             # Trouver et appliquer la couleur disponible
             color_idx = self.get_available_color(vertex)
             self.vertex_color_map[vertex] = color_idx
             vertex.set_color(self.vertex_colors[color_idx])
-            self.graph_canvas.scene.update()
+            self.graph_canvas.flush_styles()
             time.sleep(0.5)  # Animation delay
         
         return self.vertex_color_map
 
+def coloring_table(vertex_color_map: Dict):
+    """(fields, rows) of a coloring map for the table exports."""
+    return ("vertex", "color"), ((vertex.label, color) for vertex, color in vertex_color_map.items())
+
 def run_greedy_coloring(graph_matrices: GraphMatrices, graph_canvas):
     """Exécuter l'algorithme de coloration glouton"""
     visualizer = GreedyColoringVisualizer(graph_matrices, graph_canvas)
@@ -1,8 +1,9 @@
 from typing import Dict
 import time
-from PyQt5.QtGui import QColor, QPen
+from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import QApplication
 from core.matrices.graph_matrices import GraphMatrices
+from ui.style_palette import PALETTE
 
 class WelshPowellVisualizer:
     def __init__(self, graph_matrices: GraphMatrices, graph_canvas, delay: float = 0.5):
@@ -25,9 +26,9 @@ class WelshPowellVisualizer:
         for vertex in self.graph_matrices.vertices:
             vertex.set_color(self.colors['default'])
         for edge in self.graph_canvas.edges:
-            edge[2].setPen(QPen(self.colors['edge_default'], 2))
+            edge[2].setPen(PALETTE.pen(self.colors['edge_default'], 2))
         self.vertex_color_map.clear()
-        self.graph_canvas.scene.update()
+        self.graph_canvas.flush_styles()
         QApplication.processEvents()
 
     def get_vertex_degree(self, vertex) -> int:
@@ -56,14 +57,14 @@ class WelshPowellVisualizer:
             vertex = sorted_vertices[0]
             # Visualiser le sommet courant
             vertex.set_color(self.colors['current'])
-            self.graph_canvas.scene.update()
+            self.graph_canvas.flush_styles()
             QApplication.processEvents()
             time.sleep(self.delay)
 
             # Colorer le sommet
             self.vertex_color_map[vertex] = current_color
             vertex.set_color(self.vertex_colors[current_color])
-            self.graph_canvas.scene.update()
+            self.graph_canvas.flush_styles()
             QApplication.processEvents()
             time.sleep(0.5)
 
@@ -78,13 +79,13 @@ class WelshPowellVisualizer:
 
             for v in vertices_to_color:
                 v.set_color(self.colors['current'])
-                self.graph_canvas.scene.update()
+                self.graph_canvas.flush_styles()
                 QApplication.processEvents()
                 time.sleep(self.delay * 0.6)
 
                 self.vertex_color_map[v] = current_color
                 v.set_color(self.vertex_colors[current_color])
-                self.graph_canvas.scene.update()
+                self.graph_canvas.flush_styles()
                 QApplication.processEvents()
                 time.sleep(0.3)
 
@@ -0,0 +1,183 @@
+import numpy as np
+from typing import Optional, Tuple
+
+
+class _WeightedGraph:
+    """
+    Symmetric weighted graph as coordinate arrays, every edge stored in
+    both directions and a self-loop of weight w as one (i, i, 2w) entry,
+    so that the row sums are the degrees.
+    """
+
+    def __init__(self, n: int, rows: np.ndarray, cols: np.ndarray, weight: np.ndarray):
+        self.n = n
+        order = np.argsort(rows, kind='stable')
+        self.rows = rows[order]
+        self.cols = cols[order]
+        self.weight = weight[order]
+        self.degree = np.bincount(rows, weights=weight, minlength=n)
+        self.total = self.degree.sum()  # 2m
+
+    def independent_sets(self, seed: int = 0):
+        """
+        Split the vertices into independent sets (no two vertices of a set
+        adjacent), Jones-Plassmann style: each round takes the uncoloured
+        vertices whose pseudo-random priority beats all their uncoloured
+        neighbours.
+
+        Returns:
+            List of (vertices, indices of their off-diagonal entries)
+        """
+        n = self.n
+        links = self.rows != self.cols
+        rows, cols = self.rows[links], self.cols[links]
+        starts = np.searchsorted(rows, np.arange(n + 1))
+        has_links = starts[:-1] < starts[1:]
+        priority = np.random.default_rng(seed).permutation(n)
+        left = np.ones(n, dtype=bool)
+        entries = np.flatnonzero(links)
+        sets = []
+        while left.any():
+            neighbour = np.where(left[cols], priority[cols], -1)
+            highest = np.full(n, -1)
+            if len(rows):
+                highest[has_links] = np.maximum.reduceat(neighbour, starts[:-1][has_links])
+            chosen = np.flatnonzero(left & (priority > highest))
+            left[chosen] = False
+            counts = starts[chosen + 1] - starts[chosen]
+            within = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            sets.append((chosen, entries[np.repeat(starts[chosen], counts) + within]))
+        return sets
+
+    def aggregate(self, labels: np.ndarray, count: int) -> '_WeightedGraph':
+        """Graph of the communities: weights summed, internal edges as self-loops."""
+        keys, inverse = np.unique(labels[self.rows] * count + labels[self.cols], return_inverse=True)
+        return _WeightedGraph(count, keys // count, keys % count, np.bincount(inverse, weights=self.weight))
+
+
+def modularity(n: int, src, dst, labels, weight=None, resolution: float = 1.0) -> float:
+    """
+    Modularity of a partition of an undirected graph: fraction of the
+    edge weight inside the communities, minus its expected value for
+    random edges with the same degrees.
+    """
+    graph = _graph(n, src, dst, weight)
+    return _modularity(graph, np.asarray(labels, dtype=np.int64), resolution)
+
+
+def _graph(n: int, src, dst, weight) -> _WeightedGraph:
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    weight = np.ones(len(src)) if weight is None else np.abs(np.asarray(weight, dtype=np.float64))
+    keep = src != dst  # Les boucles ne changent pas les communautés
+    src, dst, weight = src[keep], dst[keep], weight[keep]
+    return _WeightedGraph(n, np.concatenate([src, dst]), np.concatenate([dst, src]), np.concatenate([weight, weight]))
+
+
+def _modularity(graph: _WeightedGraph, labels: np.ndarray, resolution: float) -> float:
+    if graph.total == 0:
+        return 0.0
+    inside = graph.weight[labels[graph.rows] == labels[graph.cols]].sum()
+    totals = np.bincount(labels, weights=graph.degree)
+    return float(inside / graph.total - resolution * (totals ** 2).sum() / graph.total ** 2)
+
+
+def _move_vertices(graph: _WeightedGraph, resolution: float, max_sweeps: int, tol: float,
+                   labels: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Local moving phase: starting from singletons (or the given labels),
+    move vertices to the neighbouring community with the best modularity
+    gain k_i,C - resolution * k_i * Σtot_C / 2m (i taken out of its own
+    community first), sweep after sweep until the modularity improves by
+    less than tol.
+
+    Each sweep goes through independent sets of vertices, and the gains
+    of every (vertex, neighbouring community) pair of a set are computed
+    at once with NumPy: no two vertices of a set are adjacent, so their
+    moves do not invalidate each other's gains as moving every vertex at
+    the same time would (neighbours swapping communities forever). Only
+    the vertices next to a move of the previous sweep are looked at again.
+    """
+    n = graph.n
+    labels = np.arange(n) if labels is None else labels.copy()
+    degree, total = graph.degree, graph.total
+    totals = np.bincount(labels, weights=degree, minlength=n)  # Σtot of each community
+    sets = graph.independent_sets()
+    current = _modularity(graph, labels, resolution)
+    active = np.ones(n, dtype=bool)
+    for _ in range(max_sweeps):
+        next_active = np.zeros(n, dtype=bool)
+        for _, entries in sets:
+            entries = entries[active[graph.rows[entries]]]
+            if not len(entries):
+                continue
+            # Weight from each vertex of the set to each neighbouring community
+            rows, cols = graph.rows[entries], graph.cols[entries]
+            keys, inverse = np.unique(rows * n + labels[cols], return_inverse=True)
+            vertex, community = keys // n, keys % n
+            links = np.bincount(inverse, weights=graph.weight[entries])
+            own = community == labels[vertex]
+            gain = links - resolution * degree[vertex] * (totals[community] - own * degree[vertex]) / total
+            # Staying: the pair with its own community, or no link at all to it
+            stay = -resolution * degree[vertex] * (totals[labels[vertex]] - degree[vertex]) / total
+            stay[own] = gain[own]
+            stay = np.maximum.reduceat(stay, np.flatnonzero(np.r_[True, vertex[1:] != vertex[:-1]]))
+            # Best community of each vertex (the lowest label on ties)
+            order = np.lexsort((community, -gain, vertex))
+            first = order[np.r_[True, vertex[order[1:]] != vertex[order[:-1]]]]
+            better = gain[first] > stay + 1e-12 * total
+            movers, targets = vertex[first[better]], community[first[better]]
+            np.subtract.at(totals, labels[movers], degree[movers])
+            np.add.at(totals, targets, degree[movers])
+            labels[movers] = targets
+            moved = np.zeros(n, dtype=bool)
+            moved[movers] = True
+            next_active[cols[moved[rows]]] = True
+        quality = _modularity(graph, labels, resolution)
+        improvement, current = quality - current, quality
+        active = next_active
+        if improvement < tol or not active.any():
+            break
+    return np.unique(labels, return_inverse=True)[1]
+
+
+def louvain_communities(n: int, src, dst, weight=None, resolution: float = 1.0,
+                        max_sweeps: int = 50, tol: float = 1e-7) -> Tuple[np.ndarray, float]:
+    """
+    Louvain community detection: local moving of the vertices between
+    communities while the modularity improves, then the communities are
+    merged into single vertices and the moving starts again on that
+    graph, until no community merges any more.
+
+    Args:
+        n: Number of vertices
+        src, dst: Edge end points (vertex indices); directions are ignored
+        weight: Edge weights (absolute values are used), 1 when None
+        resolution: Larger values give more, smaller communities
+        max_sweeps: Maximum number of moving sweeps per level
+        tol: Modularity improvement below which a level stops
+
+    Returns:
+        (community of every vertex, numbered by decreasing size, modularity)
+    """
+    graph = _graph(n, src, dst, weight)
+    labels = np.arange(n)
+    if graph.total == 0:
+        return labels, 0.0
+    level = graph
+    while True:
+        communities = _move_vertices(level, resolution, max_sweeps, tol)
+        count = int(communities.max()) + 1
+        labels = communities[labels]
+        if count == level.n:
+            break
+        level = level.aggregate(communities, count)
+    # Vertices merged too early along with their first group may now fit
+    # better in another community: one more moving phase on the vertices
+    labels = _move_vertices(graph, resolution, max_sweeps, tol, labels)
+    # Largest communities first
+    sizes = np.bincount(labels)
+    rank = np.empty(len(sizes), dtype=np.int64)
+    rank[np.argsort(-sizes, kind='stable')] = np.arange(len(sizes))
+    labels = rank[labels]
+    return labels, _modularity(graph, labels, resolution)
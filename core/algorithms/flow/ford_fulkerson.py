@@ -1,8 +1,9 @@
 from PyQt5.QtCore import QTimer, QObject, pyqtSignal
-from PyQt5.QtGui import QColor, QPen
+from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import QMessageBox
 from core.matrices.graph_matrices import GraphMatrices
 from ui.edge_item import EdgeItem
+from ui.style_palette import PALETTE
 from collections import deque
 
 class FordFulkersonAnimator(QObject):
@@ -37,8 +38,8 @@ class FordFulkersonAnimator(QObject):
         for vertex in self.graph_matrices.vertices:
             vertex.set_color(self.colors['default'])
         for edge in self.graph_canvas.edges:
-            edge[2].setPen(QPen(self.colors['default'], 2))
-        self.graph_canvas.scene.update()
+            edge[2].setPen(PALETTE.pen(self.colors['default'], 2))
+        self.graph_canvas.flush_styles()
 
     def start(self, source_vertex, sink_vertex):
         """Start the Ford-Fulkerson algorithm animation"""
@@ -62,7 +63,7 @@ class FordFulkersonAnimator(QObject):
         # Color source and sink vertices
         source_vertex.set_color(self.colors['source'])
         sink_vertex.set_color(self.colors['sink'])
-        self.graph_canvas.scene.update()
+        self.graph_canvas.flush_styles()
 
         try:
             # Initialize residual graph
@@ -180,10 +181,10 @@ class FordFulkersonAnimator(QObject):
                     for edge in self.graph_canvas.edges:
                         if (edge[0] == u_vertex and edge[1] == v_vertex) or \
                            (edge[0] == v_vertex and edge[1] == u_vertex):
-                            edge[2].setPen(QPen(self.colors['path'], 3))
+                            edge[2].setPen(PALETTE.pen(self.colors['path'], 3))
                             break
                 
-                self.graph_canvas.scene.update()
+                self.graph_canvas.flush_styles()
                 
                 # Show bottleneck information
                 QMessageBox.information(self.graph_canvas, "Chemin Augmentant", 
@@ -210,6 +211,29 @@ class FordFulkersonAnimator(QObject):
         """Run the Ford-Fulkerson algorithm"""
         self.start(source_vertex, sink_vertex)
 
+    def result_table(self):
+        """
+        (fields, rows) of the edge flows for the table exports, None before
+        any run. The flow of u -> v is its capacity minus its residual
+        capacity; an undirected edge is reported in the direction its flow
+        goes.
+        """
+        if self.residual_graph is None or len(self.residual_graph) != len(self.graph_matrices.vertices):
+            return None
+        capacity = self.graph_matrices.adjacency_matrix
+        residual = self.residual_graph
+        index = self.graph_matrices.vertex_indices
+
+        def rows():
+            for source, target, _, directed in self.graph_matrices.edges:
+                u, v = index[source], index[target]
+                flow = capacity[u][v] - residual[u][v]
+                if not directed and flow <= 0 and capacity[v][u] - residual[v][u] > 0:
+                    source, target, u, v = target, source, v, u
+                    flow = capacity[u][v] - residual[u][v]
+                yield source.label, target.label, float(capacity[u][v]), float(max(flow, 0))
+        return ("source", "target", "capacity", "flow"), rows()
+
 def run_ford_fulkerson(graph_matrices: GraphMatrices, graph_canvas, source_vertex=None, sink_vertex=None):
     """Run Ford-Fulkerson algorithm with animation"""
     animator = FordFulkersonAnimator(graph_matrices, graph_canvas)
@@ -238,7 +262,7 @@ def run_ford_fulkerson(graph_matrices: GraphMatrices, graph_canvas, source_verte
             selection['source'] = vertex
             graph_canvas.vertex_clicked.disconnect(on_first_click)
             vertex.set_color(QColor(0, 255, 0))  # Green for source
-            graph_canvas.scene.update()
+            graph_canvas.flush_styles()
             QMessageBox.information(graph_canvas, "Ford-Fulkerson", "Cliquez sur le sommet puits.")
             graph_canvas.vertex_clicked.connect(on_second_click)
 
@@ -246,7 +270,7 @@ def run_ford_fulkerson(graph_matrices: GraphMatrices, graph_canvas, source_verte
             selection['sink'] = vertex
             graph_canvas.vertex_clicked.disconnect(on_second_click)
             vertex.set_color(QColor(255, 0, 0))  # Red for sink
-            graph_canvas.scene.update()
+            graph_canvas.flush_styles()
             
             if selection['source'] == selection['sink']:
                 QMessageBox.warning(graph_canvas, "Ford-Fulkerson", 
@@ -1,7 +1,7 @@
-from PyQt5.QtGui import QColor, QPen
+from PyQt5.QtGui import QColor
 from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QMessageBox
-from ui.edge_item import EdgeItem
+from ui.style_palette import PALETTE
 
 class KruskalVisualizer:
     COLORS = {
@@ -26,6 +26,7 @@ class KruskalVisualizer:
         self.mst_weight = 0
         self.mst_vertices = set()
         self.mst_edges = set()
+        self.mst_edge_list = []  # (source, target, weight), dans l'ordre d'ajout
         self.algorithm_finished = False
 
     def find(self, p, i):
@@ -49,9 +50,8 @@ class KruskalVisualizer:
         """Reset all colors to default"""
         for vertex in self.m.vertices:
             vertex.set_color(self.COLORS['default'])
-        for item in self.c.scene.items():
-            if isinstance(item, EdgeItem):
-                item.setPen(QPen(self.COLORS['default'], 2))
+        for _, _, item, _ in self.c.edges:
+            item.setPen(PALETTE.pen(self.COLORS['default'], 2))
 
     def check_connectivity(self):
         """Vérifie si le MST couvre tous les sommets"""
@@ -110,16 +110,15 @@ class KruskalVisualizer:
             vertex_u = self.m.vertices[u]
             vertex_v = self.m.vertices[v]
 
-            for item in self.c.scene.items():
-                if hasattr(item, 'source') and hasattr(item, 'target'):
-                    if (item.source == vertex_u and item.target == vertex_v) or \
-                       (item.source == vertex_v and item.target == vertex_u):
-                        edge = item
-                        break
+            for _, _, item, _ in self.c.edges:
+                if (item.source == vertex_u and item.target == vertex_v) or \
+                   (item.source == vertex_v and item.target == vertex_u):
+                    edge = item
+                    break
 
             # Colorer temporairement en rouge (traitement en cours)
             if edge:
-                edge.setPen(QPen(self.COLORS['current'], 2))
+                edge.setPen(PALETTE.pen(self.COLORS['current'], 2))
             vertex_u.set_color(self.COLORS['current'])
             vertex_v.set_color(self.COLORS['current'])
 
@@ -134,8 +133,9 @@ class KruskalVisualizer:
         """Confirme l'ajout d'une arête au MST avec les couleurs finales"""
         try:
             if edge:
-                edge.setPen(QPen(self.COLORS['mst_edge'], 2))
+                edge.setPen(PALETTE.pen(self.COLORS['mst_edge'], 2))
                 self.mst_edges.add(tuple(sorted([vertex_u.label, vertex_v.label])))
+                self.mst_edge_list.append((vertex_u.label, vertex_v.label, float(w)))
             self.mst_weight += w
 
             vertex_u.set_color(self.COLORS['mst_vertex'])
@@ -157,16 +157,21 @@ class KruskalVisualizer:
                 else:
                     vertex.set_color(self.COLORS['mst_vertex'])
 
-            for item in self.c.scene.items():
-                if isinstance(item, EdgeItem):
-                    edge_tuple = tuple(sorted([item.source.label, item.target.label]))
-                    if edge_tuple not in self.mst_edges:
-                        item.setPen(QPen(self.COLORS['default'], 2))
-                    else:
-                        item.setPen(QPen(self.COLORS['mst_edge'], 2))
+            for _, _, item, _ in self.c.edges:
+                edge_tuple = tuple(sorted([item.source.label, item.target.label]))
+                if edge_tuple not in self.mst_edges:
+                    item.setPen(PALETTE.pen(self.COLORS['default'], 2))
+                else:
+                    item.setPen(PALETTE.pen(self.COLORS['mst_edge'], 2))
         except Exception as e:
             QMessageBox.critical(self.c, "Erreur", f"Erreur lors de l'application des couleurs finales : {str(e)}")
 
+    def result_table(self):
+        """(fields, rows) of the tree edges for the table exports, None until finished."""
+        if not self.algorithm_finished:
+            return None
+        return ("source", "target", "weight"), iter(self.mst_edge_list)
+
 def run_kruskal(m, c, start_vertex=None):
     animator = KruskalVisualizer(m, c)
     if start_vertex:
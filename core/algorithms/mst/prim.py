@@ -1,9 +1,9 @@
 import heapq
 from PyQt5.QtCore import QTimer
-from PyQt5.QtGui import QColor, QPen
+from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import QMessageBox
 from core.matrices.graph_matrices import GraphMatrices
-from ui.edge_item import EdgeItem
+from ui.style_palette import PALETTE
 
 class PrimVisualizer:
     COLORS = {
@@ -27,14 +27,14 @@ class PrimVisualizer:
         self.total_weight = 0
         self.mst_vertices = set()
         self.mst_edges = set()
+        self.mst_edge_list = []  # (source, target, weight), dans l'ordre d'ajout
         self.algorithm_finished = False
 
     def reset_colors(self):
         for vertex in self.m.vertices:
             vertex.set_color(self.COLORS['default'])
-        for item in self.c.scene.items():
-            if isinstance(item, EdgeItem):
-                item.setPen(QPen(self.COLORS['default'], 2))
+        for _, _, item, _ in self.c.edges:
+            item.setPen(PALETTE.pen(self.COLORS['default'], 2))
 
     def check_connectivity(self):
         """Vérifie si le MST couvre tous les sommets du graphe."""
@@ -108,13 +108,12 @@ class PrimVisualizer:
             edge_to_color = None
             if p_idx != -1:
                 vertex_p = self.m.vertices[p_idx]
-                for item in self.c.scene.items():
-                    if isinstance(item, EdgeItem):
-                        if (item.source == vertex_p and item.target == vertex_u) or \
-                           (item.source == vertex_u and item.target == vertex_p):
-                            edge_to_color = item
-                            edge_to_color.setPen(QPen(self.COLORS['current'], 2))
-                            break
+                for _, _, item, _ in self.c.edges:
+                    if (item.source == vertex_p and item.target == vertex_u) or \
+                       (item.source == vertex_u and item.target == vertex_p):
+                        edge_to_color = item
+                        edge_to_color.setPen(PALETTE.pen(self.COLORS['current'], 2))
+                        break
 
             QTimer.singleShot(250, lambda: self.confirm_step(vertex_u, p_idx, edge_to_color, weight))
         except Exception as e:
@@ -128,8 +127,9 @@ class PrimVisualizer:
             
             if edge:
                 vertex_p = self.m.vertices[p_idx]
-                edge.setPen(QPen(self.COLORS['mst_edge'], 2))
+                edge.setPen(PALETTE.pen(self.COLORS['mst_edge'], 2))
                 self.mst_edges.add(tuple(sorted((vertex_p.label, vertex_u.label))))
+                self.mst_edge_list.append((vertex_p.label, vertex_u.label, float(weight)))
                 self.total_weight += weight
         except Exception as e:
             QMessageBox.critical(self.c, "Erreur", f"Une erreur est survenue lors de la confirmation d'une étape : {e}")
@@ -141,14 +141,19 @@ class PrimVisualizer:
                 if vertex not in self.mst_vertices:
                     vertex.set_color(self.COLORS['default'])
             
-            for item in self.c.scene.items():
-                if isinstance(item, EdgeItem):
-                    edge_tuple = tuple(sorted((item.source.label, item.target.label)))
-                    if edge_tuple not in self.mst_edges:
-                        item.setPen(QPen(self.COLORS['default'], 2))
+            for _, _, item, _ in self.c.edges:
+                edge_tuple = tuple(sorted((item.source.label, item.target.label)))
+                if edge_tuple not in self.mst_edges:
+                    item.setPen(PALETTE.pen(self.COLORS['default'], 2))
         except Exception as e:
             QMessageBox.critical(self.c, "Erreur", f"Une erreur est survenue lors de la coloration finale : {e}")
 
+    def result_table(self):
+        """(fields, rows) of the tree edges for the table exports, None until finished."""
+        if not self.algorithm_finished:
+            return None
+        return ("source", "target", "weight"), iter(self.mst_edge_list)
+
 def run_prim(matrices: GraphMatrices, canvas):
     animator = PrimVisualizer(matrices, canvas)
 
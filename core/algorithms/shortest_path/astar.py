@@ -0,0 +1,111 @@
+from PyQt5.QtWidgets import QMessageBox, QInputDialog
+from core.matrices.graph_matrices import GraphMatrices
+from core.algorithms.shortest_path.dijkstra import DijkstraAnimator, shortest_paths, start_path_search
+from heapq import heappush, heappop
+from typing import List, Tuple
+import math
+import numpy as np
+
+
+def heuristic_factor(indptr: np.ndarray, neighbours: np.ndarray, weights: np.ndarray,
+                     xs: np.ndarray, ys: np.ndarray) -> float:
+    """
+    Largest weight-per-pixel factor for which the Euclidean heuristic
+    factor * distance(v, target) never overestimates: the smallest
+    weight / length ratio of the edges. With it the heuristic is also
+    consistent, so A* settles each vertex once.
+    """
+    rows = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    lengths = np.hypot(xs[rows] - xs[neighbours], ys[rows] - ys[neighbours])
+    moving = lengths > 0  # Les arêtes de longueur nulle ne contraignent pas le facteur
+    if not moving.any():
+        return 0.0
+    return max(0.0, float((weights[moving] / lengths[moving]).min()))
+
+
+def astar(indptr: List[int], neighbours: List[int], weights: List[float], xs: List[float], ys: List[float],
+          source: int, target: int, factor: float) -> Tuple[List[float], List[int], List[Tuple[int, List[int]]]]:
+    """
+    A* from source to target: Dijkstra ordered by distance + heuristic,
+    the heuristic being factor times the Euclidean distance to the target
+    (vertex positions xs, ys). Outdated heap entries are skipped; a vertex
+    is expanded again if a shorter path reaches it later, which only
+    happens when the factor is above heuristic_factor().
+
+    Returns:
+        (distances, predecessors, trace) as shortest_paths()
+    """
+    n = len(indptr) - 1
+    tx, ty = xs[target], ys[target]
+    distances = [math.inf] * n
+    previous = [-1] * n
+    distances[source] = 0
+    heap = [(factor * math.hypot(xs[source] - tx, ys[source] - ty), 0, source)]
+    trace = []
+    while heap:
+        _, distance, u = heappop(heap)
+        if distance > distances[u]:
+            continue  # Entrée périmée
+        if u == target:
+            trace.append((u, []))
+            break
+        relaxed = []
+        for i in range(indptr[u], indptr[u + 1]):
+            v = neighbours[i]
+            alt = distance + weights[i]
+            if alt < distances[v]:
+                distances[v] = alt
+                previous[v] = u
+                relaxed.append(v)
+                heappush(heap, (alt + factor * math.hypot(xs[v] - tx, ys[v] - ty), alt, v))
+        trace.append((u, relaxed))
+    return distances, previous, trace
+
+
+class AStarAnimator(DijkstraAnimator):
+    """A* search replayed like Dijkstra; reports how many vertices plain Dijkstra settles."""
+    TITLE = "A*"
+
+    def __init__(self, graph_matrices: GraphMatrices, graph_canvas, factor=None, delay=500):
+        super().__init__(graph_matrices, graph_canvas, delay)
+        self.factor = factor  # Poids par pixel de l'heuristique (None : facteur admissible)
+
+    def positions(self):
+        vertices = self.graph_matrices.vertices
+        xs = np.fromiter((v.x for v in vertices), dtype=float, count=len(vertices))
+        ys = np.fromiter((v.y for v in vertices), dtype=float, count=len(vertices))
+        return xs, ys
+
+    def admissible_factor(self):
+        return heuristic_factor(*self.graph_matrices.neighbour_lists, *self.positions())
+
+    def search(self, indptr, neighbours, weights, source, target):
+        xs, ys = self.positions()
+        factor = self.factor if self.factor is not None else self.admissible_factor()
+        self.baseline = len(shortest_paths(indptr, neighbours, weights, source, target)[2])
+        return astar(indptr, neighbours, weights, xs.tolist(), ys.tolist(), source, target, factor)
+
+
+def run_astar(graph_matrices: GraphMatrices, graph_canvas, start_vertex=None, end_vertex=None, factor=None):
+    animator = AStarAnimator(graph_matrices, graph_canvas)
+    if graph_matrices.vertices:
+        admissible = animator.admissible_factor()
+        if factor is None:
+            factor, ok = QInputDialog.getDouble(
+                graph_canvas, "A*",
+                f"Poids par pixel de l'heuristique\n(admissible jusqu'à {admissible:.6g}) :",
+                admissible, 0, 1e12, 6)
+            if not ok:
+                return None
+        # Vérification de l'admissibilité
+        if factor > admissible * (1 + 1e-9):
+            answer = QMessageBox.question(
+                graph_canvas, "A*",
+                f"Avec {factor:g} par pixel, l'heuristique peut surestimer la distance restante "
+                f"(le plus petit rapport poids / longueur des arêtes est {admissible:.6g}) : "
+                f"le chemin trouvé peut ne pas être le plus court.\nUtiliser {admissible:.6g} ?",
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes)
+            if answer == QMessageBox.Yes:
+                factor = admissible
+        animator.factor = factor
+    return start_path_search(animator, start_vertex, end_vertex)
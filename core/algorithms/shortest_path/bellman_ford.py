@@ -1,8 +1,9 @@
 from PyQt5.QtCore import QTimer, QObject, pyqtSignal
-from PyQt5.QtGui import QColor, QPen
+from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import QMessageBox
 from core.matrices.graph_matrices import GraphMatrices
 from ui.edge_item import EdgeItem
+from ui.style_palette import PALETTE
 
 class BellmanFordAnimator(QObject):
     finished = pyqtSignal(dict)
@@ -42,8 +43,8 @@ class BellmanFordAnimator(QObject):
         for vertex in self.graph_matrices.vertices:
             vertex.set_color(self.colors['default'])
         for edge in self.graph_canvas.edges:
-            edge[2].setPen(QPen(self.colors['edge_default'], 2))
-        self.graph_canvas.scene.update()
+            edge[2].setPen(PALETTE.pen(self.colors['edge_default'], 2))
+        self.graph_canvas.flush_styles()
 
     def start(self, start_vertex, end_vertex):
         """Start the Bellman-Ford algorithm animation"""
@@ -85,7 +86,7 @@ class BellmanFordAnimator(QObject):
         # Color start and end vertices
         start_vertex.set_color(self.colors['start'])
         end_vertex.set_color(self.colors['end'])
-        self.graph_canvas.scene.update()
+        self.graph_canvas.flush_styles()
 
         try:
             # Prepare the algorithm data
@@ -152,7 +153,7 @@ class BellmanFordAnimator(QObject):
                 for vertex in self.graph_matrices.vertices:
                     if self.distances[vertex] != float('inf'):
                         vertex.set_color(self.colors['visited'])
-                self.graph_canvas.scene.update()
+                self.graph_canvas.flush_styles()
 
             elif step_type == 'check_relax':
                 u_idx, v_idx, weight = args
@@ -175,10 +176,10 @@ class BellmanFordAnimator(QObject):
                         for edge in self.graph_canvas.edges:
                             if (edge[0] == u_vertex and edge[1] == v_vertex) or \
                                (edge[0] == v_vertex and edge[1] == u_vertex):
-                                edge[2].setPen(QPen(self.colors['edge_visited'], 2))
+                                edge[2].setPen(PALETTE.pen(self.colors['edge_visited'], 2))
                                 break
 
-                        self.graph_canvas.scene.update()
+                        self.graph_canvas.flush_styles()
                         
                         # Reset colors after a short delay
                         QTimer.singleShot(self.delay // 2, lambda: self._reset_step_colors(u_vertex, v_vertex))
@@ -188,7 +189,7 @@ class BellmanFordAnimator(QObject):
                 for vertex in self.graph_matrices.vertices:
                     if vertex.brush().color() == self.colors['current']:
                         vertex.set_color(self.colors['visited'])
-                self.graph_canvas.scene.update()
+                self.graph_canvas.flush_styles()
 
             elif step_type == 'check_negative_cycle':
                 u_idx, v_idx, weight = args
@@ -206,11 +207,11 @@ class BellmanFordAnimator(QObject):
                         for edge in self.graph_canvas.edges:
                             if (edge[0] == u_vertex and edge[1] == v_vertex) or \
                                (edge[0] == v_vertex and edge[1] == u_vertex):
-                                edge[2].setPen(QPen(self.colors['negative_cycle'], 3))
+                                edge[2].setPen(PALETTE.pen(self.colors['negative_cycle'], 3))
                                 break
                         
                         self.negative_cycle_detected = True
-                        self.graph_canvas.scene.update()
+                        self.graph_canvas.flush_styles()
                         QMessageBox.warning(self.graph_canvas, "Cycle Négatif Détecté", 
                                           "L'algorithme a détecté un cycle de poids négatif dans le graphe.")
                         self.timer.stop()
@@ -234,14 +235,14 @@ class BellmanFordAnimator(QObject):
                         for edge in self.graph_canvas.edges:
                             if (edge[0] == u_vertex and edge[1] == v_vertex) or \
                                (edge[0] == v_vertex and edge[1] == u_vertex):
-                                edge[2].setPen(QPen(self.colors['path'], 3))
+                                edge[2].setPen(PALETTE.pen(self.colors['path'], 3))
                                 break
 
                     # Color the last vertex
                     if path:
                         path[-1].set_color(self.colors['path'])
                     
-                    self.graph_canvas.scene.update()
+                    self.graph_canvas.flush_styles()
                     
                     # Show result
                     distance = self.distances[self.end_vertex]
@@ -266,7 +267,7 @@ class BellmanFordAnimator(QObject):
             u_vertex.set_color(self.colors['visited'])
         if v_vertex.brush().color() == self.colors['current']:
             v_vertex.set_color(self.colors['visited'])
-        self.graph_canvas.scene.update()
+        self.graph_canvas.flush_styles()
 
     def _reconstruct_path(self):
         """Reconstruct the shortest path from start to end"""
@@ -314,7 +315,7 @@ def run_bellman_ford(graph_matrices: GraphMatrices, graph_canvas, start_vertex=N
             selection['start'] = vertex
             graph_canvas.vertex_clicked.disconnect(on_first_click)
             vertex.set_color(QColor(255, 255, 0))  # Yellow for start
-            graph_canvas.scene.update()
+            graph_canvas.flush_styles()
             QMessageBox.information(graph_canvas, "Bellman-Ford", "Cliquez sur le sommet d'arrivée.")
             graph_canvas.vertex_clicked.connect(on_second_click)
 
@@ -322,7 +323,7 @@ def run_bellman_ford(graph_matrices: GraphMatrices, graph_canvas, start_vertex=N
             selection['end'] = vertex
             graph_canvas.vertex_clicked.disconnect(on_second_click)
             vertex.set_color(QColor(255, 0, 255))  # Magenta for end
-            graph_canvas.scene.update()
+            graph_canvas.flush_styles()
             
             if selection['start'] == selection['end']:
                 QMessageBox.information(graph_canvas, "Bellman-Ford", 
@@ -0,0 +1,100 @@
+from core.matrices.graph_matrices import GraphMatrices
+from core.algorithms.shortest_path.dijkstra import DijkstraAnimator, shortest_paths, start_path_search
+from heapq import heappush, heappop
+from typing import List, Tuple
+import math
+import numpy as np
+
+
+def reverse_lists(indptr: np.ndarray, neighbours: np.ndarray, weights: np.ndarray):
+    """Neighbour lists of the reversed graph (every directed edge turned around)."""
+    n = len(indptr) - 1
+    rows = np.repeat(np.arange(n), np.diff(indptr))
+    order = np.argsort(neighbours, kind='stable')
+    return np.searchsorted(neighbours[order], np.arange(n + 1)), rows[order], weights[order]
+
+
+def bidirectional_shortest_path(forward, backward, source: int, target: int) -> Tuple[float, List[int], List[Tuple[int, List[int]]]]:
+    """
+    Bidirectional Dijkstra: one search from the source over the graph and
+    one from the target over the reversed graph, expanding whichever
+    frontier is closer. Every relaxed edge reaching a vertex seen by the
+    other search gives a candidate path; the search stops once the two
+    frontiers together are at least as far as the best candidate.
+
+    Args:
+        forward, backward: (indptr, neighbours, weights) lists of the
+            graph and of the reversed graph
+        source, target: Vertex indices
+
+    Returns:
+        (distance (inf if none), path as vertex indices from source to
+        target, trace of both searches as in shortest_paths())
+    """
+    if source == target:
+        return 0, [source], [(source, [])]
+    lists = (forward, backward)
+    distances = ({source: 0}, {target: 0})
+    previous = ({source: -1}, {target: -1})
+    settled = (set(), set())
+    heaps = ([(0, source)], [(0, target)])
+    best, meet = math.inf, -1
+    trace = []
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        distance, u = heappop(heaps[side])
+        if u in settled[side]:
+            continue  # Entrée périmée
+        settled[side].add(u)
+        indptr, neighbours, weights = lists[side]
+        own, other = distances[side], distances[1 - side]
+        relaxed = []
+        for i in range(indptr[u], indptr[u + 1]):
+            v = neighbours[i]
+            alt = distance + weights[i]
+            if alt < own.get(v, math.inf):
+                own[v] = alt
+                previous[side][v] = u
+                relaxed.append(v)
+                heappush(heaps[side], (alt, v))
+            # Chemin candidat passant par v
+            if v in other and own[v] + other[v] < best:
+                best, meet = own[v] + other[v], v
+        trace.append((u, relaxed))
+
+    if meet < 0:
+        return math.inf, [], trace
+    path = [meet]
+    while previous[0][path[-1]] >= 0:
+        path.append(previous[0][path[-1]])
+    path.reverse()
+    while previous[1][path[-1]] >= 0:
+        path.append(previous[1][path[-1]])
+    return best, path, trace
+
+
+class BidirectionalDijkstraAnimator(DijkstraAnimator):
+    """Bidirectional Dijkstra replayed like Dijkstra; reports how many vertices plain Dijkstra settles."""
+    TITLE = "Dijkstra bidirectionnel"
+
+    def search(self, indptr, neighbours, weights, source, target):
+        backward = reverse_lists(*self.graph_matrices.neighbour_lists)
+        self.baseline = len(shortest_paths(indptr, neighbours, weights, source, target)[2])
+        best, path, trace = bidirectional_shortest_path(
+            (indptr, neighbours, weights), tuple(a.tolist() for a in backward), source, target)
+        # Distances and predecessors along the path only: the rest is not settled by one search
+        n = len(indptr) - 1
+        distances = [math.inf] * n
+        previous = [-1] * n
+        if path:
+            distances[source] = 0
+            for u, v in zip(path, path[1:]):
+                previous[v] = u
+                distances[v] = distances[u] + weights[neighbours.index(v, indptr[u], indptr[u + 1])]
+        return distances, previous, trace
+
+
+def run_bidirectional_dijkstra(graph_matrices: GraphMatrices, graph_canvas, start_vertex=None, end_vertex=None):
+    return start_path_search(BidirectionalDijkstraAnimator(graph_matrices, graph_canvas), start_vertex, end_vertex)
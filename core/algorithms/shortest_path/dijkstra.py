@@ -1,10 +1,70 @@
 from PyQt5.QtCore import QTimer, QObject, pyqtSignal
-from PyQt5.QtGui import QColor, QPen
+from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import QMessageBox
 from core.matrices.graph_matrices import GraphMatrices
+from heapq import heappush, heappop
+from typing import List, Optional, Tuple
 import math
+from ui.style_palette import PALETTE
+
+
+def shortest_paths(indptr: List[int], neighbours: List[int], weights: List[float], source: int,
+                   target: Optional[int] = None) -> Tuple[List[float], List[int], List[Tuple[int, List[int]]]]:
+    """
+    Dijkstra over neighbour lists (GraphMatrices.neighbour_lists, as
+    Python lists) with a binary heap and lazy deletion: a vertex is pushed
+    again when its distance improves, and the outdated entries are skipped
+    when popped. O((V + E) log V).
+
+    Args:
+        indptr, neighbours, weights: Neighbour lists (non-negative weights)
+        source: Start vertex index
+        target: Vertex index at which to stop, or None for every vertex
+
+    Returns:
+        (distance of every vertex (inf if not reached), predecessor of every
+        vertex (-1 if none), trace): the trace lists the settled vertices in
+        order, each with the neighbours whose distance it improved
+    """
+    n = len(indptr) - 1
+    distances = [math.inf] * n
+    previous = [-1] * n
+    settled = [False] * n
+    distances[source] = 0
+    heap = [(0, source)]
+    trace = []
+    while heap:
+        distance, u = heappop(heap)
+        if settled[u]:
+            continue  # Entrée périmée
+        settled[u] = True
+        if u == target:
+            trace.append((u, []))
+            break
+        relaxed = []
+        for i in range(indptr[u], indptr[u + 1]):
+            v = neighbours[i]
+            if settled[v]:
+                continue
+            alt = distance + weights[i]
+            if alt < distances[v]:
+                distances[v] = alt
+                previous[v] = u
+                relaxed.append(v)
+                heappush(heap, (alt, v))
+        trace.append((u, relaxed))
+    return distances, previous, trace
+
 
 class DijkstraAnimator(QObject):
+    """
+    Computes the shortest path at once (shortest_paths), then replays the
+    recorded settled vertices and relaxed edges; long runs replay several
+    vertices per step so the animation lasts at most MAX_STEPS steps.
+    """
+    MAX_STEPS = 200
+    TITLE = "Dijkstra"
+
     finished = pyqtSignal(dict)
 
     def __init__(self, graph_matrices: GraphMatrices, graph_canvas, delay=500):
@@ -22,95 +82,85 @@ class DijkstraAnimator(QObject):
             'end': QColor(255, 0, 255)
         }
         self.delay = delay
-        self.visited = set()
         self.distances = {}
         self.previous = {}
-        self.unvisited = set()
+        self.settled = set()  # Sommets fixés par le calcul
+        self.trace = []  # (sommet fixé, voisins améliorés), dans l'ordre du calcul
+        self.batch = 1  # Sommets rejoués par pas
+        self.baseline = None  # Sommets fixés par Dijkstra seul, pour comparer les variantes
+        self.edge_lookup = {}
         self.timer = QTimer()
         self.timer.timeout.connect(self._step)
-        self.current_vertex = None
         self.start_vertex = None
         self.end_vertex = None
-        self.path_found = False
 
     def reset_colors(self):
         for vertex in self.graph_matrices.vertices:
             vertex.set_color(self.colors['default'])
         for edge in self.graph_canvas.edges:
-            edge[2].setPen(QPen(self.colors['edge_default'], 2))
-        self.graph_canvas.scene.update()
+            edge[2].setPen(PALETTE.pen(self.colors['edge_default'], 2))
+        self.graph_canvas.flush_styles()
 
     def start(self, start_vertex, end_vertex):
         self.reset_colors()
-        self.visited.clear()
-        self.unvisited = set(self.graph_matrices.vertices)
-        self.distances = {v: math.inf for v in self.graph_matrices.vertices}
-        self.previous = {v: None for v in self.graph_matrices.vertices}
-        self.distances[start_vertex] = 0
-        self.current_vertex = start_vertex
-        self.start_vertex = start_vertex
-        self.end_vertex = end_vertex
-        self.path_found = False
+        self.compute(start_vertex, end_vertex)
+        # Arêtes du canevas par paire de sommets, pour colorer les relâchements
+        self.edge_lookup = {}
+        for source, target, edge, _ in self.graph_canvas.edges:
+            self.edge_lookup.setdefault((source, target), edge)
+            self.edge_lookup.setdefault((target, source), edge)
+        self.batch = max(1, math.ceil(len(self.trace) / self.MAX_STEPS))
         start_vertex.set_color(self.colors['start'])
         end_vertex.set_color(self.colors['end'])
-        self.graph_canvas.scene.update()
+        self.graph_canvas.flush_styles()
         self.timer.start(self.delay)
 
+    def compute(self, start_vertex, end_vertex):
+        """Run Dijkstra from start_vertex until end_vertex is settled."""
+        matrices = self.graph_matrices
+        indptr, neighbours, weights = matrices.neighbour_lists
+        index = matrices.vertex_indices
+        vertices = matrices.vertices
+        distances, previous, trace = self.search(indptr.tolist(), neighbours.tolist(), weights.tolist(),
+                                                 index[start_vertex], index[end_vertex])
+        self.distances = dict(zip(vertices, distances))
+        self.previous = {v: vertices[p] if p >= 0 else None for v, p in zip(vertices, previous)}
+        self.trace = [(vertices[u], [vertices[v] for v in relaxed]) for u, relaxed in trace]
+        self.settled = {vertex for vertex, _ in self.trace}
+        self.start_vertex = start_vertex
+        self.end_vertex = end_vertex
+
+    def search(self, indptr, neighbours, weights, source, target):
+        """The search itself, as shortest_paths(); overridden by the variants."""
+        return shortest_paths(indptr, neighbours, weights, source, target)
+
     def _step(self):
-        if not self.unvisited or self.path_found:
+        if not self.trace:
             self.timer.stop()
             self._highlight_shortest_path()
             self.finished.emit(self.distances)
             self._show_distance()
             return
+        batch, self.trace = self.trace[:self.batch], self.trace[self.batch:]
 
-        # Trouver le sommet non visité avec la plus petite distance
-        current = min(
-            (v for v in self.unvisited),
-            key=lambda v: self.distances[v],
-            default=None
-        )
-        if current is None or self.distances[current] == math.inf:
-            self.timer.stop()
-            self._highlight_shortest_path()
-            self.finished.emit(self.distances)
-            self._show_distance()
-            return
+        # Colorer les sommets courants (le sommet d'arrivée garde sa couleur)
+        for current, _ in batch:
+            if current != self.end_vertex:
+                current.set_color(self.colors['current'])
+        self.graph_canvas.flush_styles()
 
-        # Si on atteint le sommet d'arrivée, on arrête l'animation
-        if current == self.end_vertex:
-            self.path_found = True
-            self.timer.stop()
-            self._highlight_shortest_path()
-            self.finished.emit(self.distances)
-            self._show_distance()
-            return
+        QTimer.singleShot(self.delay // 2, lambda: self._visit_neighbors(batch))
 
-        # Colorer le sommet courant
-        current.set_color(self.colors['current'])
-        self.graph_canvas.scene.update()
-
-        QTimer.singleShot(self.delay // 2, lambda: self._visit_neighbors(current))
-
-    def _visit_neighbors(self, current):
-        current.set_color(self.colors['visited'])
-        self.unvisited.remove(current)
-        current_idx = self.graph_matrices.vertex_indices[current]
-        for neighbor_idx, weight in enumerate(self.graph_matrices.adjacency_matrix[current_idx]):
-            if weight > 0:
-                neighbor = self.graph_matrices.vertices[neighbor_idx]
-                if neighbor in self.unvisited:
-                    alt = self.distances[current] + weight
-                    if alt < self.distances[neighbor]:
-                        self.distances[neighbor] = alt
-                        self.previous[neighbor] = current
-                        # Colorer l'arête comme "visitée"
-                        for edge in self.graph_canvas.edges:
-                            if (edge[0] == current and edge[1] == neighbor) or \
-                               (edge[0] == neighbor and edge[1] == current):
-                                edge[2].setPen(QPen(self.colors['edge_visited'], 2))
-                                break
-        self.graph_canvas.scene.update()
+    def _visit_neighbors(self, batch):
+        for current, relaxed in batch:
+            if current != self.end_vertex:
+                current.set_color(self.colors['visited'])
+            for neighbor in relaxed:
+                # Colorer l'arête comme "visitée"
+                edge = self.edge_lookup.get((current, neighbor))
+                if edge is not None:
+                    edge.setPen(PALETTE.pen(self.colors['edge_visited'], 2))
+        self.graph_canvas.flush_styles()
 
     def _highlight_shortest_path(self):
         # Colorer le chemin le plus court de start à end
@@ -119,12 +169,11 @@ class DijkstraAnimator(QObject):
             return  # Pas de chemin trouvé
         while self.previous[v] is not None:
             u = self.previous[v]
-            for edge in self.graph_canvas.edges:
-                if (edge[0] == u and edge[1] == v) or (edge[0] == v and edge[1] == u):
-                    edge[2].setPen(QPen(self.colors['path'], 3))
-                    break
+            edge = self.edge_lookup.get((u, v))
+            if edge is not None:
+                edge.setPen(PALETTE.pen(self.colors['path'], 3))
             v = u
-        self.graph_canvas.scene.update()
+        self.graph_canvas.flush_styles()
 
     def _show_distance(self):
         # Afficher la distance minimale entre start et end
@@ -135,46 +184,76 @@ class DijkstraAnimator(QObject):
             msg = f"Aucun chemin entre {label_start} et {label_end}."
         else:
             msg = f"Distance minimale de {label_start} à {label_end} : {d}"
-        QMessageBox.information(self.graph_canvas, "Dijkstra - Résultat", msg)
+        msg += f"\nSommets fixés : {len(self.settled)}"
+        if self.baseline is not None:
+            msg += f" (Dijkstra : {self.baseline})"
+        QMessageBox.information(self.graph_canvas, f"{self.TITLE} - Résultat", msg)
 
     def run(self, start_vertex, end_vertex):
         self.start(start_vertex, end_vertex)
 
+    def result_table(self):
+        """
+        (fields, rows) of the last run for the table exports, None before
+        any run: distance and predecessor of every vertex. "settled" is
+        False for a distance that is only an upper bound (the run stops
+        as soon as the end vertex is reached).
+        """
+        if not self.distances:
+            return None
+        rows = ((vertex.label, float(self.distances[vertex]),
+                 self.previous[vertex].label if self.previous[vertex] is not None else None,
+                 vertex in self.settled)
+                for vertex in self.graph_matrices.vertices if vertex in self.distances)
+        return ("vertex", "distance", "predecessor", "settled"), rows
+
 def run_dijkstra(graph_matrices: GraphMatrices, graph_canvas, start_vertex=None, end_vertex=None):
-    animator = DijkstraAnimator(graph_matrices, graph_canvas)
+    return start_path_search(DijkstraAnimator(graph_matrices, graph_canvas), start_vertex, end_vertex)
+
+def check_path_graph(graph_matrices: GraphMatrices, graph_canvas, title: str) -> bool:
+    """Warn and return False if Dijkstra cannot run (empty graph, negative weights)."""
     if not graph_matrices.vertices:
-        QMessageBox.warning(graph_canvas, "Dijkstra", "Le graphe est vide.")
-        return None
+        QMessageBox.warning(graph_canvas, title, "Le graphe est vide.")
+        return False
 
     # Vérification des poids négatifs
-    for row in graph_matrices.adjacency_matrix:
-        for weight in row:
-            if weight < 0:
-                QMessageBox.critical(graph_canvas, "Erreur Dijkstra", "Le graphe contient des poids négatifs.\nDijkstra ne supporte pas les arêtes de poids négatif.")
-                return None
+    if (graph_matrices.neighbour_lists[2] < 0).any():
+        QMessageBox.critical(graph_canvas, f"Erreur {title}", f"Le graphe contient des poids négatifs.\n{title} ne supporte pas les arêtes de poids négatif.")
+        return False
+    return True
+
+def start_path_search(animator, start_vertex=None, end_vertex=None):
+    """
+    Run a DijkstraAnimator (or a variant) between two vertices, asking the
+    user to click them when they are not given. None if the graph is
+    empty or has negative weights.
+    """
+    graph_matrices, graph_canvas, title = animator.graph_matrices, animator.graph_canvas, animator.TITLE
+    if not check_path_graph(graph_matrices, graph_canvas, title):
+        return None
 
     if start_vertex and end_vertex:
         animator.run(start_vertex, end_vertex)
         return animator
     else:
         # Demander à l'utilisateur de cliquer sur deux sommets
-        QMessageBox.information(graph_canvas, "Dijkstra", "Cliquez sur le sommet de départ.")
+        QMessageBox.information(graph_canvas, title, "Cliquez sur le sommet de départ.")
         selection = {'start': None, 'end': None}
 
         def on_first_click(vertex):
             selection['start'] = vertex
             graph_canvas.vertex_clicked.disconnect(on_first_click)
             vertex.set_color(QColor(255, 255, 0))  # Jaune pour le départ
-            graph_canvas.scene.update()
-            QMessageBox.information(graph_canvas, "Dijkstra", "Cliquez sur le sommet d'arrivée.")
+            graph_canvas.flush_styles()
+            QMessageBox.information(graph_canvas, title, "Cliquez sur le sommet d'arrivée.")
             graph_canvas.vertex_clicked.connect(on_second_click)
 
         def on_second_click(vertex):
             selection['end'] = vertex
             graph_canvas.vertex_clicked.disconnect(on_second_click)
             vertex.set_color(QColor(255, 0, 255))  # Magenta pour l'arrivée
-            graph_canvas.scene.update()
+            graph_canvas.flush_styles()
             animator.run(selection['start'], selection['end'])
 
         graph_canvas.vertex_clicked.connect(on_first_click)
-        return animator
\ No newline at end of file
+        return animator
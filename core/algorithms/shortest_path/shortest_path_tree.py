@@ -0,0 +1,180 @@
+from PyQt5.QtCore import QObject
+from PyQt5.QtGui import QColor, QCursor
+from PyQt5.QtWidgets import QMessageBox, QToolTip
+from core.matrices.graph_matrices import GraphMatrices
+from core.algorithms.shortest_path.dijkstra import shortest_paths, check_path_graph
+import math
+from ui.style_palette import PALETTE
+
+
+class ShortestPathTree(QObject):
+    """
+    Every shortest path from one source: Dijkstra runs once without target
+    and the distances and predecessors are cached per source for the
+    current version of the graph. Pointing at a vertex then highlights its
+    path by walking back the predecessor array, with no new search.
+
+    Hovering a vertex previews its path; clicking it keeps the path shown.
+    Any change of the graph drops the trees and the source.
+    """
+    TITLE = "Arbre des plus courts chemins"
+    MAX_TREES = 8  # Arbres gardés en cache (les plus récemment utilisés)
+
+    def __init__(self, graph_canvas):
+        super().__init__()
+        self.graph_canvas = graph_canvas
+        self.graph_matrices = None
+        self.colors = {
+            'default': QColor(200, 200, 200),
+            'edge_default': QColor(0, 0, 0),
+            'path': QColor(0, 255, 0),
+            'start': QColor(255, 255, 0),
+            'end': QColor(255, 0, 255)
+        }
+        self.trees = {}  # Indice de la source -> (distances, prédécesseurs), du moins au plus récent
+        self.graph_version = None  # Versions du graphe pour lesquelles self.trees est valable
+        self.edge_lookup = {}
+        self.source = None
+        self.distances = None  # Distances depuis la source (par indice)
+        self.previous = None  # Prédécesseurs (-1 si aucun)
+        self.pinned = None  # Sommet cliqué, dont le chemin reste affiché
+        self.shown_vertices = []  # Sommets et arêtes du chemin affiché
+        self.shown_edges = []
+
+    def start(self, graph_matrices: GraphMatrices) -> bool:
+        """Ask for a source on graph_matrices; False if Dijkstra cannot run on it."""
+        self.source = self.pinned = None
+        self.shown_vertices, self.shown_edges = [], []
+        if not check_path_graph(graph_matrices, self.graph_canvas, self.TITLE):
+            return False
+        version = (self.graph_canvas.matrices.version, graph_matrices.version)
+        if graph_matrices is not self.graph_matrices or version != self.graph_version:
+            self.trees = {}
+        self.graph_matrices, self.graph_version = graph_matrices, version
+        # Arêtes du canevas par paire de sommets, pour colorer les chemins
+        self.edge_lookup = {}
+        for source, target, edge, _ in self.graph_canvas.edges:
+            self.edge_lookup.setdefault((source, target), edge)
+            self.edge_lookup.setdefault((target, source), edge)
+        QMessageBox.information(self.graph_canvas, self.TITLE,
+                                "Cliquez sur le sommet source, puis survolez ou cliquez les autres sommets.")
+        return True
+
+    def version(self):
+        """
+        Versions of the canvas graph and of the graph searched (a filtered
+        snapshot of the canvas graph does not change with it).
+        """
+        return self.graph_canvas.matrices.version, self.graph_matrices.version
+
+    def is_current(self) -> bool:
+        """False, after dropping the trees and the source, if the graph changed since start()."""
+        if self.graph_matrices is None:
+            return False
+        if self.version() == self.graph_version:
+            return True
+        print("[PathTree] Graphe modifié : arbres abandonnés")
+        self.trees = {}
+        self.graph_matrices = self.graph_version = None
+        self.source = self.pinned = None
+        self.distances = self.previous = None
+        self.shown_vertices, self.shown_edges = [], []
+        return False
+
+    def tree(self, source: int):
+        """Distances and predecessors from a source index, computed once per graph version."""
+        if not self.is_current():
+            return None
+        if source in self.trees:
+            self.trees[source] = self.trees.pop(source)  # Le plus récent en dernier
+        else:
+            indptr, neighbours, weights = self.graph_matrices.neighbour_lists
+            distances, previous, _ = shortest_paths(indptr.tolist(), neighbours.tolist(), weights.tolist(), source)
+            self.trees[source] = (distances, previous)
+            if len(self.trees) > self.MAX_TREES:
+                del self.trees[next(iter(self.trees))]
+            print(f"[PathTree] Arbre calculé depuis {self.graph_matrices.vertices[source].label}")
+        return self.trees[source]
+
+    def set_source(self, vertex):
+        if not self.is_current():
+            return
+        index = self.graph_matrices.vertex_indices.get(vertex)
+        if index is None:
+            return
+        self.source = vertex
+        self.pinned = None
+        self.distances, self.previous = self.tree(index)
+        for v in self.graph_matrices.vertices:
+            v.set_color(self.colors['default'])
+        for edge in self.graph_canvas.edges:
+            edge[2].setPen(PALETTE.pen(self.colors['edge_default'], 2))
+        self.shown_vertices, self.shown_edges = [], []
+        vertex.set_color(self.colors['start'])
+        self.graph_canvas.flush_styles()
+
+    def show_path(self, vertex):
+        """Highlight the path from the source to vertex (None: clear it) and show its distance."""
+        if not self.is_current() or self.source is None:
+            return None
+        for v in self.shown_vertices:
+            v.set_color(self.colors['default'])
+        for edge in self.shown_edges:
+            edge.setPen(PALETTE.pen(self.colors['edge_default'], 2))
+        self.shown_vertices, self.shown_edges = [], []
+        index = self.graph_matrices.vertex_indices.get(vertex) if vertex is not None else None
+        if index is None or vertex is self.source:
+            self.graph_canvas.flush_styles()
+            return None
+
+        vertices = self.graph_matrices.vertices
+        distance = self.distances[index]
+        if distance < math.inf:
+            v = index
+            while self.previous[v] >= 0:
+                u = self.previous[v]
+                edge = self.edge_lookup.get((vertices[u], vertices[v]))
+                if edge is not None:
+                    edge.setPen(PALETTE.pen(self.colors['path'], 3))
+                    self.shown_edges.append(edge)
+                if u != self.graph_matrices.vertex_indices[self.source]:
+                    vertices[u].set_color(self.colors['path'])
+                    self.shown_vertices.append(vertices[u])
+                v = u
+        vertex.set_color(self.colors['end'])
+        self.shown_vertices.append(vertex)
+        self.graph_canvas.flush_styles()
+
+        if distance == math.inf:
+            msg = f"Aucun chemin entre {self.source.label} et {vertex.label}."
+        else:
+            msg = f"Distance de {self.source.label} à {vertex.label} : {distance:g} ({len(self.shown_edges)} arêtes)"
+        QToolTip.showText(QCursor.pos(), msg, self.graph_canvas)
+        return distance
+
+    def on_vertex_clicked(self, vertex):
+        """First click: the source. Later clicks: keep that vertex's path shown."""
+        if not self.is_current():
+            return
+        if self.source is None:
+            self.set_source(vertex)
+        else:
+            self.pinned = vertex
+            distance = self.show_path(vertex)
+            if distance is not None:
+                print(f"[PathTree] {self.source.label} -> {vertex.label} : {distance}")
+
+    def on_vertex_hovered(self, vertex):
+        """Preview the path of the hovered vertex; back to the clicked one when leaving it."""
+        if self.source is None:
+            return
+        self.show_path(vertex if vertex is not None else self.pinned)
+
+    def result_table(self):
+        """(fields, rows) of the tree for the table exports, None before a source is chosen."""
+        if not self.is_current() or self.source is None:
+            return None
+        vertices = self.graph_matrices.vertices
+        rows = ((vertex.label, float(distance), vertices[p].label if p >= 0 else None)
+                for vertex, distance, p in zip(vertices, self.distances, self.previous))
+        return ("vertex", "distance", "predecessor"), rows
@@ -1,9 +1,10 @@
 
 from collections import deque
 from PyQt5.QtCore import QTimer, QObject, pyqtSignal
-from PyQt5.QtGui import QColor, QPen
+from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import QMessageBox
 from core.matrices.graph_matrices import GraphMatrices
+from ui.style_palette import PALETTE
 
 class BFSAnimator(QObject):
     finished = pyqtSignal(list)
@@ -31,8 +32,8 @@ class BFSAnimator(QObject):
         for vertex in self.graph_matrices.vertices:
             vertex.set_color(self.colors['default'])
         for edge in self.graph_canvas.edges:
-            edge[2].setPen(QPen(self.colors['edge_default'], 2))
-        self.graph_canvas.scene.update()
+            edge[2].setPen(PALETTE.pen(self.colors['edge_default'], 2))
+        self.graph_canvas.flush_styles()
 
     def start(self, start_vertex):
         self.reset_colors()
@@ -51,7 +52,7 @@ class BFSAnimator(QObject):
 
         current_vertex = self.queue.popleft()
         current_vertex.set_color(self.colors['current'])
-        self.graph_canvas.scene.update()
+        self.graph_canvas.flush_styles()
 
         QTimer.singleShot(self.delay // 2, lambda: self._visit_neighbors(current_vertex))
 
@@ -66,12 +67,12 @@ class BFSAnimator(QObject):
                     for edge in self.graph_canvas.edges:
                         if (edge[0] == current_vertex and edge[1] == neighbor) or \
                            (edge[0] == neighbor and edge[1] == current_vertex):
-                            edge[2].setPen(QPen(self.colors['edge_visited'], 2))
+                            edge[2].setPen(PALETTE.pen(self.colors['edge_visited'], 2))
                             self.visited_edges.add(edge)
                             break
                     self.visited.add(neighbor)
                     self.queue.append(neighbor)
-        self.graph_canvas.scene.update()
+        self.graph_canvas.flush_styles()
 
     def run(self, start_vertex):
         self.start(start_vertex)
@@ -1,7 +1,8 @@
 from PyQt5.QtCore import QTimer, QObject, pyqtSignal
-from PyQt5.QtGui import QColor, QPen
+from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import QMessageBox
 from core.matrices.graph_matrices import GraphMatrices
+from ui.style_palette import PALETTE
 
 class DFSAnimator(QObject):
     finished = pyqtSignal(list)
@@ -30,8 +31,8 @@ class DFSAnimator(QObject):
         for vertex in self.graph_matrices.vertices:
             vertex.set_color(self.colors['default'])
         for edge in self.graph_canvas.edges:
-            edge[2].setPen(QPen(self.colors['edge_default'], 2))
-        self.graph_canvas.scene.update()
+            edge[2].setPen(PALETTE.pen(self.colors['edge_default'], 2))
+        self.graph_canvas.flush_styles()
 
     def start(self, start_vertex):
         self.reset_colors()
@@ -54,13 +55,13 @@ class DFSAnimator(QObject):
 
         # Color current vertex
         vertex.set_color(self.colors['current'])
-        self.graph_canvas.scene.update()
+        self.graph_canvas.flush_styles()
 
         # Color edge if not root
         if parent:
             for edge in self.graph_canvas.edges:
                 if (edge[0] == parent and edge[1] == vertex) or (edge[0] == vertex and edge[1] == parent):
-                    edge[2].setPen(QPen(self.colors['edge_visited'], 2))
+                    edge[2].setPen(PALETTE.pen(self.colors['edge_visited'], 2))
                     self.visited_edges.add(edge)
                     break
 
@@ -81,7 +82,7 @@ class DFSAnimator(QObject):
                     neighbors.append((neighbor, vertex))
         # Add neighbors in reverse to simulate stack (DFS)
         self.stack.extend(reversed(neighbors))
-        self.graph_canvas.scene.update()
+        self.graph_canvas.flush_styles()
 
     def run(self, start_vertex):
         self.start(start_vertex)
@@ -0,0 +1,62 @@
+import numpy as np
+from typing import Tuple
+
+
+class Adjacency:
+    """
+    Adjacency lists of a graph in CSR form, directions ignored: the
+    neighbours of vertex v are neighbours[indptr[v]:indptr[v + 1]], and
+    edges[...] gives the index of the edge behind each of them.
+    """
+
+    def __init__(self, n: int, src, dst):
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        rows = np.concatenate([src, dst])
+        order = np.argsort(rows, kind='stable')
+        self.n = n
+        self.neighbours = np.concatenate([dst, src])[order]
+        self.edges = np.tile(np.arange(len(src)), 2)[order]
+        self.indptr = np.searchsorted(rows[order], np.arange(n + 1))
+
+    def entries(self, vertices: np.ndarray) -> np.ndarray:
+        """Positions in neighbours / edges of the adjacency lists of the given vertices."""
+        starts = self.indptr[vertices]
+        counts = self.indptr[vertices + 1] - starts
+        offsets = np.cumsum(counts) - counts
+        return np.repeat(starts - offsets, counts) + np.arange(counts.sum())
+
+
+def ego_network(adjacency: Adjacency, center: int, k: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    k-hop neighbourhood of a vertex: breadth-first search stopped after k
+    levels, one NumPy step per level, so the work only depends on the size
+    of the neighbourhood (and of the adjacency lists of its border).
+
+    Args:
+        adjacency: Adjacency of the graph
+        center: Vertex index
+        k: Number of hops (0 gives the vertex alone)
+
+    Returns:
+        (vertices of the neighbourhood sorted by index, their distance in
+        hops from the center, indices of the edges between two of them)
+    """
+    hops = np.full(adjacency.n, -1, dtype=np.int64)
+    hops[center] = 0
+    frontier = np.array([center], dtype=np.int64)
+    found = [frontier]
+    for level in range(1, k + 1):
+        reached = np.unique(adjacency.neighbours[adjacency.entries(frontier)])
+        frontier = reached[hops[reached] < 0]
+        if not len(frontier):
+            break
+        hops[frontier] = level
+        found.append(frontier)
+    vertices = np.sort(np.concatenate(found))
+
+    # Induced subgraph: edges whose other end is in the neighbourhood too
+    entries = adjacency.entries(vertices)
+    inside = hops[adjacency.neighbours[entries]] >= 0
+    edges = np.unique(adjacency.edges[entries[inside]])
+    return vertices, hops[vertices], edges
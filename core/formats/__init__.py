@@ -0,0 +1,16 @@
+from core.formats.graph_data import GraphData
+from core.formats.adjacency_text import parse_adjacency_file, load_adjacency_file
+from core.formats.edge_list import parse_edge_list
+from core.formats.matrix_market import parse_matrix_market
+from core.formats.numpy_matrix import load_npy_adjacency
+from core.formats.graphml import parse_graphml, write_graphml
+from core.formats.dot import parse_dot, write_dot
+from core.formats.importers import IMPORTERS, file_filters, importer_for, load_graph
+from core.formats.exporters import EXPORTERS, export_filters, exporter_for
+from core.formats.tables import TABLE_FORMATS, table_filters, table_format_for, write_matrix, write_records
+
+__all__ = ['GraphData', 'parse_adjacency_file', 'load_adjacency_file', 'parse_edge_list',
+           'parse_matrix_market', 'load_npy_adjacency', 'IMPORTERS', 'file_filters',
+           'importer_for', 'load_graph', 'parse_graphml', 'write_graphml', 'parse_dot',
+           'write_dot', 'EXPORTERS', 'export_filters', 'exporter_for', 'TABLE_FORMATS',
+           'table_filters', 'table_format_for', 'write_matrix', 'write_records']
@@ -0,0 +1,113 @@
+import numpy as np
+from typing import Callable, List, Optional
+from core.formats.graph_data import GraphData
+from core.formats.text_io import open_binary
+
+# Spellings of infinity accepted in the files, besides what NumPy parses
+# itself ("inf", "infinity", any case)
+INFINITY_ALIASES = ("∞",)
+
+# Amount of text converted by NumPy in one call
+CHUNK_BYTES = 8 * 1024 * 1024
+
+
+def _check_line(line: str, line_number: int, n: Optional[int]):
+    """Slow path, used only to explain why a chunk failed to parse."""
+    values = line.split()
+    for value in values:
+        try:
+            float(value)
+        except ValueError:
+            raise ValueError(f"valeur invalide dans matrix: {value} (ligne {line_number})") from None
+    if n is not None and len(values) != n:
+        raise ValueError(
+            f"Matrix n'est pas un carree. ligne {line_number} a {len(values)} elements, expected {n}")
+
+
+def _parse_chunk(lines: List[str], line_numbers: List[int], n: Optional[int]) -> np.ndarray:
+    """Convert a block of lines at once with NumPy's C reader."""
+    try:
+        block = np.loadtxt(lines, dtype=np.float64, comments=None, ndmin=2)
+    except ValueError:
+        block = None
+    if block is None or (n is not None and block.shape[1] != n):
+        # Ragged rows or bad token: find the offending line
+        first = n if n is not None else len(lines[0].split())
+        for line, line_number in zip(lines, line_numbers):
+            _check_line(line, line_number, first)
+        raise ValueError(f"lignes {line_numbers[0]}-{line_numbers[-1]} illisibles")
+    return block
+
+
+def parse_adjacency_file(file_path: str,
+                         progress: Optional[Callable[[int], None]] = None) -> np.ndarray:
+    """
+    Parse a square adjacency matrix from a text file, one row per line.
+
+    The file is streamed in blocks of lines and each block is converted by
+    NumPy, so memory stays close to the size of the final n x n array.
+    Gzip-compressed files are read transparently.
+
+    Args:
+        file_path: Path of the UTF-8 text file
+        progress: Optional callback called with the number of bytes read
+            from disk
+
+    Returns:
+        The adjacency matrix (float64), inf for "inf" / "infinity" / "∞"
+
+    Raises:
+        ValueError: Empty file, invalid value or non-square matrix; the
+            message gives the offending line number.
+    """
+    matrix = None
+    n = None
+    rows = 0
+    lines, line_numbers, chunk_bytes = [], [], 0
+
+    def flush():
+        nonlocal matrix, n, rows
+        block = _parse_chunk(lines, line_numbers, n)
+        if matrix is None:
+            # The first block gives the size: allocate the result once
+            n = block.shape[1]
+            matrix = np.empty((n, n), dtype=np.float64)
+        if rows + len(block) > n:
+            raise ValueError(
+                f"Matrix n'est pas un carree. ligne {line_numbers[n - rows]} : plus de {n} lignes")
+        matrix[rows:rows + len(block)] = block
+        rows += len(block)
+        lines.clear()
+        line_numbers.clear()
+        if progress is not None:
+            progress(disk_file.tell())
+
+    file, disk_file = open_binary(file_path)
+    with file, disk_file:
+        for line_number, raw in enumerate(file, start=1):
+            if raw.isspace():
+                continue
+            line = raw.decode('utf-8')
+            for alias in INFINITY_ALIASES:
+                if alias in line:
+                    line = line.replace(alias, "inf")
+            lines.append(line)
+            line_numbers.append(line_number)
+            chunk_bytes += len(raw)
+            if chunk_bytes >= CHUNK_BYTES:
+                flush()
+                chunk_bytes = 0
+        if lines:
+            flush()
+
+    if matrix is None:
+        raise ValueError("fichier vide!")
+    if rows != n:
+        raise ValueError(f"Matrix n'est pas un carree. {rows} lignes, expected {n}")
+    return matrix
+
+
+def load_adjacency_file(file_path: str,
+                        progress: Optional[Callable[[int], None]] = None) -> GraphData:
+    """Graph of an adjacency matrix text file (see parse_adjacency_file)."""
+    return GraphData.from_adjacency(parse_adjacency_file(file_path, progress))
@@ -0,0 +1,296 @@
+import re
+import numpy as np
+from typing import Callable, Dict, Iterator, List, Optional, Union
+from core.formats.graph_data import GraphData
+from core.formats.text_io import open_text
+
+# A DOT ID: quoted string, identifier or numeral
+ID = r'"(?:[^"\\]|\\.)*"|[A-Za-z_\x80-\U0010ffff][\w\x80-\U0010ffff]*|-?(?:\.\d+|\d+(?:\.\d*)?)'
+# One DOT token: ID, edge operator, punctuation, or any other character
+# (reported by the parser as unexpected)
+TOKEN = re.compile(rf'{ID}|->|--|[\[\]{{}};,=:]|[^\s"]')
+# Fast path: a whole node or edge statement on one line, ended by ";",
+# without comments, ports or HTML labels, e.g.  a -> b [weight=2];
+STATEMENT = re.compile(
+    rf'\s*({ID})((?:\s*(?:->|--)\s*(?:{ID}))*)\s*'
+    rf'(?:\[((?:[^\[\]"<>/]|"(?:[^"\\]|\\.)*")*)\])?\s*;\s*$')
+ATTRIBUTE = re.compile(rf'({ID})(?:\s*=\s*({ID}))?')
+EDGE_STEP = re.compile(rf'\s*(->|--)\s*({ID})')
+ESCAPE = re.compile(r'\\(.)', re.DOTALL)
+NUMBER = re.compile(r'-?(?:\.\d+|\d+(?:\.\d*)?)')
+KEYWORDS = {'graph', 'digraph', 'strict', 'node', 'edge', 'subgraph'}
+
+
+def _unescape(match) -> str:
+    char = match.group(1)
+    if char == '\n':
+        return ''  # Continuation de ligne
+    if char in '"\\':
+        return char
+    return match.group()  # Autres échappements (\n, \l...) gardés tels quels
+
+
+def _unquote(token: str) -> str:
+    """Inverse of _quote(): escaped quotes and backslashes undone in one pass, line continuations removed."""
+    if len(token) >= 2 and token[0] == '"' and token[-1] == '"':
+        return ESCAPE.sub(_unescape, token[1:-1])
+    return token
+
+
+def _tokens(file, progress=None, disk_file=None) -> Iterator[Union[str, tuple]]:
+    """
+    Tokenize line by line; comments and multi-line strings are handled.
+    A line holding exactly one simple statement is yielded as a single
+    (node ids, edge operators, attributes) tuple instead of its tokens,
+    which is what keeps large generated files fast.
+    """
+    in_comment = False
+    pending = ''
+    for line_number, line in enumerate(file, start=1):
+        if progress is not None and line_number % 10000 == 0:
+            progress(disk_file.tell())
+        if pending:
+            line, pending = pending + line, ''
+        if in_comment:
+            end = line.find('*/')
+            if end < 0:
+                continue
+            line, in_comment = line[end + 2:], False
+        if line.lstrip().startswith('#'):
+            continue  # Ligne de préprocesseur C
+        statement = STATEMENT.match(line)
+        if statement is not None and statement.group(1).lower() not in KEYWORDS:
+            chain = [_unquote(statement.group(1))]
+            operators = []
+            for operator, node in EDGE_STEP.findall(statement.group(2)):
+                operators.append(operator)
+                chain.append(_unquote(node))
+            attributes = {}
+            if statement.group(3):
+                for name, value in ATTRIBUTE.findall(statement.group(3)):
+                    attributes[_unquote(name).lower()] = _unquote(value) if value else 'true'
+            yield chain, operators, attributes
+            continue
+        position = 0
+        while position < len(line):
+            char = line[position]
+            if char.isspace():
+                position += 1
+                continue
+            if line.startswith('//', position):
+                break
+            if line.startswith('/*', position):
+                end = line.find('*/', position + 2)
+                if end < 0:
+                    in_comment = True
+                    break
+                position = end + 2
+                continue
+            match = TOKEN.match(line, position)
+            if match is None:
+                pending = line[position:]  # Chaîne sur plusieurs lignes
+                break
+            position = match.end()
+            yield match.group()
+    if pending:
+        raise ValueError("chaîne non terminée")
+
+
+def parse_dot(file_path: str, progress: Optional[Callable[[int], None]] = None) -> GraphData:
+    """
+    Read a Graphviz DOT file with a line-oriented tokenizer.
+
+    Supported: graph/digraph, node and edge statements (edge chains
+    a -> b -> c), attribute lists, default node/edge attributes and
+    subgraph braces (flattened). "pos" gives the position (Graphviz's y
+    axis points up, so it is negated), "label" the vertex label, "weight"
+    the edge weight and dir=none makes an edge undirected in a digraph.
+
+    Raises:
+        ValueError: Syntax error, with the unexpected token (an edge
+            operator of the wrong kind included: -- in a digraph, -> in
+            a graph)
+    """
+    indices: Dict[str, int] = {}
+    labels: List[str] = []
+    xs: List[float] = []
+    ys: List[float] = []
+    src: List[int] = []
+    dst: List[int] = []
+    weights: List[float] = []
+    flags: List[bool] = []
+    edge_defaults: Dict[str, str] = {}
+
+    def node_index(node_id):
+        index = indices.get(node_id)
+        if index is None:
+            index = indices[node_id] = len(labels)
+            labels.append(node_id)
+            xs.append(np.nan)
+            ys.append(np.nan)
+        return index
+
+    def set_node_attributes(index, attributes):
+        if 'label' in attributes:
+            labels[index] = attributes['label']
+        if 'pos' in attributes:
+            coordinates = NUMBER.findall(attributes['pos'])
+            if len(coordinates) >= 2:
+                xs[index], ys[index] = float(coordinates[0]), -float(coordinates[1])
+
+    file, disk_file = open_text(file_path)
+    with file, disk_file:
+        tokens = _tokens(file, progress, disk_file)
+        buffer: List[str] = []
+
+        def peek():
+            if not buffer:
+                token = next(tokens, None)
+                if token is None:
+                    return None
+                buffer.append(token)
+            return buffer[0]
+
+        def take():
+            token = peek()
+            if token is None:
+                raise ValueError("fin de fichier inattendue")
+            return buffer.pop(0)
+
+        def check_operator(operator):
+            if operator != edge_operator:
+                raise ValueError(f"'{edge_operator}' attendu dans un {kind}, trouvé {operator}")
+
+        def take_word():
+            token = take()
+            if not isinstance(token, str):
+                raise ValueError(f"jeton inattendu : {token[0][0]}")
+            return token
+
+        def attribute_list():
+            attributes = {}
+            while peek() == '[':
+                take()
+                while peek() != ']':
+                    name = _unquote(take_word())
+                    value = 'true'
+                    if peek() == '=':
+                        take()
+                        value = _unquote(take_word())
+                    attributes[name.lower()] = value
+                    if peek() in (',', ';'):
+                        take()
+                take()
+            return attributes
+
+        def statement(chain, attributes):
+            """Node statement (one id) or edge chain, with its attributes."""
+            chain = [node_index(node) for node in chain]
+            if len(chain) == 1:
+                set_node_attributes(chain[0], attributes)
+                return
+            edge_attributes = dict(edge_defaults, **attributes)
+            try:
+                weight = float(edge_attributes.get('weight', 1))
+            except ValueError:
+                weight = 1.0
+            directed = directed_graph and edge_attributes.get('dir', 'forward') != 'none'
+            for source, target in zip(chain, chain[1:]):
+                src.append(source)
+                dst.append(target)
+                weights.append(weight)
+                flags.append(directed)
+
+        # Header: [strict] (graph | digraph) [ID] {
+        token = take_word().lower()
+        if token == 'strict':
+            token = take_word().lower()
+        if token not in ('graph', 'digraph'):
+            raise ValueError(f"'graph' ou 'digraph' attendu, trouvé {token}")
+        directed_graph = token == 'digraph'
+        kind = token
+        edge_operator = '->' if directed_graph else '--'
+        if peek() != '{':
+            take()
+        if take() != '{':
+            raise ValueError("'{' attendu")
+
+        depth = 1
+        while depth:
+            token = take()
+            if isinstance(token, tuple):
+                chain, operators, attributes = token
+                for operator in operators:
+                    check_operator(operator)
+                statement(chain, attributes)
+                continue
+            if token in (';', ','):
+                continue
+            if token == '{':
+                depth += 1
+                continue
+            if token == '}':
+                depth -= 1
+                continue
+            lowered = token.lower()
+            if lowered == 'subgraph':
+                if peek() != '{':
+                    take()  # Nom du sous-graphe
+                continue
+            if lowered in ('graph', 'node', 'edge') and peek() == '[':
+                attributes = attribute_list()
+                if lowered == 'edge':
+                    edge_defaults.update(attributes)
+                continue
+            if token in KEYWORDS or token in ('[', ']', '=', '->', '--'):
+                raise ValueError(f"jeton inattendu : {token}")
+            if peek() == '=':
+                take()
+                take()  # Attribut du graphe (ignoré)
+                continue
+            # Node or edge chain
+            chain = [_unquote(token)]
+            if peek() == ':':
+                take()
+                take_word()  # Port (ignoré)
+            while peek() in ('->', '--'):
+                check_operator(take())
+                target = take_word()
+                if target in ('{', '}', '[', ']', ';'):
+                    raise ValueError(f"sommet attendu après une arête, trouvé {target}")
+                chain.append(_unquote(target))
+                if peek() == ':':
+                    take()
+                    take_word()
+            statement(chain, attribute_list())
+
+    if not labels:
+        raise ValueError("aucun sommet dans le fichier")
+    x, y = np.array(xs), np.array(ys)
+    missing = np.isnan(x) | np.isnan(y)
+    if missing.any():
+        default_x, default_y = GraphData.default_positions(len(labels))
+        x[missing], y[missing] = default_x[missing], default_y[missing]
+    return GraphData.from_edges(labels, x, y, src, dst, weights, flags)
+
+
+def _quote(text: str) -> str:
+    return '"' + text.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def write_dot(file_path: str, data: GraphData):
+    """
+    Write a graph as DOT, edge by edge, straight from the arrays. A graph
+    with directed edges is written as a digraph, its undirected edges
+    with dir=none.
+    """
+    directed_graph = bool(data.directed.any())
+    operator = '->' if directed_graph else '--'
+    with open(file_path, 'w', encoding='utf-8') as file:
+        file.write('digraph G {\n' if directed_graph else 'graph G {\n')
+        for i, (label, x, y) in enumerate(zip(data.labels, data.x.tolist(), data.y.tolist())):
+            file.write(f'  n{i} [label={_quote(label)}, pos="{x!r},{-y!r}"];\n')
+        for s, t, w, d in zip(data.src.tolist(), data.dst.tolist(), data.weight.tolist(), data.directed.tolist()):
+            extra = ', dir=none' if directed_graph and not d else ''
+            file.write(f'  n{s} {operator} n{t} [weight={w!r}{extra}];\n')
+        file.write('}\n')
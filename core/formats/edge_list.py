@@ -0,0 +1,138 @@
+import numpy as np
+from typing import Callable, Dict, List, Optional
+from core.formats.graph_data import GraphData
+from core.formats.text_io import open_text
+
+# Lines converted together; keeps memory bounded on huge files
+CHUNK_LINES = 200000
+
+COMMENT_PREFIXES = ('#', '%', '//')
+DIRECTED_VALUES = {'1', 'true', 'yes', 'd', 'directed', '->'}
+UNDIRECTED_VALUES = {'0', 'false', 'no', 'u', 'undirected', '--'}
+# Usual names of the two first columns of a header line
+HEADER_NAMES = {'source', 'target', 'src', 'dst', 'from', 'to', 'node1', 'node2', 'start', 'end'}
+
+
+def _detect_delimiter(line: str) -> Optional[str]:
+    """',' for CSV, tab for TSV, ';' for some spreadsheets, None for spaces."""
+    for delimiter in (',', '\t', ';'):
+        if delimiter in line:
+            return delimiter
+    return None
+
+
+def _is_number(value: str) -> bool:
+    try:
+        float(value)
+        return True
+    except ValueError:
+        return False
+
+
+def parse_edge_list(file_path: str, directed: bool = False,
+                    progress: Optional[Callable[[int], None]] = None) -> GraphData:
+    """
+    Read a weighted edge list: one "source target [weight [directed]]"
+    line per edge, separated by spaces, tabs, commas or semicolons.
+
+    Vertex names can be any token; vertices are numbered in order of first
+    appearance. A header line is skipped, as are comment lines: the first
+    line is a header if its weight column is not a number, if its first
+    two fields are usual column names ("source target"), or if they are
+    not numbers while the ids of the next line are. Self-loops and repeated edges are dropped. Gzip
+    files are read transparently.
+
+    Args:
+        file_path: Path of the file (.csv, .tsv, .txt, ... optionally .gz)
+        directed: Directedness of the edges without a 4th column
+        progress: Optional callback called with the number of bytes read
+            from disk
+
+    Returns:
+        The graph as arrays; no dense matrix is ever built.
+
+    Raises:
+        ValueError: Malformed line, with its line number
+    """
+    indices: Dict[str, int] = {}
+    labels: List[str] = []
+    sources, targets, weights, flags = [], [], [], []
+    delimiter = None
+    first_data_line = True
+    header = None  # (line number, fields) of a first line that may be a header
+
+    def vertex_index(name):
+        index = indices.get(name)
+        if index is None:
+            index = indices[name] = len(labels)
+            labels.append(name)
+        return index
+
+    chunk_src, chunk_dst, chunk_weight, chunk_flag = [], [], [], []
+
+    def add_edge(line_number, fields):
+        try:
+            weight = float(fields[2]) if len(fields) > 2 and fields[2] else 1.0
+        except ValueError:
+            raise ValueError(f"ligne {line_number} : poids invalide {fields[2]}") from None
+        edge_directed = directed
+        if len(fields) > 3 and fields[3]:
+            flag = fields[3].lower()
+            if flag in DIRECTED_VALUES:
+                edge_directed = True
+            elif flag in UNDIRECTED_VALUES:
+                edge_directed = False
+            else:
+                raise ValueError(f"ligne {line_number} : orientation invalide {fields[3]}")
+        chunk_src.append(vertex_index(fields[0]))
+        chunk_dst.append(vertex_index(fields[1]))
+        chunk_weight.append(weight)
+        chunk_flag.append(edge_directed)
+
+    def flush():
+        sources.append(np.array(chunk_src, dtype=np.int64))
+        targets.append(np.array(chunk_dst, dtype=np.int64))
+        weights.append(np.array(chunk_weight, dtype=np.float64))
+        flags.append(np.array(chunk_flag, dtype=bool))
+        for chunk in (chunk_src, chunk_dst, chunk_weight, chunk_flag):
+            chunk.clear()
+        if progress is not None:
+            progress(disk_file.tell())
+
+    file, disk_file = open_text(file_path)
+    with file, disk_file:
+        for line_number, line in enumerate(file, start=1):
+            line = line.strip()
+            if not line or line.startswith(COMMENT_PREFIXES):
+                continue
+            if first_data_line:
+                delimiter = _detect_delimiter(line)
+            fields = [field.strip() for field in line.split(delimiter)]
+            if len(fields) < 2:
+                raise ValueError(f"ligne {line_number} : au moins deux sommets attendus")
+            numeric_ids = _is_number(fields[0]) and _is_number(fields[1])
+            if first_data_line:
+                first_data_line = False
+                if len(fields) > 2 and not _is_number(fields[2]):
+                    continue  # En-tête "source,target,weight"
+                if fields[0].lower() in HEADER_NAMES and fields[1].lower() in HEADER_NAMES:
+                    continue  # En-tête "source,target"
+                if not numeric_ids:
+                    header = (line_number, fields)  # En-tête si la ligne suivante est numérique
+                    continue
+            elif header is not None:
+                if not numeric_ids:
+                    add_edge(*header)  # Sommets nommés : c'était une arête
+                header = None
+            add_edge(line_number, fields)
+            if len(chunk_src) >= CHUNK_LINES:
+                flush()
+        if header is not None:
+            add_edge(*header)  # Seule ligne du fichier
+        flush()
+
+    if not labels:
+        raise ValueError("fichier vide!")
+    x, y = GraphData.default_positions(len(labels))
+    return GraphData.from_edges(labels, x, y, np.concatenate(sources), np.concatenate(targets),
+                                np.concatenate(weights), np.concatenate(flags))
@@ -0,0 +1,32 @@
+import os
+from typing import Callable, List, Tuple
+from core.formats.graphml import write_graphml
+from core.formats.dot import write_dot
+
+# (name, file patterns, writer(file_path, data)). Native .npz projects are
+# saved by core.formats.project.save_project, which also takes the cache.
+EXPORTERS: List[Tuple[str, Tuple[str, ...], Callable]] = [
+    ("GraphML", ("*.graphml",), write_graphml),
+    ("Graphviz DOT", ("*.dot", "*.gv"), write_dot),
+]
+
+
+def export_filters() -> List[str]:
+    """QFileDialog name filters, one per exporter."""
+    return [f"{name} ({' '.join(patterns)})" for name, patterns, _ in EXPORTERS]
+
+
+def exporter_for(file_path: str, name_filter: str = ""):
+    """
+    (writer, file_path) for a file chosen in a save dialog: the writer of
+    the filter, or of the extension; the first pattern of the filter is
+    appended when the path has no known extension. None if no exporter.
+    """
+    extension = os.path.splitext(file_path.lower())[1]
+    for name, patterns, writer in EXPORTERS:
+        if "*" + extension in patterns:
+            return writer, file_path
+    for name, patterns, writer in EXPORTERS:
+        if name_filter.startswith(name + " ("):
+            return writer, file_path + patterns[0][1:]
+    return None
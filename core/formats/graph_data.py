@@ -0,0 +1,132 @@
+import numpy as np
+from typing import List, Optional
+
+
+class GraphData:
+    """
+    Plain-array description of a graph, produced by the importers off the
+    GUI thread and turned into vertices and edges by the canvas afterwards.
+
+    Attributes:
+        labels: Vertex labels
+        x, y: Vertex positions (float arrays, one entry per vertex)
+        src, dst: Edge end points as vertex indices (int arrays)
+        weight: Edge weights (float array)
+        directed: Per-edge directedness (bool array)
+        distance: Cached distance matrix, or None (projects only)
+    """
+
+    def __init__(self, labels: List[str], x, y, src, dst, weight, directed):
+        self.labels = list(labels)
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        self.src = np.asarray(src, dtype=np.int64)
+        self.dst = np.asarray(dst, dtype=np.int64)
+        self.weight = np.asarray(weight, dtype=np.float64)
+        self.directed = np.asarray(directed, dtype=bool)
+        self.distance = None
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.labels)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.src)
+
+    @classmethod
+    def from_matrices(cls, matrices) -> 'GraphData':
+        """Snapshot of a GraphMatrices whose vertices have x, y and label."""
+        vertices = matrices.vertices
+        index = matrices.vertex_indices
+        edges = matrices.edges
+        return cls([vertex.label for vertex in vertices],
+                   np.fromiter((vertex.x for vertex in vertices), dtype=np.float64, count=len(vertices)),
+                   np.fromiter((vertex.y for vertex in vertices), dtype=np.float64, count=len(vertices)),
+                   np.fromiter((index[s] for s, _, _, _ in edges), dtype=np.int64, count=len(edges)),
+                   np.fromiter((index[t] for _, t, _, _ in edges), dtype=np.int64, count=len(edges)),
+                   np.fromiter((float(w) for _, _, w, _ in edges), dtype=np.float64, count=len(edges)),
+                   np.fromiter((bool(d) for _, _, _, d in edges), dtype=bool, count=len(edges)))
+
+    @classmethod
+    def from_edges(cls, labels: List[str], x, y, src, dst, weight, directed) -> 'GraphData':
+        """
+        Graph of an explicit edge list, as given by edge-list, GraphML or
+        DOT files: self-loops are dropped, and so are repeated edges (an
+        undirected u-v repeats v-u); the first occurrence is kept.
+        """
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        weight = np.asarray(weight, dtype=np.float64)
+        directed = np.asarray(directed, dtype=bool)
+        keep = src != dst
+        src, dst, weight, directed = src[keep], dst[keep], weight[keep], directed[keep]
+        n = len(labels)
+        low, high = np.minimum(src, dst), np.maximum(src, dst)
+        keys = np.where(directed, src * n + dst, low * n + high)
+        # Undirected keys are shifted so they never collide with directed ones
+        keys = np.where(directed, keys, keys + n * n)
+        _, first = np.unique(keys, return_index=True)
+        first.sort()
+        return cls(labels, x, y, src[first], dst[first], weight[first], directed[first])
+
+    @staticmethod
+    def default_positions(n: int):
+        """Positions used for imported graphs: a row, staggered on three lines."""
+        indices = np.arange(n)
+        return indices * 100.0 + 50, 100.0 + (indices % 3) * 100
+
+    @classmethod
+    def from_adjacency(cls, matrix: np.ndarray, labels: Optional[List[str]] = None) -> 'GraphData':
+        """
+        Build the graph of an adjacency matrix.
+
+        Entries > 0 and finite are edges (no self-loops). A pair with
+        matrix[i, j] != matrix[j, i] gives a directed edge. A symmetric
+        pair gives a single undirected edge (i < j).
+        """
+        n = len(matrix)
+        if labels is None:
+            labels = [str(i + 1) for i in range(n)]
+        edges = (matrix > 0) & np.isfinite(matrix)
+        np.fill_diagonal(edges, False)
+        src, dst = np.nonzero(edges)
+        weight = matrix[src, dst]
+        # matrix != matrix.T, evaluated on the edges only
+        directed = weight != matrix[dst, src]
+        keep = directed | (src < dst)
+        x, y = cls.default_positions(n)
+        return cls(labels, x, y, src[keep], dst[keep], weight[keep], directed[keep])
+
+    @classmethod
+    def from_coordinates(cls, n: int, rows, cols, values,
+                         labels: Optional[List[str]] = None) -> 'GraphData':
+        """
+        Same rules as from_adjacency() for a matrix given by its non-zero
+        entries (row, column, value), without ever building it densely.
+        Repeated entries keep their first value.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        values = np.asarray(values, dtype=np.float64)
+        if labels is None:
+            labels = [str(i + 1) for i in range(n)]
+
+        keep = (values > 0) & np.isfinite(values) & (rows != cols)
+        rows, cols, values = rows[keep], cols[keep], values[keep]
+
+        # Sorted unique keys: row-major order, like np.nonzero on the matrix
+        keys, first = np.unique(rows * n + cols, return_index=True)
+        rows, cols, values = rows[first], cols[first], values[first]
+
+        # Look up the mirrored entry (j, i) of every (i, j)
+        mirrored = cols * n + rows
+        position = np.minimum(np.searchsorted(keys, mirrored), max(len(keys) - 1, 0))
+        symmetric = np.zeros(len(keys), dtype=bool)
+        if len(keys):
+            symmetric = (keys[position] == mirrored) & (values[position] == values)
+        directed = ~symmetric
+        keep = directed | (rows < cols)
+
+        x, y = cls.default_positions(n)
+        return cls(labels, x, y, rows[keep], cols[keep], values[keep], directed[keep])
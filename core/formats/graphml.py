@@ -0,0 +1,150 @@
+import numpy as np
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
+from typing import Callable, Dict, List, Optional
+from core.formats.graph_data import GraphData
+from core.formats.text_io import open_binary
+
+# Attribute names (attr.name of the <key> elements) understood on import
+X_NAMES = ('x',)
+Y_NAMES = ('y',)
+LABEL_NAMES = ('label', 'name')
+WEIGHT_NAMES = ('weight',)
+
+
+_LOCAL_NAMES: Dict[str, str] = {}
+
+
+def _local(tag: str) -> str:
+    """Tag name without its {namespace} (memoized: few distinct tags)."""
+    name = _LOCAL_NAMES.get(tag)
+    if name is None:
+        name = _LOCAL_NAMES[tag] = tag.rsplit('}', 1)[-1]
+    return name
+
+
+def parse_graphml(file_path: str,
+                  progress: Optional[Callable[[int], None]] = None) -> GraphData:
+    """
+    Read a GraphML file with iterparse, clearing every node and edge once
+    consumed, so memory holds the arrays being built and not the XML tree.
+
+    Node positions come from "x"/"y" data keys or from yEd <y:Geometry>
+    elements, labels from "label"/"name" keys (the node id otherwise),
+    weights from a "weight" key. Gzip files are read transparently.
+
+    Raises:
+        ValueError: Malformed XML or edge without end points
+    """
+    keys: Dict[str, str] = {}  # id de <key> -> nom d'attribut
+    indices: Dict[str, int] = {}
+    labels: List[str] = []
+    xs: List[float] = []
+    ys: List[float] = []
+    src: List[int] = []
+    dst: List[int] = []
+    weights: List[float] = []
+    flags: List[bool] = []
+    edge_default_directed = False
+    graph = None
+
+    def node_index(node_id):
+        index = indices.get(node_id)
+        if index is None:
+            index = indices[node_id] = len(labels)
+            labels.append(node_id)
+            xs.append(np.nan)
+            ys.append(np.nan)
+        return index
+
+    def data_values(elem):
+        values = {}
+        for child in elem:
+            if _local(child.tag) == 'data':
+                name = keys.get(child.get('key'), child.get('key'))
+                values[name] = (child.text or '').strip()
+        return values
+
+    file, disk_file = open_binary(file_path)
+    count = 0
+    try:
+        with file, disk_file:
+            for event, elem in ET.iterparse(file, events=('start', 'end')):
+                if event == 'start':
+                    if graph is None and _local(elem.tag) == 'graph':
+                        graph = elem
+                        edge_default_directed = elem.get('edgedefault', 'directed') == 'directed'
+                    continue
+                tag = _local(elem.tag)
+                if tag == 'key':
+                    keys[elem.get('id')] = elem.get('attr.name', elem.get('id'))
+                elif tag == 'node':
+                    index = node_index(elem.get('id'))
+                    values = data_values(elem)
+                    for name in LABEL_NAMES:
+                        if values.get(name):
+                            labels[index] = values[name]
+                            break
+                    geometry = next((child for child in elem.iter() if _local(child.tag) == 'Geometry'), None)
+                    if geometry is not None:
+                        xs[index] = float(geometry.get('x', 'nan'))
+                        ys[index] = float(geometry.get('y', 'nan'))
+                    for name in X_NAMES:
+                        if values.get(name):
+                            xs[index] = float(values[name])
+                    for name in Y_NAMES:
+                        if values.get(name):
+                            ys[index] = float(values[name])
+                elif tag == 'edge':
+                    source, target = elem.get('source'), elem.get('target')
+                    if source is None or target is None:
+                        raise ValueError("arête sans source ou cible")
+                    values = data_values(elem)
+                    weight = 1.0
+                    for name in WEIGHT_NAMES:
+                        if values.get(name):
+                            weight = float(values[name])
+                    directed = elem.get('directed')
+                    src.append(node_index(source))
+                    dst.append(node_index(target))
+                    weights.append(weight)
+                    flags.append(edge_default_directed if directed is None else directed == 'true')
+                else:
+                    continue
+                # Consumed: drop the element and its children from the tree
+                elem.clear()
+                if graph is not None:
+                    graph.clear()
+                count += 1
+                if progress is not None and count % 10000 == 0:
+                    progress(disk_file.tell())
+    except ET.ParseError as e:
+        raise ValueError(f"GraphML invalide : {e}")
+
+    if not labels:
+        raise ValueError("aucun sommet dans le fichier")
+    x, y = np.array(xs), np.array(ys)
+    missing = np.isnan(x) | np.isnan(y)
+    if missing.any():
+        default_x, default_y = GraphData.default_positions(len(labels))
+        x[missing], y[missing] = default_x[missing], default_y[missing]
+    return GraphData.from_edges(labels, x, y, src, dst, weights, flags)
+
+
+def write_graphml(file_path: str, data: GraphData):
+    """Write a graph as GraphML, edge by edge, straight from the arrays."""
+    with open(file_path, 'w', encoding='utf-8') as file:
+        file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        file.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n')
+        file.write('  <key id="label" for="node" attr.name="label" attr.type="string"/>\n')
+        file.write('  <key id="x" for="node" attr.name="x" attr.type="double"/>\n')
+        file.write('  <key id="y" for="node" attr.name="y" attr.type="double"/>\n')
+        file.write('  <key id="weight" for="edge" attr.name="weight" attr.type="double"/>\n')
+        file.write('  <graph id="G" edgedefault="undirected">\n')
+        for i, (label, x, y) in enumerate(zip(data.labels, data.x.tolist(), data.y.tolist())):
+            file.write(f'    <node id="n{i}"><data key="label">{escape(label)}</data>'
+                       f'<data key="x">{x!r}</data><data key="y">{y!r}</data></node>\n')
+        for s, t, w, d in zip(data.src.tolist(), data.dst.tolist(), data.weight.tolist(), data.directed.tolist()):
+            directed = ' directed="true"' if d else ''
+            file.write(f'    <edge source="n{s}" target="n{t}"{directed}><data key="weight">{w!r}</data></edge>\n')
+        file.write('  </graph>\n</graphml>\n')
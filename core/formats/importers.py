@@ -0,0 +1,49 @@
+import os
+from typing import Callable, List, Optional, Tuple
+from core.formats.graph_data import GraphData
+from core.formats.adjacency_text import load_adjacency_file
+from core.formats.edge_list import parse_edge_list
+from core.formats.matrix_market import parse_matrix_market
+from core.formats.numpy_matrix import load_npy_adjacency
+from core.formats.graphml import parse_graphml
+from core.formats.dot import parse_dot
+
+# (name, file patterns, loader(file_path, progress=callback) -> GraphData).
+# The text formats also read their gzip-compressed ".gz" variant.
+IMPORTERS: List[Tuple[str, Tuple[str, ...], Callable]] = [
+    ("Matrice d'adjacence", ("*.txt", "*.txt.gz"), load_adjacency_file),
+    ("Liste d'arêtes", ("*.csv", "*.tsv", "*.edges", "*.el", "*.txt",
+                        "*.csv.gz", "*.tsv.gz", "*.edges.gz", "*.el.gz", "*.txt.gz"), parse_edge_list),
+    ("Matrix Market", ("*.mtx", "*.mtx.gz"), parse_matrix_market),
+    ("Matrice NumPy", ("*.npy",), load_npy_adjacency),
+    ("GraphML", ("*.graphml", "*.graphml.gz"), parse_graphml),
+    ("Graphviz DOT", ("*.dot", "*.gv", "*.dot.gz", "*.gv.gz"), parse_dot),
+]
+
+
+def file_filters() -> List[str]:
+    """QFileDialog name filters, one per importer."""
+    return [f"{name} ({' '.join(patterns)})" for name, patterns, _ in IMPORTERS]
+
+
+def importer_for(file_path: str, name_filter: str = "") -> Callable:
+    """
+    Loader for a file: the one of the chosen dialog filter if any,
+    otherwise guessed from the extension (adjacency matrix by default).
+    """
+    for name, _, loader in IMPORTERS:
+        if name_filter.startswith(name + " ("):
+            return loader
+    base = file_path.lower()
+    if base.endswith(".gz"):
+        base = base[:-3]
+    extension = os.path.splitext(base)[1]
+    for _, patterns, loader in IMPORTERS:
+        if extension != ".txt" and "*" + extension in patterns:
+            return loader
+    return load_adjacency_file
+
+
+def load_graph(file_path: str, progress: Optional[Callable[[int], None]] = None) -> GraphData:
+    """Headless import: read any supported file into a GraphData (no Qt needed)."""
+    return importer_for(file_path)(file_path, progress=progress)
@@ -0,0 +1,372 @@
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+import numpy as np
+from typing import Callable, Iterator, List, Optional, Tuple
+from core.formats.graph_data import GraphData
+from core.formats.project import save_project, load_project
+
+# Each segment file starts with this magic
+SEGMENT_MAGIC = b'GVJ1'
+# Record header: opcode, payload length, CRC32 of the payload
+RECORD_HEADER = struct.Struct('<BII')
+
+# Opcodes
+ADD_VERTEX = 1        # x, y, label (utf-8)
+REMOVE_VERTEX = 2     # index (its edges go with it)
+ADD_EDGE = 3          # source, target, weight, directed
+REMOVE_EDGES = 4      # edge indices, int64
+MOVE_VERTICES = 5     # count, indices, x, y
+SET_WEIGHT = 6        # edge index, weight
+ADD_VERTEX_BLOCK = 7  # count, x, y, label lengths, labels
+ADD_EDGE_BLOCK = 8    # count, src, dst, weight, directed
+RESET = 9
+
+_VERTEX = struct.Struct('<dd')
+_INDEX = struct.Struct('<q')
+_EDGE = struct.Struct('<qqd?')
+_WEIGHT = struct.Struct('<qd')
+
+SEGMENT_NAME = re.compile(r'journal-(\d+)\.log$')
+SNAPSHOT_NAME = re.compile(r'snapshot-(\d+)\.npz$')
+
+
+def _segment_path(directory: str, number: int) -> str:
+    return os.path.join(directory, f"journal-{number:08d}.log")
+
+
+def _snapshot_path(directory: str, number: int) -> str:
+    return os.path.join(directory, f"snapshot-{number:08d}.npz")
+
+
+def _numbered(directory: str, pattern) -> List[Tuple[int, str]]:
+    """(number, path) of the files of the directory matching pattern, sorted."""
+    if not os.path.isdir(directory):
+        return []
+    files = []
+    for name in os.listdir(directory):
+        match = pattern.match(name)
+        if match:
+            files.append((int(match.group(1)), os.path.join(directory, name)))
+    return sorted(files)
+
+
+def encode_record(opcode: int, payload: bytes = b'') -> bytes:
+    return RECORD_HEADER.pack(opcode, len(payload), zlib.crc32(payload)) + payload
+
+
+def read_segment(file_path: str) -> Iterator[Tuple[int, bytes]]:
+    """
+    (opcode, payload) of the records of a segment. Reading stops at the
+    first truncated or corrupted record: the tail a crash may leave
+    behind is dropped, everything before it is kept.
+    """
+    with open(file_path, 'rb') as file:
+        if file.read(len(SEGMENT_MAGIC)) != SEGMENT_MAGIC:
+            return
+        while True:
+            header = file.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                return
+            opcode, length, crc = RECORD_HEADER.unpack(header)
+            payload = file.read(length)
+            if len(payload) < length or zlib.crc32(payload) != crc:
+                return
+            yield opcode, payload
+
+
+class GraphState:
+    """
+    Plain-list graph the journal records are replayed on, with the same
+    semantics as GraphMatrices: vertices and edges are numbered in
+    insertion order, removing a vertex removes its edges.
+    """
+
+    def __init__(self, data: Optional[GraphData] = None):
+        if data is None:
+            self.reset()
+            return
+        self.labels = list(data.labels)
+        self.x = data.x.tolist()
+        self.y = data.y.tolist()
+        self.src = data.src.tolist()
+        self.dst = data.dst.tolist()
+        self.weight = data.weight.tolist()
+        self.directed = data.directed.tolist()
+
+    def reset(self):
+        self.labels, self.x, self.y = [], [], []
+        self.src, self.dst, self.weight, self.directed = [], [], [], []
+
+    def _keep_edges(self, keep):
+        self.src = [v for v, k in zip(self.src, keep) if k]
+        self.dst = [v for v, k in zip(self.dst, keep) if k]
+        self.weight = [v for v, k in zip(self.weight, keep) if k]
+        self.directed = [v for v, k in zip(self.directed, keep) if k]
+
+    def apply(self, opcode: int, payload: bytes):
+        if opcode == ADD_VERTEX:
+            x, y = _VERTEX.unpack_from(payload)
+            self.labels.append(payload[_VERTEX.size:].decode('utf-8'))
+            self.x.append(x)
+            self.y.append(y)
+        elif opcode == REMOVE_VERTEX:
+            index, = _INDEX.unpack(payload)
+            del self.labels[index], self.x[index], self.y[index]
+            self._keep_edges([s != index and t != index for s, t in zip(self.src, self.dst)])
+            self.src = [s - (s > index) for s in self.src]
+            self.dst = [t - (t > index) for t in self.dst]
+        elif opcode == ADD_EDGE:
+            s, t, w, d = _EDGE.unpack(payload)
+            self.src.append(s)
+            self.dst.append(t)
+            self.weight.append(w)
+            self.directed.append(d)
+        elif opcode == REMOVE_EDGES:
+            removed = set(np.frombuffer(payload, dtype='<i8').tolist())
+            self._keep_edges([i not in removed for i in range(len(self.src))])
+        elif opcode == MOVE_VERTICES:
+            count, = _INDEX.unpack_from(payload)
+            arrays = np.frombuffer(payload, dtype='<f8', offset=_INDEX.size, count=2 * count)
+            indices = np.frombuffer(payload, dtype='<i8', offset=_INDEX.size + 16 * count, count=count)
+            for i, x, y in zip(indices.tolist(), arrays[:count].tolist(), arrays[count:].tolist()):
+                self.x[i] = x
+                self.y[i] = y
+        elif opcode == SET_WEIGHT:
+            index, weight = _WEIGHT.unpack(payload)
+            self.weight[index] = weight
+        elif opcode == ADD_VERTEX_BLOCK:
+            count, = _INDEX.unpack_from(payload)
+            offset = _INDEX.size
+            x = np.frombuffer(payload, dtype='<f8', offset=offset, count=count)
+            y = np.frombuffer(payload, dtype='<f8', offset=offset + 8 * count, count=count)
+            lengths = np.frombuffer(payload, dtype='<u4', offset=offset + 16 * count, count=count)
+            text = payload[offset + 20 * count:]
+            ends = np.cumsum(lengths).tolist()
+            starts = [0] + ends[:-1]
+            self.labels.extend(text[a:b].decode('utf-8') for a, b in zip(starts, ends))
+            self.x.extend(x.tolist())
+            self.y.extend(y.tolist())
+        elif opcode == ADD_EDGE_BLOCK:
+            count, = _INDEX.unpack_from(payload)
+            offset = _INDEX.size
+            self.src.extend(np.frombuffer(payload, dtype='<i8', offset=offset, count=count).tolist())
+            self.dst.extend(np.frombuffer(payload, dtype='<i8', offset=offset + 8 * count, count=count).tolist())
+            self.weight.extend(np.frombuffer(payload, dtype='<f8', offset=offset + 16 * count, count=count).tolist())
+            self.directed.extend(np.frombuffer(payload, dtype=bool, offset=offset + 24 * count, count=count).tolist())
+        elif opcode == RESET:
+            self.reset()
+        else:
+            raise ValueError(f"enregistrement de journal inconnu : {opcode}")
+
+    def to_graph_data(self) -> GraphData:
+        return GraphData(self.labels, self.x, self.y, self.src, self.dst, self.weight, self.directed)
+
+
+def _replay(directory: str, upto: Optional[int] = None) -> Tuple[GraphState, int]:
+    """
+    State of the latest snapshot replayed with the segments written after
+    it (up to segment number upto), and the number of the last segment.
+    """
+    snapshots = [(n, path) for n, path in _numbered(directory, SNAPSHOT_NAME) if upto is None or n <= upto]
+    state, last = GraphState(), 0
+    if snapshots:
+        last, path = snapshots[-1]
+        state = GraphState(load_project(path))
+    for number, path in _numbered(directory, SEGMENT_NAME):
+        if number <= last or (upto is not None and number > upto):
+            continue
+        for opcode, payload in read_segment(path):
+            state.apply(opcode, payload)
+        last = number
+    return state, last
+
+
+def has_recovery_data(directory: str) -> bool:
+    """Whether a previous session left a snapshot or journal records behind."""
+    if _numbered(directory, SNAPSHOT_NAME):
+        return True
+    return any(next(read_segment(path), None) is not None
+               for _, path in _numbered(directory, SEGMENT_NAME))
+
+
+def recover_journal(directory: str, progress: Optional[Callable[[int], None]] = None) -> GraphData:
+    """
+    Graph of the last session: latest snapshot plus the journal tail.
+    Has the loader signature, so it runs in a MatrixImportWorker.
+
+    Raises:
+        ValueError: Nothing to recover, or an unreadable snapshot
+    """
+    if not has_recovery_data(directory):
+        raise ValueError("aucune session à récupérer")
+    return _replay(directory)[0].to_graph_data()
+
+
+def clear_journal(directory: str):
+    """Delete the snapshots and segments of a journal directory."""
+    for pattern in (SEGMENT_NAME, SNAPSHOT_NAME):
+        for _, path in _numbered(directory, pattern):
+            os.remove(path)
+
+
+def compact_journal(directory: str, upto: int):
+    """
+    Fold the snapshot and the closed segments up to number upto into
+    snapshot-<upto>.npz, then delete them. The snapshot is written to a
+    temporary file, synced and renamed, so a crash leaves either the old
+    files or the new snapshot.
+    """
+    state, _ = _replay(directory, upto)
+    path = _snapshot_path(directory, upto)
+    temporary = path + '.tmp'
+    save_project(temporary, state.to_graph_data())
+    with open(temporary, 'rb+') as file:
+        os.fsync(file.fileno())
+    os.replace(temporary, path)
+    for pattern in (SEGMENT_NAME, SNAPSHOT_NAME):
+        for number, old in _numbered(directory, pattern):
+            if number < upto or (number == upto and old != path):
+                os.remove(old)
+
+
+class JournalWriter:
+    """
+    Append-only journal of the graph mutations. The record methods only
+    encode into a memory buffer; a background thread writes the buffer
+    every flush_interval seconds, fsyncs every fsync_interval seconds and,
+    once compact_bytes have been written, starts a new segment and folds
+    the previous ones into a snapshot. No file work happens on the
+    calling (GUI) thread except in close().
+
+    Files of the journal directory: journal-N.log segments and
+    snapshot-N.npz (the graph after segment N).
+    """
+
+    def __init__(self, directory: str, flush_interval: float = 0.5,
+                 fsync_interval: float = 2.0, compact_bytes: int = 8 * 1024 * 1024):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+        self.compact_bytes = compact_bytes
+
+        numbers = [n for n, _ in _numbered(directory, SEGMENT_NAME) + _numbered(directory, SNAPSHOT_NAME)]
+        self.segment = max(numbers, default=0) + 1
+        self.file = open(_segment_path(directory, self.segment), 'ab')
+        self.file.write(SEGMENT_MAGIC)
+        self.segment_bytes = 0
+
+        self.lock = threading.Lock()
+        self.buffer = bytearray()
+        self.stop_event = threading.Event()
+        self.compactor = None
+        self.thread = threading.Thread(target=self._run, name="journal-writer", daemon=True)
+        self.thread.start()
+
+    # Records (called from the GUI thread)
+
+    def _append(self, opcode: int, payload: bytes = b''):
+        with self.lock:
+            self.buffer += encode_record(opcode, payload)
+
+    def add_vertex(self, label: str, x: float, y: float):
+        self._append(ADD_VERTEX, _VERTEX.pack(x, y) + label.encode('utf-8'))
+
+    def remove_vertex(self, index: int):
+        self._append(REMOVE_VERTEX, _INDEX.pack(index))
+
+    def add_edge(self, source: int, target: int, weight: float, directed: bool):
+        self._append(ADD_EDGE, _EDGE.pack(source, target, weight, directed))
+
+    def remove_edges(self, indices):
+        self._append(REMOVE_EDGES, np.asarray(indices, dtype='<i8').tobytes())
+
+    def move_vertices(self, indices, x, y):
+        self._append(MOVE_VERTICES, _INDEX.pack(len(indices))
+                     + np.asarray(x, dtype='<f8').tobytes() + np.asarray(y, dtype='<f8').tobytes()
+                     + np.asarray(indices, dtype='<i8').tobytes())
+
+    def set_weight(self, index: int, weight: float):
+        self._append(SET_WEIGHT, _WEIGHT.pack(index, weight))
+
+    def add_vertex_block(self, labels: List[str], x, y):
+        encoded = [label.encode('utf-8') for label in labels]
+        self._append(ADD_VERTEX_BLOCK, _INDEX.pack(len(labels))
+                     + np.asarray(x, dtype='<f8').tobytes() + np.asarray(y, dtype='<f8').tobytes()
+                     + np.fromiter(map(len, encoded), dtype='<u4', count=len(encoded)).tobytes()
+                     + b''.join(encoded))
+
+    def add_edge_block(self, src, dst, weight, directed):
+        self._append(ADD_EDGE_BLOCK, _INDEX.pack(len(src))
+                     + np.asarray(src, dtype='<i8').tobytes() + np.asarray(dst, dtype='<i8').tobytes()
+                     + np.asarray(weight, dtype='<f8').tobytes() + np.asarray(directed, dtype=bool).tobytes())
+
+    def reset(self):
+        self._append(RESET)
+
+    # Background thread
+
+    def _write_buffer(self):
+        with self.lock:
+            data, self.buffer = self.buffer, bytearray()
+        if data:
+            self.file.write(data)
+            self.file.flush()
+            self.segment_bytes += len(data)
+
+    def _sync(self):
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def _rotate(self):
+        """Close the current segment and fold it into a snapshot in another thread."""
+        self._sync()
+        self.file.close()
+        closed = self.segment
+        self.segment += 1
+        self.file = open(_segment_path(self.directory, self.segment), 'ab')
+        self.file.write(SEGMENT_MAGIC)
+        self.segment_bytes = 0
+        self.compactor = threading.Thread(target=self._compact, args=(closed,),
+                                          name="journal-compactor", daemon=True)
+        self.compactor.start()
+
+    def _compact(self, upto: int):
+        try:
+            compact_journal(self.directory, upto)
+        except Exception as e:
+            # The segments are kept: recovery still works without the snapshot
+            print(f"[Journal] Compaction impossible : {e}")
+
+    def _run(self):
+        last_sync = time.monotonic()
+        while not self.stop_event.wait(self.flush_interval):
+            try:
+                self._write_buffer()
+                if time.monotonic() - last_sync >= self.fsync_interval:
+                    self._sync()
+                    last_sync = time.monotonic()
+                if self.segment_bytes >= self.compact_bytes and (
+                        self.compactor is None or not self.compactor.is_alive()):
+                    self._rotate()
+            except OSError as e:
+                print(f"[Journal] Écriture impossible : {e}")
+
+    def close(self, discard: bool = False):
+        """
+        Stop the writer after a last write and fsync. discard=True (clean
+        shutdown) deletes the journal: there is nothing left to recover.
+        """
+        self.stop_event.set()
+        self.thread.join()
+        if self.compactor is not None:
+            self.compactor.join()
+        self._write_buffer()
+        self._sync()
+        self.file.close()
+        if discard:
+            clear_journal(self.directory)
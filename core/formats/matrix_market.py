@@ -0,0 +1,113 @@
+import numpy as np
+from typing import Callable, List, Optional
+from core.formats.graph_data import GraphData
+from core.formats.text_io import open_text
+
+# Entry lines converted by NumPy in one call
+CHUNK_LINES = 500000
+
+
+def _parse_entries(lines: List[str], first_line: int, columns: int) -> np.ndarray:
+    try:
+        block = np.loadtxt(lines, dtype=np.float64, comments='%', ndmin=2)
+    except ValueError:
+        block = None
+    if block is None or block.shape[1] < columns:
+        for offset, line in enumerate(lines):
+            if len(line.split()) < columns:
+                raise ValueError(f"ligne {first_line + offset} : entrée incomplète")
+        raise ValueError(f"entrée invalide vers la ligne {first_line}")
+    return block
+
+
+def parse_matrix_market(file_path: str,
+                        progress: Optional[Callable[[int], None]] = None) -> GraphData:
+    """
+    Read a Matrix Market coordinate file (.mtx, optionally .gz) as a graph.
+
+    Entries are streamed and converted in blocks; the matrix is never built
+    densely. The adjacency import rules apply (see
+    GraphData.from_coordinates): "symmetric" files give undirected edges,
+    "general" ones give directed edges except for mirrored equal pairs.
+
+    Args:
+        file_path: Path of the file
+        progress: Optional callback called with the number of bytes read
+            from disk
+
+    Raises:
+        ValueError: Unsupported header, non-square matrix or bad entry
+    """
+    file, disk_file = open_text(file_path)
+    with file, disk_file:
+        header = file.readline().split()
+        if len(header) < 5 or header[0].lower() != '%%matrixmarket':
+            raise ValueError("en-tête %%MatrixMarket manquant")
+        obj, layout, field, symmetry = (token.lower() for token in header[1:5])
+        if obj != 'matrix' or layout != 'coordinate':
+            raise ValueError(f"format {obj} {layout} non supporté (coordinate attendu)")
+        if field not in ('real', 'integer', 'pattern'):
+            raise ValueError(f"type {field} non supporté")
+        if symmetry not in ('general', 'symmetric', 'skew-symmetric'):
+            raise ValueError(f"symétrie {symmetry} non supportée")
+
+        # Skip comments up to the size line
+        line_number = 1
+        for line in file:
+            line_number += 1
+            if line.strip() and not line.startswith('%'):
+                break
+        else:
+            raise ValueError("ligne de dimensions manquante")
+        try:
+            n_rows, n_cols, nnz = (int(value) for value in line.split()[:3])
+        except ValueError:
+            raise ValueError(f"ligne {line_number} : dimensions invalides") from None
+        if n_rows != n_cols:
+            raise ValueError(f"Matrix n'est pas un carree : {n_rows} x {n_cols}")
+
+        columns = 2 if field == 'pattern' else 3
+        rows = np.empty(nnz, dtype=np.int64)
+        cols = np.empty(nnz, dtype=np.int64)
+        values = np.ones(nnz, dtype=np.float64)
+        count = 0
+        lines = []
+        chunk_start = line_number + 1
+
+        def flush():
+            nonlocal count, lines, chunk_start
+            block = _parse_entries(lines, chunk_start, columns)
+            end = count + len(block)
+            if end > nnz:
+                raise ValueError(f"plus de {nnz} entrées")
+            rows[count:end] = block[:, 0]
+            cols[count:end] = block[:, 1]
+            if columns == 3:
+                values[count:end] = block[:, 2]
+            count = end
+            chunk_start += len(lines)
+            lines = []
+            if progress is not None:
+                progress(disk_file.tell())
+
+        for line in file:
+            lines.append(line)
+            if len(lines) >= CHUNK_LINES:
+                flush()
+        if lines:
+            flush()
+
+    if count != nnz:
+        raise ValueError(f"{count} entrées lues, {nnz} annoncées")
+    rows -= 1  # Indices 1..n dans le fichier
+    cols -= 1
+    if nnz and (rows.min() < 0 or cols.min() < 0 or rows.max() >= n_rows or cols.max() >= n_cols):
+        raise ValueError("indice hors de la matrice")
+
+    if symmetry != 'general':
+        # Only one triangle is stored: add the mirrored entries
+        sign = -1.0 if symmetry == 'skew-symmetric' else 1.0
+        off = rows != cols
+        rows, cols = np.concatenate([rows, cols[off]]), np.concatenate([cols, rows[off]])
+        values = np.concatenate([values, sign * values[off]])
+    return GraphData.from_coordinates(n_rows, rows, cols, values)
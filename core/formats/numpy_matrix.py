@@ -0,0 +1,65 @@
+import numpy as np
+from typing import Callable, Optional
+from core.formats.graph_data import GraphData
+
+# Rows scanned at once are sized to about this many bytes
+BLOCK_BYTES = 64 * 1024 * 1024
+
+
+def load_npy_adjacency(file_path: str,
+                       progress: Optional[Callable[[int], None]] = None) -> GraphData:
+    """
+    Graph of an adjacency matrix stored as a .npy file.
+
+    The file is memory-mapped and scanned by blocks of rows, so peak
+    memory is one block plus the edge arrays, whatever the matrix size.
+    The rules are those of GraphData.from_adjacency(); the mirrored value
+    matrix[j, i] of each entry is read directly from the mapped file.
+
+    Args:
+        file_path: Path of the .npy file (2D, square, numeric)
+        progress: Optional callback called with the number of bytes scanned
+
+    Raises:
+        ValueError: Not a square numeric 2D array
+    """
+    with open(file_path, 'rb') as file:
+        if file.read(6) != b'\x93NUMPY':
+            raise ValueError("ce n'est pas un fichier .npy (les .npy compressés ne sont pas pris en charge)")
+    try:
+        matrix = np.load(file_path, mmap_mode='r', allow_pickle=False)
+    except ValueError as e:
+        raise ValueError(f"fichier .npy illisible : {e}")
+    if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+        raise ValueError(f"Matrix n'est pas un carree : forme {matrix.shape}")
+    if not (np.issubdtype(matrix.dtype, np.number) or matrix.dtype == bool):
+        raise ValueError(f"type {matrix.dtype} non numérique")
+
+    n = matrix.shape[0]
+    row_bytes = max(1, n * matrix.dtype.itemsize)
+    # Blocks are converted to float64, size them on that
+    block_rows = max(1, BLOCK_BYTES // max(1, n * 8))
+    sources, targets, weights, flags = [], [], [], []
+    for start in range(0, n, block_rows):
+        block = np.asarray(matrix[start:start + block_rows], dtype=np.float64)
+        rows, cols = np.nonzero((block > 0) & np.isfinite(block))
+        weight = block[rows, cols]
+        del block
+        rows += start
+        # Directedness: compare with the mirrored entries, read from the map
+        mirrored = np.asarray(matrix[cols, rows], dtype=np.float64)
+        directed = weight != mirrored
+        keep = (rows != cols) & (directed | (rows < cols))
+        sources.append(rows[keep])
+        targets.append(cols[keep])
+        weights.append(weight[keep])
+        flags.append(directed[keep])
+        if progress is not None:
+            progress(min(n, start + block_rows) * row_bytes)
+
+    labels = [str(i + 1) for i in range(n)]
+    x, y = GraphData.default_positions(n)
+    if not sources:
+        return GraphData(labels, x, y, [], [], [], [])
+    return GraphData(labels, x, y, np.concatenate(sources), np.concatenate(targets),
+                     np.concatenate(weights), np.concatenate(flags))
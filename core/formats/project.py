@@ -0,0 +1,69 @@
+import numpy as np
+from typing import Callable, Optional
+from core.formats.graph_data import GraphData
+
+PROJECT_FORMAT_VERSION = 1
+
+# Above this many vertices the distance matrix is not cached in projects
+DISTANCE_CACHE_LIMIT = 3000
+
+
+def save_project(file_path: str, data: GraphData, distance: Optional[np.ndarray] = None):
+    """
+    Save a graph as a native .npz project: labels, positions, edge arrays
+    and, optionally, the distance matrix so it is not recomputed on load.
+    Arrays only (no pickle), stored uncompressed so loading is a copy.
+    """
+    arrays = {
+        'format_version': np.array(PROJECT_FORMAT_VERSION),
+        'labels': np.array(data.labels, dtype=str),
+        'x': data.x,
+        'y': data.y,
+        'src': data.src,
+        'dst': data.dst,
+        'weight': data.weight,
+        'directed': data.directed,
+    }
+    if distance is not None and np.shape(distance) == (data.vertex_count, data.vertex_count):
+        arrays['distance'] = distance
+    with open(file_path, 'wb') as file:
+        np.savez(file, **arrays)
+
+
+def load_project(file_path: str,
+                 progress: Optional[Callable[[int], None]] = None) -> GraphData:
+    """
+    Load a project saved by save_project(). The cached distance matrix, if
+    any, is returned in GraphData.distance. progress is accepted for
+    symmetry with the importers; loading is a single read.
+
+    Raises:
+        ValueError: Not a project file, newer format or inconsistent arrays
+    """
+    with open(file_path, 'rb') as file:
+        if file.read(2) != b'PK':  # .npz = archive zip
+            raise ValueError("ce n'est pas un projet .npz")
+    try:
+        archive = np.load(file_path, allow_pickle=False)
+    except Exception as e:
+        raise ValueError(f"fichier de projet illisible : {e}")
+    with archive:
+        missing = {'format_version', 'labels', 'x', 'y', 'src', 'dst', 'weight', 'directed'} - set(archive.files)
+        if missing:
+            raise ValueError(f"fichier de projet incomplet : {', '.join(sorted(missing))}")
+        version = int(archive['format_version'])
+        if version > PROJECT_FORMAT_VERSION:
+            raise ValueError(f"version de projet {version} non supportée")
+        data = GraphData(archive['labels'].tolist(), archive['x'], archive['y'],
+                         archive['src'], archive['dst'], archive['weight'], archive['directed'])
+        if 'distance' in archive.files:
+            data.distance = archive['distance']
+
+    n = data.vertex_count
+    if len(data.x) != n or len(data.y) != n:
+        raise ValueError("positions incohérentes avec le nombre de sommets")
+    if not (len(data.dst) == len(data.weight) == len(data.directed) == data.edge_count):
+        raise ValueError("tableaux d'arêtes de tailles différentes")
+    if data.edge_count and (min(data.src.min(), data.dst.min()) < 0 or max(data.src.max(), data.dst.max()) >= n):
+        raise ValueError("arête vers un sommet inexistant")
+    return data
@@ -0,0 +1,113 @@
+import json
+import math
+import os
+import numpy as np
+from typing import Iterable, List, Sequence, Tuple
+
+# (name, file patterns, format key) of the table exports
+TABLE_FORMATS: List[Tuple[str, Tuple[str, ...], str]] = [
+    ("CSV", ("*.csv",), "csv"),
+    ("TSV", ("*.tsv", "*.tab"), "tsv"),
+    ("JSON Lines", ("*.jsonl",), "jsonl"),
+]
+
+SEPARATORS = {"csv": ",", "tsv": "\t"}
+
+
+def table_filters() -> List[str]:
+    """QFileDialog name filters, one per table format."""
+    return [f"{name} ({' '.join(patterns)})" for name, patterns, _ in TABLE_FORMATS]
+
+
+def table_format_for(file_path: str, name_filter: str = "") -> Tuple[str, str]:
+    """
+    (format key, file_path) for a file chosen in a save dialog: the format
+    of the extension, else of the filter (its extension is then appended),
+    else CSV.
+    """
+    extension = os.path.splitext(file_path.lower())[1]
+    for _, patterns, key in TABLE_FORMATS:
+        if "*" + extension in patterns:
+            return key, file_path
+    for name, patterns, key in TABLE_FORMATS:
+        if name_filter.startswith(name + " ("):
+            return key, file_path + patterns[0][1:]
+    return "csv", file_path + ".csv"
+
+
+def _text_cell(text: str, separator: str) -> str:
+    """Quote a text cell when needed (RFC 4180 rules)."""
+    if separator in text or '"' in text or '\n' in text or '\r' in text:
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _cell(value, separator: str) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        return repr(value)  # Aller-retour exact, "inf" pour l'infini
+    return _text_cell(str(value), separator)
+
+
+def _json_value(value):
+    """JSON has no infinity or NaN: they are written as null."""
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def write_matrix(file_path: str, matrix, row_labels: Sequence[str], column_labels: Sequence[str],
+                 fmt: str = "csv", integer: bool = False):
+    """
+    Write a matrix row by row, straight from the array (a np.memmap is
+    read one row at a time too), so no string of the whole matrix is ever
+    built.
+
+    CSV / TSV: a header line with the column labels, then one line per
+    row starting with its label. JSON Lines: a {"columns": [...]} line,
+    then one {"row": label, "values": [...]} line per row, infinite
+    values written as null.
+
+    Args:
+        file_path: Destination file
+        matrix: 2D array-like
+        row_labels, column_labels: Labels of the rows and columns
+        fmt: "csv", "tsv" or "jsonl"
+        integer: Write the values as integers (incidence matrix)
+    """
+    with open(file_path, 'w', encoding='utf-8', newline='') as file:
+        if fmt == "jsonl":
+            file.write(json.dumps({"columns": list(column_labels)}) + "\n")
+            for label, i in zip(row_labels, range(len(matrix))):
+                row = np.asarray(matrix[i])
+                values = row.astype(np.int64).tolist() if integer else [_json_value(v) for v in row.tolist()]
+                file.write(json.dumps({"row": label, "values": values}) + "\n")
+            return
+
+        separator = SEPARATORS[fmt]
+        file.write(separator.join([""] + [_text_cell(str(label), separator) for label in column_labels]) + "\n")
+        for label, i in zip(row_labels, range(len(matrix))):
+            row = np.asarray(matrix[i])
+            values = row.astype(np.int64).tolist() if integer else row.tolist()
+            file.write(_text_cell(str(label), separator) + separator + separator.join(map(repr, values)) + "\n")
+
+
+def write_records(file_path: str, fields: Sequence[str], rows: Iterable[Sequence], fmt: str = "csv"):
+    """
+    Write records (an algorithm result) one at a time from any iterable.
+
+    CSV / TSV: a header line with the field names, then one line per
+    record (None is an empty cell). JSON Lines: one object per record,
+    infinite values written as null.
+    """
+    with open(file_path, 'w', encoding='utf-8', newline='') as file:
+        if fmt == "jsonl":
+            for row in rows:
+                file.write(json.dumps({field: _json_value(value) for field, value in zip(fields, row)}) + "\n")
+            return
+
+        separator = SEPARATORS[fmt]
+        file.write(separator.join(_text_cell(field, separator) for field in fields) + "\n")
+        for row in rows:
+            file.write(separator.join(_cell(value, separator) for value in row) + "\n")
@@ -0,0 +1,28 @@
+import gzip
+import io
+from typing import BinaryIO, TextIO, Tuple
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+def open_binary(file_path: str) -> Tuple[BinaryIO, BinaryIO]:
+    """
+    Open a file for reading, decompressing it on the fly if it is gzip
+    (detected from its first bytes, whatever the extension).
+
+    Returns:
+        (stream, raw): the stream to read, and the file on disk, whose
+        tell() gives the number of bytes consumed for progress reports.
+    """
+    raw = open(file_path, 'rb')
+    magic = raw.read(2)
+    raw.seek(0)
+    if magic == GZIP_MAGIC:
+        return gzip.GzipFile(fileobj=raw), raw
+    return raw, raw
+
+
+def open_text(file_path: str) -> Tuple[TextIO, BinaryIO]:
+    """Same as open_binary(), decoded as UTF-8 text."""
+    stream, raw = open_binary(file_path)
+    return io.TextIOWrapper(stream, encoding='utf-8'), raw
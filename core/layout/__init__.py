@@ -0,0 +1,8 @@
+from core.layout.force_directed import QuadTree, ForceDirectedLayout, force_directed_layout
+from core.layout.layered import feedback_arcs, assign_layers, layered_layout
+from core.layout.spectral import Laplacian, spectral_layout
+from core.layout.layouts import LAYOUTS, StaticLayout, RefinedLayout, start_layout, layout_graph
+
+__all__ = ['QuadTree', 'ForceDirectedLayout', 'force_directed_layout', 'feedback_arcs', 'assign_layers', 'layered_layout',
+           'Laplacian', 'spectral_layout', 'LAYOUTS', 'StaticLayout', 'RefinedLayout', 'start_layout',
+           'layout_graph']
@@ -0,0 +1,210 @@
+import numpy as np
+from typing import Optional, Tuple
+
+# Depth of the quadtree: cells of 1/2^16 of the layout width. Bodies
+# closer than that share a leaf and only repel the rest of it.
+MAX_DEPTH = 16
+
+
+def _spread_bits(values: np.ndarray) -> np.ndarray:
+    """Insert a zero bit between the bits of 16-bit integers (Morton code)."""
+    v = values.astype(np.uint64)
+    v = (v | (v << np.uint64(8))) & np.uint64(0x00FF00FF)
+    v = (v | (v << np.uint64(4))) & np.uint64(0x0F0F0F0F)
+    v = (v | (v << np.uint64(2))) & np.uint64(0x33333333)
+    v = (v | (v << np.uint64(1))) & np.uint64(0x55555555)
+    return v
+
+
+class QuadTree:
+    """
+    Barnes-Hut quadtree stored level by level as flat arrays, built with
+    Morton codes and a single sort instead of inserting bodies one by one.
+
+    For each level: sorted cell codes, body count, centre of mass and the
+    range of the children cells in the next level.
+    """
+
+    def __init__(self, x: np.ndarray, y: np.ndarray):
+        self.n = len(x)
+        left, top = x.min(), y.min()
+        self.size = max(x.max() - left, y.max() - top, 1e-9) * (1 + 1e-9)
+        scale = (1 << MAX_DEPTH) / self.size
+        ix = np.minimum(((x - left) * scale).astype(np.int64), (1 << MAX_DEPTH) - 1)
+        iy = np.minimum(((y - top) * scale).astype(np.int64), (1 << MAX_DEPTH) - 1)
+        self.codes = (_spread_bits(ix) | (_spread_bits(iy) << np.uint64(1))).astype(np.int64)
+
+        order = np.argsort(self.codes, kind='stable')
+        sorted_codes = self.codes[order]
+        xs, ys = x[order], y[order]
+
+        self.cells, self.counts, self.cx, self.cy = [], [], [], []
+        for level in range(MAX_DEPTH + 1):
+            ids = sorted_codes >> (2 * (MAX_DEPTH - level))
+            starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]])
+            counts = np.diff(np.r_[starts, self.n])
+            self.cells.append(ids[starts])
+            self.counts.append(counts)
+            self.cx.append(np.add.reduceat(xs, starts) / counts)
+            self.cy.append(np.add.reduceat(ys, starts) / counts)
+            if counts.max() == 1:
+                break  # Every body has its own cell: deeper levels add nothing
+        self.depth = len(self.cells) - 1
+
+        self.child_start, self.child_count = [], []
+        for level in range(self.depth):
+            children = self.cells[level + 1]
+            first = np.searchsorted(children, self.cells[level] << 2)
+            last = np.searchsorted(children, (self.cells[level] + 1) << 2)
+            # int32: the pair arrays are the bulk of the repulsion work
+            self.child_start.append(first.astype(np.int32))
+            self.child_count.append((last - first).astype(np.int32))
+
+    def repulsion(self, x: np.ndarray, y: np.ndarray, strength: float,
+                  theta: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sum over the bodies of strength / distance repulsions, pushing
+        each body away from the others.
+
+        Cells interact in pairs, level by level: two cells that see each
+        other under an angle smaller than theta (sum of the sizes /
+        distance of the centres of mass) exchange one force, applied to
+        every body of the receiving cell; closer pairs are split into the
+        pairs of their children. All the pairs of a level are processed
+        at once, and the forces are pushed down to the bodies at the end.
+        """
+        theta2 = theta * theta
+        depth = self.depth
+        cell_fx = [np.zeros(len(cells)) for cells in self.cells]
+        cell_fy = [np.zeros(len(cells)) for cells in self.cells]
+        sources = np.zeros(1, dtype=np.int32)  # (source, target) cell pairs
+        targets = np.zeros(1, dtype=np.int32)
+        for level in range(depth + 1):
+            if not len(sources):
+                break
+            counts = self.counts[level]
+            dx = self.cx[level][targets] - self.cx[level][sources]
+            dy = self.cy[level][targets] - self.cy[level][sources]
+            d2 = dx * dx + dy * dy
+            same = sources == targets
+            if level == depth:
+                # Leaves: single bodies, or coincident ones which do not push each other
+                accept = ~same
+            else:
+                size = 2 * self.size / (1 << level)
+                accept = ~same & (((counts[sources] == 1) & (counts[targets] == 1)) | (size * size < theta2 * d2))
+            push = strength * counts[sources[accept]] / np.maximum(d2[accept], 1e-9)
+            cell_fx[level] += np.bincount(targets[accept], weights=dx[accept] * push, minlength=len(counts))
+            cell_fy[level] += np.bincount(targets[accept], weights=dy[accept] * push, minlength=len(counts))
+            if level == depth:
+                break
+            # Split the other pairs, except a single body facing itself
+            opened = ~accept & ~(same & (counts[sources] == 1))
+            sources, targets = sources[opened], targets[opened]
+            source_children = self.child_count[level][sources]
+            target_children = self.child_count[level][targets]
+            pairs = source_children * target_children
+            within = np.arange(pairs.sum(), dtype=np.int32) - np.repeat(np.cumsum(pairs) - pairs, pairs)
+            target_children = np.repeat(target_children, pairs)
+            sources = np.repeat(self.child_start[level][sources], pairs) + within // target_children
+            targets = np.repeat(self.child_start[level][targets], pairs) + within % target_children
+
+        # Push the cell forces down to the leaves, then to the bodies
+        for level in range(depth):
+            parents = np.repeat(np.arange(len(self.cells[level])), self.child_count[level])
+            cell_fx[level + 1] += cell_fx[level][parents]
+            cell_fy[level + 1] += cell_fy[level][parents]
+        leaves = np.searchsorted(self.cells[depth], self.codes >> (2 * (MAX_DEPTH - depth)))
+        return cell_fx[depth][leaves], cell_fy[depth][leaves]
+
+
+class ForceDirectedLayout:
+    """
+    Fruchterman-Reingold layout on NumPy arrays: edges pull their end
+    points together (d^2 / k), every pair of vertices pushes apart
+    (k^2 / d, Barnes-Hut approximated), and each iteration moves the
+    vertices by at most the current temperature, which cools down
+    linearly to zero.
+
+    Call step() until done, or run() for the whole layout; x and y hold
+    the current positions.
+    """
+
+    def __init__(self, n: int, src, dst, iterations: int = 50, k: float = 100.0,
+                 theta: float = 1.2, x=None, y=None, seed: Optional[int] = 0,
+                 temperature: Optional[float] = None):
+        """
+        Args:
+            n: Number of vertices
+            src, dst: Edge end points (vertex indices); directions and
+                weights are ignored
+            iterations: Number of iterations
+            k: Ideal distance between neighbours (scene units)
+            theta: Barnes-Hut opening angle; larger is faster and coarser
+            x, y: Initial positions; random in a square of side
+                k * sqrt(n) when not given
+            seed: Seed of the random initial positions
+            temperature: Initial maximum move per iteration; a tenth of
+                the square side by default, less to refine given positions
+        """
+        self.n = n
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        keep = src != dst  # Les boucles ne bougent rien
+        self.src, self.dst = src[keep], dst[keep]
+        self.iterations = iterations
+        self.k = k
+        self.theta = theta
+        side = k * np.sqrt(max(n, 1))
+        if x is None or y is None:
+            rng = np.random.default_rng(seed)
+            self.x = rng.uniform(0, side, n)
+            self.y = rng.uniform(0, side, n)
+        else:
+            self.x = np.array(x, dtype=np.float64)
+            self.y = np.array(y, dtype=np.float64)
+        self.initial_temperature = side / 10 if temperature is None else temperature
+        self.iteration = 0
+
+    @property
+    def done(self) -> bool:
+        return self.iteration >= self.iterations or self.n < 2
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the iterations done."""
+        return 1.0 if self.done else self.iteration / self.iterations
+
+    @property
+    def temperature(self) -> float:
+        return self.initial_temperature * (1 - self.iteration / max(self.iterations, 1))
+
+    def step(self):
+        """One iteration: forces, then displacement capped by the temperature."""
+        if self.done:
+            return
+        x, y, k, n = self.x, self.y, self.k, self.n
+        fx, fy = QuadTree(x, y).repulsion(x, y, k * k, self.theta)
+
+        # Attraction along the edges, d^2 / k
+        dx = x[self.dst] - x[self.src]
+        dy = y[self.dst] - y[self.src]
+        pull = np.hypot(dx, dy) / k
+        fx += np.bincount(self.src, weights=dx * pull, minlength=n) - np.bincount(self.dst, weights=dx * pull, minlength=n)
+        fy += np.bincount(self.src, weights=dy * pull, minlength=n) - np.bincount(self.dst, weights=dy * pull, minlength=n)
+
+        length = np.maximum(np.hypot(fx, fy), 1e-9)
+        move = np.minimum(length, self.temperature) / length
+        x += fx * move
+        y += fy * move
+        self.iteration += 1
+
+    def run(self) -> Tuple[np.ndarray, np.ndarray]:
+        while not self.done:
+            self.step()
+        return self.x, self.y
+
+
+def force_directed_layout(n: int, src, dst, **options) -> Tuple[np.ndarray, np.ndarray]:
+    """Positions of a Fruchterman-Reingold layout (see ForceDirectedLayout)."""
+    return ForceDirectedLayout(n, src, dst, **options).run()
@@ -0,0 +1,255 @@
+import numpy as np
+from heapq import heapify, heappush, heappop
+from typing import List, Tuple
+
+
+def feedback_arcs(n: int, src: np.ndarray, dst: np.ndarray) -> np.ndarray:
+    """
+    Edges to reverse to make the graph acyclic, with the greedy ordering
+    of Eades, Lin and Smyth: sinks go to the end of the order, sources to
+    its start, and otherwise the vertex with the largest out-degree minus
+    in-degree goes to the start. The edges pointing backwards in that
+    order are the feedback arcs. O((V + E) log V).
+
+    Returns:
+        Boolean mask of the edges to reverse
+    """
+    order = np.argsort(src, kind='stable')
+    out_starts = np.searchsorted(src[order], np.arange(n + 1)).tolist()
+    out_targets = dst[order].tolist()
+    order = np.argsort(dst, kind='stable')
+    in_starts = np.searchsorted(dst[order], np.arange(n + 1)).tolist()
+    in_sources = src[order].tolist()
+    out_degree = np.bincount(src, minlength=n).tolist()
+    in_degree = np.bincount(dst, minlength=n).tolist()
+
+    removed = [False] * n
+    position = [0] * n
+    front, back = 0, n - 1  # Prochaines places au début et à la fin de l'ordre
+    sinks = [v for v in range(n) if out_degree[v] == 0]
+    sources = [v for v in range(n) if in_degree[v] == 0 and out_degree[v] > 0]
+    # Autres sommets par out - in décroissant ; entrées périmées ignorées
+    heap = [(in_degree[v] - out_degree[v], v) for v in range(n)]
+    heapify(heap)
+
+    def remove(v):
+        removed[v] = True
+        for i in range(out_starts[v], out_starts[v + 1]):
+            w = out_targets[i]
+            if not removed[w]:
+                in_degree[w] -= 1
+                if in_degree[w] == 0 and out_degree[w] > 0:
+                    sources.append(w)
+                heappush(heap, (in_degree[w] - out_degree[w], w))
+        for i in range(in_starts[v], in_starts[v + 1]):
+            w = in_sources[i]
+            if not removed[w]:
+                out_degree[w] -= 1
+                if out_degree[w] == 0:
+                    sinks.append(w)
+                heappush(heap, (in_degree[w] - out_degree[w], w))
+
+    while front <= back:
+        if sinks:
+            v = sinks.pop()
+            if not removed[v]:
+                position[v] = back
+                back -= 1
+                remove(v)
+        elif sources:
+            v = sources.pop()
+            if not removed[v]:
+                position[v] = front
+                front += 1
+                remove(v)
+        else:
+            delta, v = heappop(heap)
+            if not removed[v] and delta == in_degree[v] - out_degree[v]:
+                position[v] = front
+                front += 1
+                remove(v)
+    position = np.array(position, dtype=np.int64)
+    return position[src] > position[dst]
+
+
+def assign_layers(n: int, src: np.ndarray, dst: np.ndarray) -> np.ndarray:
+    """
+    Longest-path layering of an acyclic graph: sources on layer 0, every
+    other vertex one layer below its deepest predecessor. Computed with
+    Kahn's algorithm, one NumPy round per layer. Cycles must be broken
+    first (feedback_arcs()).
+
+    Raises:
+        ValueError: If the graph has a cycle
+    """
+    order = np.argsort(src, kind='stable')
+    targets = dst[order]
+    starts = np.searchsorted(src[order], np.arange(n + 1))
+    in_degree = np.bincount(dst, minlength=n)
+    out_degree = np.diff(starts)
+    layer = np.full(n, -1, dtype=np.int64)
+
+    frontier = np.flatnonzero(in_degree == 0)
+    current, placed = 0, 0
+    while placed < n:
+        if not len(frontier):
+            raise ValueError("Le graphe contient un cycle")
+        layer[frontier] = current
+        placed += len(frontier)
+        counts = out_degree[frontier]
+        edges = np.repeat(starts[frontier] - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        reached = targets[edges]
+        in_degree -= np.bincount(reached, minlength=n)
+        reached = np.unique(reached)
+        frontier = reached[in_degree[reached] == 0]
+        current += 1
+    return layer
+
+
+def _split_long_edges(n: int, layer: np.ndarray, upper: np.ndarray, lower: np.ndarray):
+    """
+    Replace the edges spanning several layers by chains of dummy
+    vertices (numbered from n), one per crossed layer.
+
+    Returns:
+        (layer of every vertex including the dummies, segment upper ends,
+        segment lower ends), every segment joining consecutive layers
+    """
+    spans = layer[lower] - layer[upper]
+    dummies = spans - 1
+    first_dummy = n + np.cumsum(dummies) - dummies
+    edge = np.repeat(np.arange(len(spans)), spans)
+    k = np.arange(spans.sum()) - np.repeat(np.cumsum(spans) - spans, spans)  # Rang dans la chaîne
+    seg_upper = np.where(k == 0, upper[edge], first_dummy[edge] + k - 1)
+    seg_lower = np.where(k == spans[edge] - 1, lower[edge], first_dummy[edge] + k)
+    dummy_edge = np.repeat(np.arange(len(spans)), dummies)
+    dummy_rank = np.arange(dummies.sum()) - np.repeat(np.cumsum(dummies) - dummies, dummies)
+    all_layers = np.concatenate([layer, layer[upper[dummy_edge]] + dummy_rank + 1])
+    return all_layers, seg_upper, seg_lower
+
+
+class _Layers:
+    """Vertices and segments grouped by layer, with the rank of every vertex."""
+
+    def __init__(self, layer: np.ndarray, seg_upper: np.ndarray, seg_lower: np.ndarray):
+        self.count = int(layer.max()) + 1 if len(layer) else 0
+        by_layer = np.argsort(layer, kind='stable')
+        bounds = np.searchsorted(layer[by_layer], np.arange(self.count + 1))
+        # Vertices of each layer in rank order
+        self.order: List[np.ndarray] = [by_layer[bounds[i]:bounds[i + 1]] for i in range(self.count)]
+        self.rank = np.empty(len(layer), dtype=np.int64)
+        for vertices in self.order:
+            self.rank[vertices] = np.arange(len(vertices))
+        # Segments below each layer
+        seg_layer = layer[seg_upper]
+        by_segment = np.argsort(seg_layer, kind='stable')
+        seg_bounds = np.searchsorted(seg_layer[by_segment], np.arange(self.count + 1))
+        self.upper = [seg_upper[by_segment[seg_bounds[i]:seg_bounds[i + 1]]] for i in range(self.count)]
+        self.lower = [seg_lower[by_segment[seg_bounds[i]:seg_bounds[i + 1]]] for i in range(self.count)]
+
+    def neighbours(self, index: int, downwards: bool):
+        """(vertices of the layer, their neighbours) for the segments above or below it."""
+        if downwards:
+            return self.lower[index - 1], self.upper[index - 1]
+        return self.upper[index], self.lower[index]
+
+    def sweep(self, downwards: bool) -> bool:
+        """
+        One barycenter pass: each layer is sorted by the mean rank of its
+        neighbours in the previous layer of the sweep (vertices without
+        such neighbours keep their rank). Returns True if an order changed.
+        """
+        changed = False
+        layers = range(1, self.count) if downwards else range(self.count - 2, -1, -1)
+        for index in layers:
+            vertices, others = self.neighbours(index, downwards)
+            if not len(vertices):
+                continue
+            order = self.order[index]
+            size = len(order)
+            local = self.rank[vertices]
+            sums = np.bincount(local, weights=self.rank[others], minlength=size)
+            counts = np.bincount(local, minlength=size)
+            barycenter = np.where(counts > 0, sums / np.maximum(counts, 1), np.arange(size))
+            permutation = np.argsort(barycenter, kind='stable')
+            if (permutation != np.arange(size)).any():
+                changed = True
+                order = order[permutation]
+                self.order[index] = order
+                self.rank[order] = np.arange(size)
+        return changed
+
+    def coordinates(self, separation: float, passes: int) -> np.ndarray:
+        """
+        x of every vertex: rank order with the given minimum separation,
+        then passes moving each layer towards the mean x of its
+        neighbours in the previous layer, without changing the order.
+        """
+        x = np.empty(len(self.rank))
+        for order in self.order:
+            x[order] = (np.arange(len(order)) - (len(order) - 1) / 2) * separation
+        for sweep in range(passes):
+            downwards = sweep % 2 == 0
+            layers = range(1, self.count) if downwards else range(self.count - 2, -1, -1)
+            for index in layers:
+                vertices, others = self.neighbours(index, downwards)
+                if not len(vertices):
+                    continue
+                order = self.order[index]
+                size = len(order)
+                local = self.rank[vertices]
+                sums = np.bincount(local, weights=x[others], minlength=size)
+                counts = np.bincount(local, minlength=size)
+                wanted = np.where(counts > 0, sums / np.maximum(counts, 1), x[order])
+                # Closest placements at the wanted x or right of it / left of it
+                # that keep the order and the separation; their mean keeps both
+                steps = np.arange(size) * separation
+                right = np.maximum.accumulate(wanted - steps) + steps
+                left = np.minimum.accumulate((wanted - steps)[::-1])[::-1] + steps
+                x[order] = (left + right) / 2
+        return x
+
+
+def layered_layout(n: int, src, dst, sweeps: int = 8, separation: float = 100.0,
+                   layer_gap: float = 150.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sugiyama layered layout, top to bottom: cycles broken by reversing
+    a feedback arc set, longest-path layer assignment, dummy vertices on the
+    edges crossing several layers, barycenter sweeps to reduce crossings,
+    then barycentric x coordinates. Each sweep is linear in the number of
+    vertices and segments.
+
+    Args:
+        n: Number of vertices
+        src, dst: Edge end points (vertex indices), in the edge direction;
+            undirected edges are laid out as given
+        sweeps: Maximum number of crossing reduction passes (alternately
+            downwards and upwards)
+        separation: Minimum horizontal distance in a layer
+        layer_gap: Vertical distance between layers
+
+    Returns:
+        (x, y) arrays of the vertex positions
+    """
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    keep = src != dst
+    src, dst = src[keep], dst[keep]
+    if n == 0:
+        return np.empty(0), np.empty(0)
+
+    # Cycles broken by reversing a feedback arc set; those edges are laid out upwards
+    reverse = feedback_arcs(n, src, dst)
+    upper = np.where(reverse, dst, src)
+    lower = np.where(reverse, src, dst)
+    layer = assign_layers(n, upper, lower)
+    all_layers, seg_upper, seg_lower = _split_long_edges(n, layer, upper, lower)
+
+    layers = _Layers(all_layers, seg_upper, seg_lower)
+    unchanged = 0
+    for sweep in range(sweeps):
+        unchanged = 0 if layers.sweep(downwards=sweep % 2 == 0) else unchanged + 1
+        if unchanged == 2:
+            break  # Stable both ways
+    x = layers.coordinates(separation, passes=4)
+    return x[:n], layer * layer_gap
@@ -0,0 +1,125 @@
+import numpy as np
+from typing import Callable, List, Tuple
+from core.formats.graph_data import GraphData
+from core.layout.force_directed import ForceDirectedLayout
+from core.layout.layered import layered_layout
+from core.layout.spectral import spectral_layout
+
+
+class StaticLayout:
+    """
+    Step interface (step(), done, progress, x, y) for a layout computed
+    in one go, so that every layout runs the same way in the layout
+    worker.
+    """
+
+    def __init__(self, compute: Callable[[], Tuple[np.ndarray, np.ndarray]], x, y):
+        self.compute = compute
+        self.x = np.array(x, dtype=np.float64)
+        self.y = np.array(y, dtype=np.float64)
+        self.done = False
+
+    @property
+    def progress(self) -> float:
+        return 1.0 if self.done else 0.0
+
+    def step(self):
+        if not self.done:
+            self.x, self.y = self.compute()
+            self.done = True
+
+    def run(self) -> Tuple[np.ndarray, np.ndarray]:
+        self.step()
+        return self.x, self.y
+
+
+class RefinedLayout:
+    """
+    A layout computed in one go (StaticLayout) then used as the start of
+    an iterative one, e.g. spectral positions refined by force-directed
+    iterations.
+    """
+
+    def __init__(self, first: StaticLayout, refine: Callable):
+        """
+        Args:
+            first: Starting layout
+            refine: refine(x, y) -> iterative layout starting from x, y
+        """
+        self.first = first
+        self.refine = refine
+        self.refinement = None
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.first.x if self.refinement is None else self.refinement.x
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.first.y if self.refinement is None else self.refinement.y
+
+    @property
+    def done(self) -> bool:
+        return self.refinement is not None and self.refinement.done
+
+    @property
+    def progress(self) -> float:
+        return 0.0 if self.refinement is None else self.refinement.progress
+
+    def step(self):
+        if self.refinement is None:
+            self.first.step()
+            self.refinement = self.refine(self.first.x, self.first.y)
+        else:
+            self.refinement.step()
+
+    def run(self) -> Tuple[np.ndarray, np.ndarray]:
+        while not self.done:
+            self.step()
+        return self.x, self.y
+
+
+def _force_directed(data: GraphData) -> ForceDirectedLayout:
+    return ForceDirectedLayout(data.vertex_count, data.src, data.dst)
+
+
+def _layered(data: GraphData) -> StaticLayout:
+    return StaticLayout(lambda: layered_layout(data.vertex_count, data.src, data.dst), data.x, data.y)
+
+
+def _spectral(data: GraphData) -> StaticLayout:
+    return StaticLayout(lambda: spectral_layout(data.vertex_count, data.src, data.dst), data.x, data.y)
+
+
+def _spectral_force(data: GraphData) -> RefinedLayout:
+    # Cooler than from random positions: only local adjustments
+    side = 100.0 * np.sqrt(max(data.vertex_count, 1))
+    return RefinedLayout(_spectral(data), lambda x, y: ForceDirectedLayout(
+        data.vertex_count, data.src, data.dst, iterations=30, x=x, y=y, temperature=side / 50))
+
+
+# (name, key, start(GraphData) -> layout with step(), done, progress, x, y)
+LAYOUTS: List[Tuple[str, str, Callable]] = [
+    ("Force (Fruchterman-Reingold)", "force", _force_directed),
+    ("Couches (Sugiyama)", "layered", _layered),
+    ("Spectrale (Laplacien)", "spectral", _spectral),
+    ("Spectrale + force", "spectral-force", _spectral_force),
+]
+
+
+def start_layout(data: GraphData, key: str):
+    """
+    Layout object of the given key for a graph, to be stepped until done.
+
+    Raises:
+        ValueError: Unknown layout
+    """
+    for _, layout_key, start in LAYOUTS:
+        if layout_key == key:
+            return start(data)
+    raise ValueError(f"disposition inconnue : {key}")
+
+
+def layout_graph(data: GraphData, key: str) -> Tuple[np.ndarray, np.ndarray]:
+    """New vertex positions for a graph with the layout of the given key."""
+    return start_layout(data, key).run()
@@ -0,0 +1,302 @@
+import numpy as np
+from typing import List, Optional, Tuple
+
+# Up to this many vertices a graph is solved with a dense eigensolver
+DENSE_LIMIT = 1000
+# Vectors iterated together: repeated eigenvalues (grids, rings) need a block
+BLOCK = 4
+
+
+class Laplacian:
+    """
+    Weighted Laplacian L = D - A of an undirected graph, with the
+    adjacency stored as CSR arrays (indptr, indices, data). It is the
+    B·Bᵀ of an oriented incidence matrix B, built from the edge list
+    without forming B.
+    """
+
+    def __init__(self, n: int, src: np.ndarray, dst: np.ndarray, weight: Optional[np.ndarray] = None):
+        """
+        Args:
+            n: Number of vertices
+            src, dst: Edge end points; directions and self-loops are ignored
+            weight: Edge weights, summed over repeated edges; without
+                weights every pair of adjacent vertices counts once
+        """
+        self.n = n
+        keep = src != dst
+        low = np.minimum(src[keep], dst[keep])
+        high = np.maximum(src[keep], dst[keep])
+        pairs, inverse = np.unique(low * n + high, return_inverse=True)
+        weight = np.ones(len(pairs)) if weight is None else np.bincount(inverse, weights=weight[keep])
+        low, high = pairs // n, pairs % n
+        rows = np.concatenate([low, high])
+        order = np.argsort(rows, kind='stable')
+        self.rows = rows[order]
+        self.indices = np.concatenate([high, low])[order]
+        self.data = np.concatenate([weight, weight])[order]
+        self.indptr = np.searchsorted(self.rows, np.arange(n + 1))
+        self.degree = np.bincount(self.rows, weights=self.data, minlength=n)
+
+    def dot(self, v: np.ndarray) -> np.ndarray:
+        """L·V for a block of column vectors V."""
+        if not len(self.indices):
+            return np.zeros_like(v)
+        starts = np.minimum(self.indptr[:-1], len(self.indices) - 1)
+        neighbours = np.add.reduceat(v[self.indices] * self.data[:, None], starts, axis=0)
+        # reduceat gives an unrelated entry for the rows without any
+        neighbours[self.indptr[:-1] == self.indptr[1:]] = 0
+        return self.degree[:, None] * v - neighbours
+
+    def dense(self) -> np.ndarray:
+        matrix = np.diag(self.degree)
+        matrix[self.rows, self.indices] = -self.data
+        return matrix
+
+    def components(self) -> np.ndarray:
+        """Connected component label of every vertex (labels 0, 1, ... by lowest vertex)."""
+        parent = np.arange(self.n)
+        while True:
+            # Hook every root onto the smallest root it is linked to, then flatten the trees
+            np.minimum.at(parent, parent[self.rows], parent[self.indices])
+            while True:
+                grand = parent[parent]
+                if (grand == parent).all():
+                    break
+                parent = grand
+            if (parent[self.rows] == parent[self.indices]).all():
+                return np.unique(parent, return_inverse=True)[1]
+
+
+def _best_neighbours(rows: np.ndarray, indices: np.ndarray, candidates: np.ndarray, keys, n: int) -> np.ndarray:
+    """For every vertex, the neighbour of its best candidate edge (largest keys, last key first), or -1."""
+    candidates = candidates[np.lexsort(tuple(-key[candidates] for key in keys) + (rows[candidates],))]
+    first = candidates[np.r_[True, rows[candidates[1:]] != rows[candidates[:-1]]]]
+    best = np.full(n, -1)
+    best[rows[first]] = indices[first]
+    return best
+
+
+def _coarsen(laplacian: Laplacian, mass: np.ndarray, rounds: int = 4):
+    """
+    Merge neighbours into groups: in each round, every unmatched vertex
+    picks the unmatched neighbour with the heaviest edge relative to the
+    two masses (light pairs first keeps the groups even), and mutual
+    picks are matched. The vertices left alone then join the pair of
+    their best matched neighbour, so that hubs, whose neighbours cannot
+    all be matched, do not stop the coarsening.
+
+    Returns:
+        (coarse index of every vertex, coarse Laplacian with the edge
+        weights summed, coarse masses), or None when the graph hardly
+        shrinks or too much for the eigenvectors still to be told apart
+    """
+    n = laplacian.n
+    rows, indices = laplacian.rows, laplacian.indices
+    score = laplacian.data / (mass[rows] * mass[indices])
+    # Ties broken by a pseudo-random key of the pair, the same from both
+    # ends: locally best pairs are then mutual picks (lowest index first
+    # would make every vertex pick the same side and match almost nothing)
+    pair_key = (np.minimum(rows, indices) * 2654435761 + np.maximum(rows, indices) * 40503) % 2147483647
+    keys = (pair_key, score)
+    partner = np.full(n, -1)
+    for _ in range(rounds):
+        candidates = np.flatnonzero((partner[rows] < 0) & (partner[indices] < 0))
+        if not len(candidates):
+            break
+        pick = _best_neighbours(rows, indices, candidates, keys, n)
+        chosen = np.flatnonzero(pick >= 0)
+        mutual = chosen[pick[pick[chosen]] == chosen]
+        partner[mutual] = pick[mutual]
+    representative = np.where(partner >= 0, np.minimum(np.arange(n), partner), np.arange(n))
+    host = _best_neighbours(rows, indices, np.flatnonzero((partner[rows] < 0) & (partner[indices] >= 0)), keys, n)
+    alone = host >= 0
+    representative[alone] = representative[host[alone]]
+    representatives, parent = np.unique(representative, return_inverse=True)
+    if len(representatives) > 0.8 * n or len(representatives) <= BLOCK + 1:
+        return None
+    once = rows < indices
+    coarse = Laplacian(len(representatives), parent[rows[once]], parent[indices[once]], laplacian.data[once])
+    return parent, coarse, np.bincount(parent, weights=mass)
+
+
+def _lanczos(laplacian: Laplacian, mass: np.ndarray, start: np.ndarray, basis: int = 48,
+             tol: float = 1e-6, max_restarts: int = 100) -> np.ndarray:
+    """
+    Refine a block of approximate eigenvectors of the smallest non-zero
+    eigenvalues of L·x = λ·M·x (M the diagonal of the vertex masses) by
+    thick-restart block Lanczos on S = c·I - M^-1/2·L·M^-1/2 (c bounds
+    the spectrum), whose largest eigenvalues are the wanted ones. The
+    trivial eigenvector (constant x) is projected out of every Krylov
+    vector.
+
+    Each cycle extends the kept Ritz vectors to a basis of the given size
+    with full reorthogonalisation, then keeps the best Ritz vectors,
+    until the residuals of the wanted ones are below tol·c or after
+    max_restarts cycles.
+
+    Returns:
+        The refined block, as many columns as start
+    """
+    n, block = start.shape
+    scale = 1 / np.sqrt(mass)
+    shift = 2 * (laplacian.degree * scale * scale).max()
+    basis = max(min(basis, n - 1), 2 * block)
+    keep = min(max(2 * block, basis // 3), basis - block)
+    trivial = np.sqrt(mass / mass.sum())[:, None]
+
+    def apply(v):
+        return shift * v - scale[:, None] * laplacian.dot(scale[:, None] * v)
+
+    def orthonormalise(v, against):
+        for _ in range(2):  # Deux passes : orthogonalité à la précision machine
+            v = v - trivial @ (trivial.T @ v)
+            v = v - against @ (against.T @ v)
+        q, r = np.linalg.qr(v)
+        return q[:, np.abs(r.diagonal()) > 1e-8 * shift]  # Sans les directions déjà couvertes
+
+    vectors = np.empty((n, basis + block))
+    images = np.empty((n, basis + block))  # S·vectors
+    size = 0
+    candidates = start / scale[:, None]
+    for _ in range(max_restarts):
+        while size < basis:
+            new = orthonormalise(candidates, vectors[:, :size])
+            if not new.shape[1]:
+                break  # Invariant subspace: nothing new to add
+            end = size + new.shape[1]
+            vectors[:, size:end] = new
+            images[:, size:end] = apply(new)
+            candidates = images[:, size:end]
+            size = end
+        projected = vectors[:, :size].T @ images[:, :size]
+        values, ritz = np.linalg.eigh((projected + projected.T) / 2)
+        kept = min(keep, size)
+        ritz = ritz[:, ::-1][:, :kept]  # Largest first
+        values = values[::-1][:kept]
+        kept_vectors = vectors[:, :size] @ ritz
+        kept_images = images[:, :size] @ ritz
+        residuals = kept_images - kept_vectors * values
+        if size < basis or np.linalg.norm(residuals[:, :block], axis=0).max() < tol * shift:
+            break
+        vectors[:, :kept] = kept_vectors
+        images[:, :kept] = kept_images
+        size = kept
+        # The residuals span the next Krylov directions
+        candidates = residuals[:, :block]
+    return kept_vectors[:, :block] * scale[:, None]
+
+
+def _dense_eigenvectors(laplacian: Laplacian, mass: np.ndarray, count: int) -> np.ndarray:
+    """Eigenvectors of the smallest non-zero eigenvalues of L·x = λ·M·x, dense."""
+    scale = 1 / np.sqrt(mass)
+    _, vectors = np.linalg.eigh(laplacian.dense() * scale[:, None] * scale)
+    return vectors[:, 1:count + 1] * scale[:, None]
+
+
+def _component_layout(laplacian: Laplacian) -> np.ndarray:
+    """
+    (n, 2) spectral coordinates of a connected graph. Large graphs are
+    coarsened by matchings down to DENSE_LIMIT vertices, solved densely
+    there, and the eigenvectors are interpolated back level by level,
+    each level refining them with a few Lanczos cycles: the Krylov
+    iterations only have to remove the interpolation error, instead of
+    building the smooth eigenvectors from scratch.
+    """
+    n = laplacian.n
+    if n <= 2:
+        return np.c_[np.arange(n, dtype=np.float64), np.zeros(n)]
+    levels = [(None, laplacian, np.ones(n))]
+    while levels[-1][1].n > DENSE_LIMIT:
+        coarse = _coarsen(levels[-1][1], levels[-1][2])
+        if coarse is None:
+            break
+        levels.append(coarse)
+    _, coarsest, mass = levels[-1]
+    block = min(BLOCK, coarsest.n - 1)
+    if coarsest.n <= DENSE_LIMIT:
+        vectors = _dense_eigenvectors(coarsest, mass, block)
+    else:
+        # Deterministic start block, spread over all the vertices
+        positions = np.arange(coarsest.n)[:, None] * np.arange(1, block + 1)
+        vectors = _lanczos(coarsest, mass, np.cos(positions * 0.7548776662) + np.sin(positions * 0.5698402910))
+    for level in range(len(levels) - 1, 0, -1):
+        parent = levels[level][0]
+        _, finer, mass = levels[level - 1]
+        vectors = _lanczos(finer, mass, vectors[parent], basis=24, max_restarts=1)
+    coordinates = vectors[:, :2]
+    # Sign convention: the largest entry of each axis is positive
+    signs = np.sign(coordinates[np.abs(coordinates).argmax(axis=0), np.arange(2)])
+    return coordinates * np.where(signs == 0, 1, signs)
+
+
+def _pack(boxes: List[Tuple[float, float]], gap: float) -> np.ndarray:
+    """Top-left corners of boxes placed on shelves, biggest first, in a roughly square area."""
+    width = max(np.sqrt(sum(w * h for w, h in boxes)), max(w for w, _ in boxes))
+    corners = np.empty((len(boxes), 2))
+    x = y = shelf = 0.0
+    for i, (w, h) in enumerate(boxes):
+        if x > 0 and x + w > width:
+            x, y, shelf = 0.0, y + shelf + gap, 0.0
+        corners[i] = (x, y)
+        x += w + gap
+        shelf = max(shelf, h)
+    return corners
+
+
+def spectral_layout(n: int, src, dst, k: float = 100.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Spectral layout: the eigenvectors of the two smallest non-zero
+    eigenvalues of the graph Laplacian are the x and y coordinates.
+    Components up to DENSE_LIMIT vertices use a dense eigensolver, larger
+    ones multilevel block Lanczos iterations on the CSR Laplacian. The
+    result is deterministic, and a good starting point for a
+    force-directed layout.
+
+    Each connected component is laid out on its own (the Laplacian of a
+    disconnected graph has one zero eigenvalue per component) in a square
+    of side k * sqrt(size), and the squares are packed side by side.
+
+    Args:
+        n: Number of vertices
+        src, dst: Edge end points (vertex indices); directions and
+            weights are ignored
+        k: Typical distance between neighbours (scene units)
+
+    Returns:
+        (x, y) arrays of the vertex positions
+    """
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    x, y = np.zeros(n), np.zeros(n)
+    if n == 0:
+        return x, y
+    laplacian = Laplacian(n, src, dst)
+    labels = laplacian.components()
+    sizes = np.bincount(labels)
+    members = np.argsort(labels, kind='stable')
+    bounds = np.r_[0, np.cumsum(sizes)]
+    local = np.empty(n, dtype=np.int64)  # Index of each vertex in its component
+    local[members] = np.arange(n) - bounds[labels[members]]
+    # Each edge once, grouped by component
+    once = laplacian.rows < laplacian.indices
+    edge_src, edge_dst = laplacian.rows[once], laplacian.indices[once]
+    by_component = np.argsort(labels[edge_src], kind='stable')
+    edge_src, edge_dst = edge_src[by_component], edge_dst[by_component]
+    edge_bounds = np.searchsorted(labels[edge_src], np.arange(len(sizes) + 1))
+
+    boxes, layouts = [], []
+    for component in np.argsort(-sizes, kind='stable'):
+        vertices = members[bounds[component]:bounds[component + 1]]
+        edges = slice(edge_bounds[component], edge_bounds[component + 1])
+        coordinates = _component_layout(Laplacian(len(vertices), local[edge_src[edges]], local[edge_dst[edges]]))
+        side = k * np.sqrt(len(vertices))
+        spans = np.ptp(coordinates, axis=0)
+        coordinates = (coordinates - coordinates.min(axis=0)) * np.where(spans > 0, side / np.maximum(spans, 1e-12), 0)
+        boxes.append((side if spans[0] > 0 else 0.0, side if spans[1] > 0 else 0.0))
+        layouts.append((vertices, coordinates))
+    corners = _pack(boxes, gap=k)
+    for (vertices, coordinates), (left, top) in zip(layouts, corners):
+        x[vertices] = coordinates[:, 0] + left
+        y[vertices] = coordinates[:, 1] + top
+    return x, y
@@ -1,3 +1,4 @@
 from core.matrices.graph_matrices import GraphMatrices
+from core.matrices.weight_index import WeightIndex
 
-__all__ = ['GraphMatrices']
\ No newline at end of file
+__all__ = ['GraphMatrices', 'WeightIndex']
\ No newline at end of file
@@ -1,5 +1,6 @@
 import numpy as np
-from typing import Dict, List, Tuple, Set, Optional, Any
+from typing import Dict, List, Tuple, Set, Optional, Any, Callable
+from core.formats.tables import write_matrix
 
 class GraphMatrices:
     """
@@ -7,6 +8,18 @@ class GraphMatrices:
     - Adjacency Matrix: Represents connections between vertices
     - Incidence Matrix: Represents connections between vertices and edges
     - Distance Matrix: Represents shortest path distances between vertices
+
+    Views can subscribe to mutation events to update incrementally:
+    - "vertex_added": index
+    - "vertex_removed": index, edge_indices (edges removed with it, old numbering)
+    - "edge_added": index, source, target (vertex indices), directed
+    - "edges_removed": indices (old numbering), cells (adjacency cells cleared)
+    - "bulk_added": vertices, edges (numbers appended by a bulk call)
+    - "edge_weight_changed": index, source, target (vertex indices), weight
+    - "reset"
+
+    The matrices are built on first access after a mutation, with NumPy,
+    so a burst of mutations costs a single build.
     """
     
     def __init__(self):
@@ -15,11 +28,70 @@ class GraphMatrices:
         self.vertex_indices = {}  # Mapping from vertex to index
         self.edges = []  # List of edge tuples (source, target, weight, directed)
         
-        # Initialize empty matrices
-        self.adjacency_matrix = np.array([])
-        self.incidence_matrix = np.array([])
-        self.distance_matrix = np.array([])
-        
+        # Cached matrices, None until rebuilt after a mutation
+        self._adjacency_matrix = None
+        self._incidence_matrix = None
+        self._distance_matrix = None
+        self._neighbour_lists = None
+        # Incremented by every mutation, so results can be cached per version
+        self.version = 0
+
+        # Callbacks called as listener(event, details) after each mutation
+        self.listeners = []
+
+    def subscribe(self, listener: Callable[[str, Dict[str, Any]], None]):
+        """Register a callback notified after every mutation."""
+        if listener not in self.listeners:
+            self.listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[str, Dict[str, Any]], None]):
+        """Stop notifying a callback registered with subscribe()."""
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def _notify(self, event: str, **details):
+        """Tell the listeners what changed; matrices are rebuilt when read."""
+        for listener in list(self.listeners):
+            listener(event, details)
+
+    def _invalidate(self):
+        """Drop the cached matrices after a mutation."""
+        self.version += 1
+        self._adjacency_matrix = None
+        self._incidence_matrix = None
+        self._distance_matrix = None
+        self._neighbour_lists = None
+
+    @property
+    def adjacency_matrix(self) -> np.ndarray:
+        if self._adjacency_matrix is None:
+            self._update_adjacency_matrix()
+        return self._adjacency_matrix
+
+    @property
+    def incidence_matrix(self) -> np.ndarray:
+        if self._incidence_matrix is None:
+            self._update_incidence_matrix()
+        return self._incidence_matrix
+
+    @property
+    def distance_matrix(self) -> np.ndarray:
+        if self._distance_matrix is None:
+            self._update_distance_matrix()
+        return self._distance_matrix
+
+    @property
+    def neighbour_lists(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        The non-zero cells of the adjacency matrix as neighbour lists (CSR):
+        the neighbours of vertex i are neighbours[indptr[i]:indptr[i + 1]],
+        with the weights at the same positions. Built from the edges
+        without the dense matrix, for algorithms on large sparse graphs.
+        """
+        if self._neighbour_lists is None:
+            self._update_neighbour_lists()
+        return self._neighbour_lists
+
     def add_vertex(self, vertex):
         """
         Add a vertex to the matrices.
@@ -33,9 +105,8 @@ class GraphMatrices:
             self.vertices.append(vertex)
             
             # Update matrices
-            self._update_adjacency_matrix()
-            self._update_incidence_matrix()
-            self._update_distance_matrix()
+            self._invalidate()
+            self._notify("vertex_added", index=len(self.vertices) - 1)
     
     def remove_vertex(self, vertex):
         """
@@ -49,6 +120,8 @@ class GraphMatrices:
             index = self.vertex_indices[vertex]
             
             # Remove edges connected to this vertex
+            edge_indices = [i for i, edge in enumerate(self.edges)
+                            if edge[0] == vertex or edge[1] == vertex]
             self.edges = [edge for edge in self.edges 
                          if edge[0] != vertex and edge[1] != vertex]
             
@@ -59,9 +132,8 @@ class GraphMatrices:
             self.vertex_indices = {v: i for i, v in enumerate(self.vertices)}
             
             # Update matrices
-            self._update_adjacency_matrix()
-            self._update_incidence_matrix()
-            self._update_distance_matrix()
+            self._invalidate()
+            self._notify("vertex_removed", index=index, edge_indices=edge_indices)
     
     def add_edge(self, source, target, weight=1, directed=False):
         """
@@ -83,10 +155,49 @@ class GraphMatrices:
             self.edges.append(edge)
             
             # Update matrices
-            self._update_adjacency_matrix()
-            self._update_incidence_matrix()
-            self._update_distance_matrix()
+            self._invalidate()
+            self._notify("edge_added", index=len(self.edges) - 1,
+                         source=self.vertex_indices[source], target=self.vertex_indices[target],
+                         directed=directed)
     
+    def add_vertices_bulk(self, vertices):
+        """
+        Add many vertices at once: one notification, one matrix build.
+
+        Args:
+            vertices: The vertex objects to add, in order
+        """
+        added = 0
+        for vertex in vertices:
+            if vertex not in self.vertex_indices:
+                self.vertex_indices[vertex] = len(self.vertices)
+                self.vertices.append(vertex)
+                added += 1
+        if added:
+            self._invalidate()
+            self._notify("bulk_added", vertices=added, edges=0)
+
+    def add_edges_bulk(self, src, dst, weight, directed):
+        """
+        Add many edges at once: one notification, one matrix build.
+        Unlike add_edge(), duplicates are not looked for: the caller
+        passes a clean edge list (see GraphData).
+
+        Args:
+            src: Source vertex indices
+            dst: Target vertex indices
+            weight: Edge weights
+            directed: Whether each edge is directed
+        """
+        vertices = self.vertices
+        self.edges.extend(
+            (vertices[s], vertices[t], w, d)
+            for s, t, w, d in zip(np.asarray(src).tolist(), np.asarray(dst).tolist(),
+                                  np.asarray(weight).tolist(), np.asarray(directed, dtype=bool).tolist()))
+        if len(src):
+            self._invalidate()
+            self._notify("bulk_added", vertices=0, edges=len(src))
+
     def remove_edge(self, source, target, directed=False):
         """
         Remove an edge from the matrices.
@@ -107,97 +218,149 @@ class GraphMatrices:
                 if (s == source and t == target) or (s == target and t == source):
                     edges_to_remove.append(edge)
         
+        indices = [i for i, edge in enumerate(self.edges) if edge in edges_to_remove]
+        cells = []
+        for s, t, _, d in edges_to_remove:
+            cells.append((self.vertex_indices[s], self.vertex_indices[t]))
+            if not d:
+                cells.append((self.vertex_indices[t], self.vertex_indices[s]))
+
         for edge in edges_to_remove:
             self.edges.remove(edge)
         
         # Update matrices
-        self._update_adjacency_matrix()
-        self._update_incidence_matrix()
-        self._update_distance_matrix()
+        self._invalidate()
+        if indices:
+            self._notify("edges_removed", indices=indices, cells=cells)
     
+    def set_edge_weight(self, index: int, weight):
+        """
+        Change the weight of an edge.
+
+        Args:
+            index: Index of the edge in self.edges
+            weight: The new weight
+        """
+        source, target, old_weight, directed = self.edges[index]
+        if weight == old_weight:
+            return
+        self.edges[index] = (source, target, weight, directed)
+        self._invalidate()
+        self._notify("edge_weight_changed", index=index, source=self.vertex_indices[source],
+                     target=self.vertex_indices[target], weight=weight)
+
     def reset(self):
         """Reset all matrices and data."""
         self.vertices = []
         self.vertex_indices = {}
         self.edges = []
-        self.adjacency_matrix = np.array([])
-        self.incidence_matrix = np.array([])
-        self.distance_matrix = np.array([])
+        self._invalidate()
+        self._notify("reset")
     
+    def filtered(self, edge_indices) -> 'GraphMatrices':
+        """
+        Snapshot with the same vertices and only the given edges (e.g. the
+        edges kept by a weight filter), for algorithms run on a filtered
+        view. It has no listeners and is not kept in sync with this graph.
+        """
+        view = GraphMatrices()
+        view.vertices = list(self.vertices)
+        view.vertex_indices = dict(self.vertex_indices)
+        view.edges = [self.edges[i] for i in sorted(int(i) for i in edge_indices)]
+        return view
+
+    def _edge_arrays(self):
+        """Source indices, target indices, weights and directed flags of the edges."""
+        index = self.vertex_indices
+        m = len(self.edges)
+        src = np.fromiter((index[e[0]] for e in self.edges), dtype=np.intp, count=m)
+        dst = np.fromiter((index[e[1]] for e in self.edges), dtype=np.intp, count=m)
+        weight = np.fromiter((e[2] for e in self.edges), dtype=float, count=m)
+        directed = np.fromiter((e[3] for e in self.edges), dtype=bool, count=m)
+        return src, dst, weight, directed
+
     def _update_adjacency_matrix(self):
         """Update the adjacency matrix based on current vertices and edges."""
         n = len(self.vertices)
         if n == 0:
-            self.adjacency_matrix = np.array([])
+            self._adjacency_matrix = np.array([])
             return
-        
-        # Create a new adjacency matrix filled with zeros
-        self.adjacency_matrix = np.zeros((n, n))
-        
-        # Fill the matrix based on edges
-        for source, target, weight, directed in self.edges:
-            source_idx = self.vertex_indices[source]
-            target_idx = self.vertex_indices[target]
-            
-            # Set the weight in the matrix
-            self.adjacency_matrix[source_idx, target_idx] = weight
-            
-            # For undirected edges, set the weight in both directions
-            if not directed:
-                self.adjacency_matrix[target_idx, source_idx] = weight
-    
+
+        src, dst, weight, directed = self._edge_arrays()
+        # An undirected edge also sets its mirrored cell. Cells are written
+        # in edge order, so a later edge overrides an earlier one, as when
+        # the edges were applied one by one.
+        undirected = np.flatnonzero(~directed)
+        rows = np.concatenate([src, dst[undirected]])
+        cols = np.concatenate([dst, src[undirected]])
+        values = np.concatenate([weight, weight[undirected]])
+        order = np.argsort(np.concatenate([2 * np.arange(len(src)), 2 * undirected + 1]), kind='stable')
+
+        self._adjacency_matrix = np.zeros((n, n))
+        self._adjacency_matrix[rows[order], cols[order]] = values[order]
+
+    def _update_neighbour_lists(self):
+        """Update the neighbour lists, with the same cells as the adjacency matrix."""
+        n = len(self.vertices)
+        src, dst, weight, directed = self._edge_arrays()
+        undirected = np.flatnonzero(~directed)
+        rows = np.concatenate([src, dst[undirected]]).astype(np.int64)
+        cols = np.concatenate([dst, src[undirected]]).astype(np.int64)
+        values = np.concatenate([weight, weight[undirected]])
+        # As in the matrix, the last edge written to a cell wins
+        writes = np.concatenate([2 * np.arange(len(src)), 2 * undirected + 1])
+        keys = rows * n + cols
+        order = np.lexsort((writes, keys))
+        last = order[np.r_[keys[order][1:] != keys[order][:-1], True]] if len(order) else order
+        last = last[values[last] != 0]
+        indptr = np.searchsorted(rows[last], np.arange(n + 1))
+        self._neighbour_lists = (indptr, cols[last], values[last])
+
     def _update_incidence_matrix(self):
         """Update the incidence matrix based on current vertices and edges."""
         n_vertices = len(self.vertices)
         n_edges = len(self.edges)
-        
+
         if n_vertices == 0 or n_edges == 0:
-            self.incidence_matrix = np.array([])
+            self._incidence_matrix = np.array([])
             return
-        
-        # Create a new incidence matrix filled with zeros
-        self.incidence_matrix = np.zeros((n_vertices, n_edges))
-        
-        # Fill the matrix based on edges
-        for edge_idx, (source, target, weight, directed) in enumerate(self.edges):
-            source_idx = self.vertex_indices[source]
-            target_idx = self.vertex_indices[target]
-            
-            if directed:
-                # For directed edges: -1 for source, 1 for target
-                self.incidence_matrix[source_idx, edge_idx] = -1
-                self.incidence_matrix[target_idx, edge_idx] = 1
-            else:
-                # For undirected edges: 1 for both source and target
-                self.incidence_matrix[source_idx, edge_idx] = 1
-                self.incidence_matrix[target_idx, edge_idx] = 1
-    
+
+        src, dst, _, directed = self._edge_arrays()
+        columns = np.arange(n_edges)
+        self._incidence_matrix = np.zeros((n_vertices, n_edges))
+        # Directed edges: -1 for the source, 1 for the target;
+        # undirected edges: 1 for both (a self-loop keeps the target's value)
+        self._incidence_matrix[src, columns] = np.where(directed, -1, 1)
+        self._incidence_matrix[dst, columns] = 1
+
     def _update_distance_matrix(self):
         """Update the distance matrix using Floyd-Warshall algorithm."""
         n = len(self.vertices)
         if n == 0:
-            self.distance_matrix = np.array([])
+            self._distance_matrix = np.array([])
             return
-        
-        # Initialize distance matrix with infinity
-        self.distance_matrix = np.full((n, n), np.inf)
-        
-        # Set diagonal to 0 (distance to self)
-        np.fill_diagonal(self.distance_matrix, 0)
-        
-        # Set direct connections based on adjacency matrix
-        for i in range(n):
-            for j in range(n):
-                if self.adjacency_matrix[i, j] > 0:
-                    self.distance_matrix[i, j] = self.adjacency_matrix[i, j]
-        
-        # Floyd-Warshall algorithm
+
+        adjacency = self.adjacency_matrix
+        distance = np.full((n, n), np.inf)
+        np.fill_diagonal(distance, 0)
+        # Direct connections (positive weights only)
+        connected = adjacency > 0
+        distance[connected] = adjacency[connected]
+
+        # Floyd-Warshall, one vectorized relaxation of the whole matrix per k
         for k in range(n):
-            for i in range(n):
-                for j in range(n):
-                    if self.distance_matrix[i, k] + self.distance_matrix[k, j] < self.distance_matrix[i, j]:
-                        self.distance_matrix[i, j] = self.distance_matrix[i, k] + self.distance_matrix[k, j]
-    
+            np.minimum(distance, distance[:, k, np.newaxis] + distance[np.newaxis, k, :], out=distance)
+        self._distance_matrix = distance
+
+    def set_distance_matrix(self, matrix: np.ndarray):
+        """
+        Use a distance matrix computed earlier (e.g. cached in a project
+        file) instead of the current one, if it has the right shape.
+        """
+        n = len(self.vertices)
+        if n and np.shape(matrix) == (n, n):
+            self._distance_matrix = np.asarray(matrix, dtype=float)
+
     def get_adjacency_matrix(self) -> np.ndarray:
         """Get the adjacency matrix."""
         return self.adjacency_matrix
@@ -218,33 +381,26 @@ class GraphMatrices:
         """Get the labels of all edges."""
         return [f"{s.label}-{t.label}" for s, t, _, _ in self.edges]
     
-    def __str__(self) -> str:
-        """String representation of the matrices."""
+    def write_matrix(self, kind: str, file_path: str, fmt: str = "csv"):
+        """
+        Stream one matrix to a CSV / TSV / JSON Lines file, row by row.
+
+        Args:
+            kind: "adjacency", "incidence" or "distance"
+            file_path: Destination file
+            fmt: "csv", "tsv" or "jsonl" (see core.formats.tables)
+        """
         vertex_labels = self.get_vertex_labels()
-        
-        adj_str = "Adjacency Matrix:\n"
-        if len(self.adjacency_matrix) > 0:
-            adj_str += f"  {' '.join(vertex_labels)}\n"
-            for i, row in enumerate(self.adjacency_matrix):
-                adj_str += f"{vertex_labels[i]} {' '.join(map(str, row))}\n"
-        else:
-            adj_str += "  Empty\n"
-        
-        inc_str = "Incidence Matrix:\n"
-        if len(self.incidence_matrix) > 0:
-            edge_labels = self.get_edge_labels()
-            inc_str += f"  {' '.join(edge_labels)}\n"
-            for i, row in enumerate(self.incidence_matrix):
-                inc_str += f"{vertex_labels[i]} {' '.join(map(str, row))}\n"
+        if kind == "adjacency":
+            write_matrix(file_path, self.adjacency_matrix, vertex_labels, vertex_labels, fmt)
+        elif kind == "incidence":
+            matrix = self.incidence_matrix if self.edges else np.zeros((len(self.vertices), 0))
+            write_matrix(file_path, matrix, vertex_labels, self.get_edge_labels(), fmt, integer=True)
+        elif kind == "distance":
+            write_matrix(file_path, self.distance_matrix, vertex_labels, vertex_labels, fmt)
         else:
-            inc_str += "  Empty\n"
-        
-        dist_str = "Distance Matrix:\n"
-        if len(self.distance_matrix) > 0:
-            dist_str += f"  {' '.join(vertex_labels)}\n"
-            for i, row in enumerate(self.distance_matrix):
-                dist_str += f"{vertex_labels[i]} {' '.join(map(lambda x: 'inf' if np.isinf(x) else str(x), row))}\n"
-        else:
-            dist_str += "  Empty\n"
-        
-        return f"{adj_str}\n{inc_str}\n{dist_str}"
\ No newline at end of file
+            raise ValueError(f"Matrice inconnue : {kind}")
+
+    def __str__(self) -> str:
+        """Short description; use write_matrix() to get the values."""
+        return f"GraphMatrices({len(self.vertices)} sommets, {len(self.edges)} arêtes)"
@@ -0,0 +1,115 @@
+import numpy as np
+from typing import Tuple
+
+# Colormap stops (position, RGB): white for the smallest values, then
+# light blue, dark blue and finally dark red for the largest ones.
+COLORMAP_STOPS = [
+    (0.0, (255, 255, 255)),
+    (0.35, (120, 180, 230)),
+    (0.7, (20, 60, 160)),
+    (1.0, (140, 0, 30)),
+]
+
+# Colour used for infinite distances (no path)
+INF_COLOR = (200, 200, 200)
+
+
+def build_colormap(stops=COLORMAP_STOPS, size=256) -> np.ndarray:
+    """Build a (size, 3) uint8 lookup table by linear interpolation between stops."""
+    positions = np.array([p for p, _ in stops])
+    colors = np.array([c for _, c in stops], dtype=float)
+    x = np.linspace(0.0, 1.0, size)
+    lut = np.empty((size, 3), dtype=np.uint8)
+    for channel in range(3):
+        lut[:, channel] = np.round(np.interp(x, positions, colors[:, channel]))
+    return lut
+
+
+COLORMAP = build_colormap()
+
+
+def block_size(length: int, max_blocks: int) -> int:
+    """Smallest block size that covers `length` with at most `max_blocks` blocks."""
+    return max(1, -(-length // max(1, max_blocks)))  # ceil division
+
+
+def _pool_rows(matrix: np.ndarray, block: int, reduce) -> np.ndarray:
+    """Pool groups of `block` consecutive rows; the last group may be shorter."""
+    rows, cols = matrix.shape
+    full = rows // block * block
+    parts = []
+    if full:
+        parts.append(reduce(matrix[:full].reshape(full // block, block, cols), axis=1))
+    if full < rows:
+        parts.append(reduce(matrix[full:], axis=0)[np.newaxis, :])
+    return np.concatenate(parts)
+
+
+def downsample(matrix: np.ndarray, max_rows: int, max_cols: int, mode: str = "mean") -> np.ndarray:
+    """
+    Reduce a 2D array to at most max_rows x max_cols by block pooling.
+
+    Args:
+        matrix: The array (or a view / memmap of it) to reduce
+        max_rows: Maximum number of output rows
+        max_cols: Maximum number of output columns
+        mode: "mean", "min" or "max" pooling
+
+    Returns:
+        The pooled array (float64). Infinite values propagate through
+        min/max/mean pooling as expected.
+    """
+    rows, cols = matrix.shape
+    if rows == 0 or cols == 0:
+        return np.zeros((0, 0))
+    row_block = block_size(rows, max_rows)
+    col_block = block_size(cols, max_cols)
+    if row_block == 1 and col_block == 1:
+        return np.asarray(matrix, dtype=float)
+
+    if mode == "mean":
+        reduce = lambda a, axis: np.sum(a, axis=axis, dtype=np.float64)
+    elif mode == "min":
+        reduce = np.min
+    elif mode == "max":
+        reduce = np.max
+    else:
+        raise ValueError(f"Mode de réduction inconnu : {mode}")
+
+    # Rows first: this pass reads the (possibly huge) array contiguously,
+    # the column pass then only works on the already reduced strip.
+    pooled = _pool_rows(matrix, row_block, reduce)
+    pooled = _pool_rows(pooled.T, col_block, reduce).T
+    pooled = np.asarray(pooled, dtype=float)
+
+    if mode == "mean":
+        row_sizes = np.full(pooled.shape[0], row_block)
+        row_sizes[-1] = rows - row_block * (pooled.shape[0] - 1)
+        col_sizes = np.full(pooled.shape[1], col_block)
+        col_sizes[-1] = cols - col_block * (pooled.shape[1] - 1)
+        with np.errstate(invalid='ignore'):
+            pooled /= np.outer(row_sizes, col_sizes)
+    return np.ascontiguousarray(pooled)
+
+
+def value_range(values: np.ndarray) -> Tuple[float, float]:
+    """Minimum and maximum of the finite values, (0, 1) if there are none."""
+    finite = values[np.isfinite(values)]
+    if finite.size == 0:
+        return 0.0, 1.0
+    return float(finite.min()), float(finite.max())
+
+
+def apply_colormap(values: np.ndarray, vmin: float, vmax: float, lut: np.ndarray = COLORMAP) -> np.ndarray:
+    """
+    Map a 2D float array to a contiguous (h, w, 3) uint8 RGB buffer.
+    Infinite and NaN values get INF_COLOR.
+    """
+    span = vmax - vmin if vmax > vmin else 1.0
+    with np.errstate(invalid='ignore'):
+        scaled = (values - vmin) * ((len(lut) - 1) / span)
+    finite = np.isfinite(scaled)
+    indices = np.clip(np.where(finite, scaled, 0), 0, len(lut) - 1).astype(np.intp)
+    rgb = lut[indices]
+    rgb[~finite] = INF_COLOR
+    return np.ascontiguousarray(rgb)
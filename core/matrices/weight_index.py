@@ -0,0 +1,49 @@
+import numpy as np
+from typing import Tuple
+
+
+class WeightIndex:
+    """
+    Edges sorted by weight, for threshold filters: the edges whose weight
+    lies in [low, high] are a contiguous run of the sorted order, found by
+    bisection, and moving a threshold only yields the edges between the
+    old and the new bound.
+    """
+
+    def __init__(self, weights):
+        weights = np.asarray(weights, dtype=np.float64)
+        self.order = np.argsort(weights, kind='stable')  # Edge indices by increasing weight
+        self.weights = weights[self.order]
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def span(self, low: float, high: float) -> Tuple[int, int]:
+        """(start, stop) positions in the sorted order of the weights in [low, high]."""
+        start = int(np.searchsorted(self.weights, low, side='left'))
+        stop = int(np.searchsorted(self.weights, high, side='right'))
+        return start, max(start, stop)
+
+    def edges(self, span: Tuple[int, int]) -> np.ndarray:
+        """Edge indices of a span."""
+        return self.order[span[0]:span[1]]
+
+    def changes(self, old: Tuple[int, int], new: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Edges entering and leaving the filter when its span goes from old
+        to new: at most two runs of the sorted order each, so the cost only
+        depends on the number of edges that change.
+        """
+        return self._difference(new, old), self._difference(old, new)
+
+    def _difference(self, a: Tuple[int, int], b: Tuple[int, int]) -> np.ndarray:
+        """Edges of span a that are not in span b."""
+        below = self.order[a[0]:max(a[0], min(a[1], b[0]))]
+        above = self.order[min(a[1], max(a[0], b[1])):a[1]]
+        return np.concatenate([below, above])
+
+    def quantile(self, q: float) -> float:
+        """Weight below which a fraction q of the edges lie (0 <= q <= 1)."""
+        if not len(self.weights):
+            return 0.0
+        return float(self.weights[int(round(q * (len(self.weights) - 1)))])
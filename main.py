@@ -4,6 +4,7 @@ from ui.main_window import MainWindow
 
 def main():
     app = QApplication(sys.argv)
+    app.setApplicationName("Graph Visualizer")  # Dossier de l'autosauvegarde
     window = MainWindow()
     window.show()
     sys.exit(app.exec_())
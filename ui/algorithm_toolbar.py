@@ -22,6 +22,7 @@ class AlgorithmToolbar(QWidget):
         self.mst_btn = QPushButton("D'Arbres couvrants à poids minimum")
         self.shortest_path_btn = QPushButton("De plus court chemin")
         self.flow_btn = QPushButton("De Flots")
+        self.export_result_btn = QPushButton("Exporter le résultat")
         self.back_btn = QPushButton("←– RETOUR")
 
         # Ajouter les widgets à la mise en page
@@ -30,6 +31,7 @@ class AlgorithmToolbar(QWidget):
         layout.addWidget(self.mst_btn)
         layout.addWidget(self.shortest_path_btn)
         layout.addWidget(self.flow_btn)
+        layout.addWidget(self.export_result_btn)
         layout.addWidget(self.back_btn)
 
         self.setLayout(layout)
@@ -0,0 +1,139 @@
+from PyQt5.QtCore import QObject, QTimer, QLockFile, QStandardPaths
+import os
+import numpy as np
+from core.formats.journal import JournalWriter, has_recovery_data, clear_journal
+
+
+def journal_directory():
+    """Per-user directory of the autosave journal."""
+    base = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation) or os.path.expanduser("~")
+    return os.path.join(base, "journal")
+
+
+class AutosaveJournal(QObject):
+    """
+    Records every mutation of the canvas graph in a JournalWriter, so a
+    crashed session can be recovered (snapshot + journal tail). Only the
+    changed vertices and edges are encoded here; writing, fsync and
+    compaction happen on the writer's threads.
+
+    Drags move a vertex many times per second: moves are coalesced and
+    written as one record per flush. They are also flushed right after
+    each structural record, with the vertex indices of that moment.
+    """
+    FLUSH_MS = 300
+
+    def __init__(self, canvas, directory=None, parent=None):
+        super().__init__(parent)
+        self.canvas = canvas
+        self.directory = directory or journal_directory()
+        self.writer = None
+        self.pending_moves = {}  # VirtualVertex -> (x, y)
+        self.pending_layout = None  # (vertices, x, y) of the last layout
+
+        os.makedirs(self.directory, exist_ok=True)
+        # A second instance gets no journal instead of writing into this one
+        self.lock = QLockFile(os.path.join(self.directory, "journal.lock"))
+        self.lock.setStaleLockTime(0)
+        self.enabled = self.lock.tryLock(0)
+        if not self.enabled:
+            print("[Autosave] Journal déjà utilisé par une autre instance, autosauvegarde désactivée")
+
+        self.move_timer = QTimer(self)
+        self.move_timer.setInterval(self.FLUSH_MS)
+        self.move_timer.timeout.connect(self.flush_moves)
+
+    def has_recovery_data(self):
+        """Whether the previous session ended without close() (crash)."""
+        return self.enabled and has_recovery_data(self.directory)
+
+    def discard_recovery_data(self):
+        if self.enabled:
+            clear_journal(self.directory)
+
+    def start(self):
+        """Start recording; call after the recovery question is answered."""
+        if not self.enabled or self.writer is not None:
+            return
+        self.writer = JournalWriter(self.directory)
+        # The session starts from an empty canvas, whatever the old records say
+        self.writer.reset()
+        self.canvas.matrices.subscribe(self.on_graph_changed)
+        self.canvas.vertex_moved.connect(self.on_vertex_moved)
+        self.canvas.vertices_moved.connect(self.on_vertices_moved)
+        self.move_timer.start()
+
+    def close(self):
+        """Clean shutdown: nothing to recover, the journal is deleted."""
+        if self.writer is None:
+            return
+        self.move_timer.stop()
+        self.canvas.matrices.unsubscribe(self.on_graph_changed)
+        self.canvas.vertex_moved.disconnect(self.on_vertex_moved)
+        self.canvas.vertices_moved.disconnect(self.on_vertices_moved)
+        self.flush_moves()
+        self.writer.close(discard=True)
+        self.writer = None
+        self.lock.unlock()
+
+    def on_vertex_moved(self, vertex):
+        self.pending_moves[vertex] = (vertex.x, vertex.y)
+
+    def on_vertices_moved(self, x, y):
+        # Supersedes the drags so far; the vertices are kept to find their
+        # indices at flush time
+        self.pending_layout = (list(self.canvas.matrices.vertices), x, y)
+        self.pending_moves = {}
+
+    def flush_moves(self):
+        """Write the coalesced moves: the last layout, then the drags."""
+        index = self.canvas.matrices.vertex_indices
+        if self.pending_layout is not None:
+            vertices, x, y = self.pending_layout
+            self.pending_layout = None
+            indices = np.fromiter((index.get(vertex, -1) for vertex in vertices), dtype=np.int64, count=len(vertices))
+            kept = indices >= 0
+            self.writer.move_vertices(indices[kept], x[kept], y[kept])
+        if not self.pending_moves:
+            return
+        moves = [(index[vertex], x, y) for vertex, (x, y) in self.pending_moves.items() if vertex in index]
+        self.pending_moves = {}
+        if moves:
+            indices, xs, ys = zip(*moves)
+            self.writer.move_vertices(indices, xs, ys)
+
+    def on_graph_changed(self, event, details):
+        matrices = self.canvas.matrices
+        writer = self.writer
+        if event == "reset":
+            self.pending_moves = {}
+            self.pending_layout = None
+            writer.reset()
+            return
+        if event == "vertex_added":
+            vertex = matrices.vertices[details["index"]]
+            writer.add_vertex(vertex.label, vertex.x, vertex.y)
+        elif event == "edge_added":
+            _, _, weight, directed = matrices.edges[details["index"]]
+            writer.add_edge(details["source"], details["target"], float(weight), bool(directed))
+        elif event == "vertex_removed":
+            writer.remove_vertex(details["index"])
+        elif event == "edges_removed":
+            writer.remove_edges(details["indices"])
+        elif event == "edge_weight_changed":
+            writer.set_weight(details["index"], float(details["weight"]))
+        elif event == "bulk_added":
+            if details["vertices"]:
+                vertices = matrices.vertices[-details["vertices"]:]
+                writer.add_vertex_block([vertex.label for vertex in vertices],
+                                        [vertex.x for vertex in vertices], [vertex.y for vertex in vertices])
+            if details["edges"]:
+                index = matrices.vertex_indices
+                edges = matrices.edges[-details["edges"]:]
+                writer.add_edge_block(
+                    np.fromiter((index[s] for s, _, _, _ in edges), dtype=np.int64, count=len(edges)),
+                    np.fromiter((index[t] for _, t, _, _ in edges), dtype=np.int64, count=len(edges)),
+                    np.fromiter((float(w) for _, _, w, _ in edges), dtype=np.float64, count=len(edges)),
+                    np.fromiter((bool(d) for _, _, _, d in edges), dtype=bool, count=len(edges)))
+        # The indices have already changed: pending moves go after the record
+        self.flush_moves()
@@ -0,0 +1,14 @@
+from ui.virtual_vertex import VirtualVertex
+
+
+class CommunityVertex(VirtualVertex):
+    """
+    Display-only vertex standing for a collapsed community: placed at the
+    centre of its members, with an area proportional to their number.
+    It is not part of the graph matrices.
+    """
+
+    def __init__(self, x, y, radius, community, size):
+        super().__init__(x, y, radius, f"C{community + 1} ({size})")
+        self.community = community  # Numéro de la communauté (0 = la plus grande)
+        self.size = size  # Nombre de sommets de la communauté
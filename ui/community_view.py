@@ -0,0 +1,164 @@
+from PyQt5.QtCore import QObject, Qt, pyqtSignal
+from PyQt5.QtGui import QColor
+import numpy as np
+from ui.community_worker import CommunityWorker
+from ui.community_vertex import CommunityVertex
+from ui.vertex_item import VertexItem
+from ui.virtual_edge import VirtualEdge
+from ui.style_palette import PALETTE
+from core.formats import GraphData
+
+
+class CommunityView(QObject):
+    """
+    Aggregated view of the canvas: the communities found by the Louvain
+    detection (CommunityWorker) are each drawn as one super-vertex, and
+    the edges between two communities as one bundled edge labelled with
+    their total weight. Double-clicking a super-vertex expands it into
+    its members, so the scene only holds what is looked at.
+
+    The graph itself is untouched: only the model given to the viewport
+    virtualizer changes. Any edit of the graph goes back to the full view.
+    """
+    # Number of communities and modularity of the detection
+    found = pyqtSignal(int, float)
+    # True while the aggregated view is shown
+    active_changed = pyqtSignal(bool)
+
+    def __init__(self, canvas, parent=None):
+        super().__init__(parent)
+        self.canvas = canvas
+        self.worker = None
+        self.data = None  # GraphData of the graph when the detection started
+        self.labels = None  # Communauté de chaque sommet
+        self.super_vertices = []  # CommunityVertex de chaque communauté
+        self.expanded = set()  # Communautés dépliées
+        self.active = False
+
+    def is_running(self):
+        return self.worker is not None
+
+    def is_active(self):
+        return self.active
+
+    def collapse(self):
+        """Detect the communities of the current graph, then show them collapsed."""
+        matrices = self.canvas.matrices
+        if self.is_running() or not matrices.vertices:
+            return
+        self.show_all()
+        self.data = GraphData.from_matrices(matrices)
+        self.worker = CommunityWorker(self.data, self)
+        self.worker.found.connect(self.on_found)
+        self.worker.failed.connect(self.on_failed)
+        matrices.subscribe(self.on_graph_changed)
+        self.worker.start()
+        print(f"[Communities] Détection lancée sur {self.data.vertex_count} sommets")
+
+    def on_found(self, labels, quality):
+        if self.worker is None:
+            return
+        self.finish()
+        data = self.data
+        self.labels = labels
+        sizes = np.bincount(labels)
+        xs = np.bincount(labels, weights=data.x) / sizes
+        ys = np.bincount(labels, weights=data.y) / sizes
+        radii = VertexItem.RADIUS * np.sqrt(sizes)  # Surface proportionnelle au nombre de sommets
+        self.super_vertices = []
+        for community, (x, y, radius, size) in enumerate(zip(xs.tolist(), ys.tolist(), radii.tolist(), sizes.tolist())):
+            vertex = CommunityVertex(x, y, radius, community, size)
+            vertex.set_color(self.community_color(community))
+            self.super_vertices.append(vertex)
+        self.expanded = set()
+        self.active = True
+        self.canvas.matrices.subscribe(self.on_graph_changed)
+        self.rebuild()
+        print(f"[Communities] {len(sizes)} communautés, modularité {quality:.3f}")
+        self.found.emit(len(sizes), quality)
+        self.active_changed.emit(True)
+
+    def on_failed(self, message):
+        if self.worker is None:
+            return
+        self.finish()
+        print(f"[Communities] Échec de la détection : {message}")
+
+    @staticmethod
+    def community_color(community):
+        """Light colours spread around the hue circle (golden angle)."""
+        return QColor.fromHsv(int(community * 137.508) % 360, 110, 255)
+
+    def expand(self, vertex):
+        """Replace a collapsed community by its members."""
+        if not self.active or not isinstance(vertex, CommunityVertex):
+            return
+        self.expanded.add(vertex.community)
+        self.rebuild()
+        print(f"[Communities] Communauté {vertex.label} dépliée")
+
+    def rebuild(self):
+        """Give the virtualizer the vertices and edges of the current view."""
+        data, labels = self.data, self.labels
+        n, count = len(labels), len(self.super_vertices)
+        vertices = self.canvas.matrices.vertices
+        opened = np.zeros(count, dtype=bool)
+        opened[list(self.expanded)] = True
+        shown = opened[labels]  # Sommets du graphe affichés tels quels
+
+        # Display node of every vertex: itself, or n + its community
+        node = np.where(shown, np.arange(n), n + labels)
+        a, b = node[data.src], node[data.dst]
+        bundled = (a != b) & ~(shown[data.src] & shown[data.dst])
+        low = np.minimum(a[bundled], b[bundled])
+        high = np.maximum(a[bundled], b[bundled])
+        keys, inverse = np.unique(low * (n + count) + high, return_inverse=True)
+        counts = np.bincount(inverse)
+        totals = np.bincount(inverse, weights=data.weight[bundled])
+
+        def display(node):
+            return vertices[node] if node < n else self.super_vertices[node - n]
+
+        edges = []
+        for key, number, total in zip(keys.tolist(), counts.tolist(), totals.tolist()):
+            edge = VirtualEdge(display(key // (n + count)), display(key % (n + count)),
+                               radius=0, text=f"{total:g}", link=False)
+            # Plus d'arêtes regroupées, trait plus épais
+            edge.setPen(PALETTE.pen(Qt.darkGray, min(2 + int(np.log2(number)), 12)))
+            edges.append(edge)
+        index = self.canvas.matrices.vertex_indices
+        edges.extend(edge for source, target, edge, _ in self.canvas.edges
+                     if shown[index[source]] and shown[index[target]])
+
+        display_vertices = [vertex for vertex in self.super_vertices if not opened[vertex.community]]
+        display_vertices.extend(vertices[i] for i in np.flatnonzero(shown).tolist())
+        self.canvas.virtualizer.set_model(display_vertices, edges)
+
+    def show_all(self):
+        """Back to the full graph."""
+        if not self.active:
+            return
+        self.active = False
+        self.canvas.matrices.unsubscribe(self.on_graph_changed)
+        self.labels = None
+        self.super_vertices = []
+        self.expanded = set()
+        self.canvas.virtualizer.set_model(list(self.canvas.matrices.vertices),
+                                          [edge for _, _, edge, _ in self.canvas.edges])
+        print("[Communities] Retour au graphe complet")
+        self.active_changed.emit(False)
+
+    def on_graph_changed(self, event, details):
+        if self.worker is not None:
+            # The detection no longer matches the graph
+            self.worker.found.disconnect(self.on_found)
+            self.finish()
+            print("[Communities] Détection interrompue : le graphe a changé")
+        self.show_all()
+
+    def finish(self):
+        """Wait for the worker and stop listening; returns the worker."""
+        worker, self.worker = self.worker, None
+        worker.wait()
+        self.canvas.matrices.unsubscribe(self.on_graph_changed)
+        return worker
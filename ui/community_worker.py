@@ -0,0 +1,21 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+from core.algorithms.community.louvain import louvain_communities
+
+
+class CommunityWorker(QThread):
+    """Runs the Louvain community detection on a GraphData off the GUI thread."""
+    # (community of every vertex, modularity)
+    found = pyqtSignal(object, float)
+    failed = pyqtSignal(str)
+
+    def __init__(self, data, parent=None):
+        super().__init__(parent)
+        self.data = data
+
+    def run(self):
+        try:
+            data = self.data
+            labels, quality = louvain_communities(data.vertex_count, data.src, data.dst, data.weight)
+            self.found.emit(labels, quality)
+        except Exception as e:
+            self.failed.emit(str(e))
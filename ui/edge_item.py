@@ -1,34 +1,62 @@
-from PyQt5.QtWidgets import QGraphicsPathItem
+from PyQt5.QtWidgets import QGraphicsPathItem, QGraphicsTextItem
 from PyQt5.QtGui import QPainterPath, QPen, QBrush
 from PyQt5.QtCore import QPointF, Qt, QLineF, QRectF
 import math
 
 class EdgeItem(QGraphicsPathItem):
-    def __init__(self, source, target, radius=20, directed=False, is_curvy=False, parent=None):
+    """
+    On-screen view of a VirtualEdge. Items are pooled by the canvas and
+    rebound to whichever edge is currently visible.
+    """
+
+    def __init__(self, edge=None, parent=None):
         super().__init__(parent)
-        self.source = source
-        self.target = target
-        self.radius = radius
-        self.directed = directed
-        self.is_curvy = is_curvy 
+        self.edge = None  # Arête du modèle actuellement affichée
+        self.source = None
+        self.target = None
+        self.radius = 20
+        self.directed = False
+        self.is_curvy = False
         self.arrow_size = 10  # Size of the arrowhead
-        self.pen = QPen(Qt.black, 2)
-        self.brush = QBrush(Qt.NoBrush)  # No fill for the edge
-        self.setPen(self.pen)
-        self.setBrush(self.brush)
+        self.setPen(QPen(Qt.black, 2))
+        self.setBrush(QBrush(Qt.NoBrush))  # No fill for the edge
         self.setZValue(-1)  # Set the Z value to be below the vertices
-                
-        # Update successors and predecessors
-        if self.directed:
-            self.source.successors.append(self.target)
-            self.target.predecessors.append(self.source)
-        self.source.voisins.append(self.target)
-        self.target.voisins.append(self.source)        
-        self.debug_successors_predecessors_voisins()
-        
-        # Set the initial path    
+
+        # Weight text, shown only for edges that have one
+        self.text_item = QGraphicsTextItem(self)
+        self.text_item.setDefaultTextColor(Qt.red)
+        self.text_item.hide()
+
+        if edge is not None:
+            self.bind(edge)
+
+    def bind(self, edge):
+        """Display the given model edge with this item."""
+        self.edge = edge
+        edge.item = self
+        self.source = edge.source
+        self.target = edge.target
+        self.radius = edge.radius
+        self.directed = edge.directed
+        self.is_curvy = edge.is_curvy
+        self.setPen(edge.pen())
+        if edge.text:
+            self.text_item.setPlainText(edge.text)
+            self.text_item.show()
+        else:
+            self.text_item.hide()
+
+        # Set the initial path
         self.update_path()
 
+    def unbind(self):
+        """Detach the item from its edge so it can be recycled."""
+        if self.edge is not None and self.edge.item is self:
+            self.edge.item = None
+        self.edge = None
+        self.source = None
+        self.target = None
+
     def update_path(self):
         """Update the path of the edge (line + arrowhead)."""
         p1 = self.source.sceneBoundingRect().center()
@@ -59,9 +87,8 @@ class EdgeItem(QGraphicsPathItem):
             # Draw the curved line using a quadratic Bezier curve
             path.quadTo(control_x, control_y, end_x, end_y)
 
-            self.setPen(self.pen)  # Ensure the pen is applied
-
             self.setPath(path)
+            self.update_text_position()
             return
 
         path = QPainterPath()
@@ -124,65 +151,24 @@ class EdgeItem(QGraphicsPathItem):
                 path.lineTo(line.p2())
 
         self.setPath(path)
-        
-    def set_source(self, source):
-        # Remove the old source from the target's predecessors and voisins
-        if self.directed and self.source in self.target.predecessors:
-            self.target.predecessors.remove(self.source)
-        if self.source in self.target.voisins:
-            self.target.voisins.remove(self.source)
-            
-        self.source = source
-        # Update successors, predecessors, and voisins
-        if self.directed:
-            self.source.successors.append(self.target)
-            self.target.predecessors.append(self.source)
-        self.source.voisins.append(self.target)
-        self.target.voisins.append(self.source)
-        self.debug_successors_predecessors_voisins()
-            
-        self.update_path()
+        self.update_text_position()
 
-    def set_target(self, target):
-        # Remove the old target from the source's successors and voisins
-        if self.directed and self.target in self.source.successors:
-            self.source.successors.remove(self.target)
-        if self.target in self.source.voisins:
-            self.source.voisins.remove(self.target)
-
-        self.target = target
-
-        # Update successors, predecessors, and voisins
-        if self.directed:
-            self.source.successors.append(self.target)
-            self.target.predecessors.append(self.source)
-        self.source.voisins.append(self.target)
-        self.target.voisins.append(self.source)
-        self.debug_successors_predecessors_voisins()
-        
-        self.update_path()
-    def remove_edge(self):
-        """Remove the edge and update successors, predecessors, and voisins."""
-        if self.directed:
-            # Remove the target from the source's successors
-            if self.target in self.source.successors:
-                self.source.successors.remove(self.target)
-            # Remove the source from the target's predecessors
-            if self.source in self.target.predecessors:
-                self.target.predecessors.remove(self.source)
-        # Remove each other from voisins
-        if self.target in self.source.voisins:
-            self.source.voisins.remove(self.target)
-        if self.source in self.target.voisins:
-            self.target.voisins.remove(self.source)
-        self.scene().removeItem(self)  # Remove the edge from the scene
-        print(f"[Debug] Edge removed: {self.source.label} -> {self.target.label}")
-
-    def debug_successors_predecessors_voisins(self):
-        """Debug function to print successors, predecessors, and voisins."""
-        print(f"[Debug] Source: {self.source.label}")
-        print(f"  Successors: {[v.label for v in self.source.successors]}")
-        print(f"  Voisins: {[v.label for v in self.source.voisins]}")
-        print(f"[Debug] Target: {self.target.label}")
-        print(f"  Predecessors: {[v.label for v in self.target.predecessors]}")
-        print(f"  Voisins: {[v.label for v in self.target.voisins]}")
\ No newline at end of file
+    def update_text_position(self):
+        """Place the weight text above the line, the curve or the loop."""
+        if not self.text_item.isVisible():
+            return
+        p1 = self.source.sceneBoundingRect().center()
+        p2 = self.target.sceneBoundingRect().center()
+        if self.source == self.target:
+            # position weight text for self-loops
+            loop_radius = self.radius + 10  # Adjust the radius to start outside the vertex
+            mx, my = p1.x() + loop_radius, p1.y() - loop_radius - 10  # Adjust position above the loop
+        elif self.is_curvy:
+            control_x = (p1.x() + p2.x()) / 2 + 40
+            control_y = (p1.y() + p2.y()) / 2 - 40
+            mx, my = control_x, control_y - 10
+        else:
+            # Position weight text for regular edges
+            mx, my = (p1.x() + p2.x()) / 2, (p1.y() + p2.y()) / 2 - 10  # Adjust position above the line
+        text_rect = self.text_item.boundingRect()
+        self.text_item.setPos(mx - text_rect.width() / 2, my - text_rect.height() / 2)
@@ -0,0 +1,92 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+import numpy as np
+from core.algorithms.traversal.neighbourhood import Adjacency, ego_network
+
+
+class FocusView(QObject):
+    """
+    Focus view of the canvas: only the k-hop neighbourhood of one vertex
+    (and the edges between its vertices) is given to the viewport
+    virtualizer. Changing the vertex or k diffs the new neighbourhood
+    against the shown one, so only the vertices and edges entering or
+    leaving it get their items bound or released.
+
+    The adjacency lists are built once per version of the graph; any edit
+    of the graph goes back to the full view.
+    """
+    # Label of the focus vertex, k, number of vertices shown
+    focused = pyqtSignal(str, int, int)
+    # True while the focus view is shown
+    active_changed = pyqtSignal(bool)
+
+    def __init__(self, canvas, depth=2, parent=None):
+        super().__init__(parent)
+        self.canvas = canvas
+        self.depth = depth  # k : nombre de sauts autour du sommet
+        self.adjacency = None  # Adjacency of the graph, None until needed
+        self.edge_list = []  # VirtualEdge of every edge, in the adjacency order
+        self.center = None  # Sommet au centre de la vue
+        self.shown = np.empty(0, dtype=np.int64)  # Sommets affichés (indices triés)
+        self.active = False
+        canvas.matrices.subscribe(self.on_graph_changed)
+
+    def is_active(self):
+        return self.active
+
+    def set_depth(self, depth):
+        """Change k; the shown neighbourhood follows."""
+        self.depth = depth
+        if self.active:
+            self.focus(self.center)
+
+    def focus(self, vertex):
+        """Show the k-hop neighbourhood of a graph vertex."""
+        matrices = self.canvas.matrices
+        center = matrices.vertex_indices.get(vertex)
+        if center is None:
+            return
+        if self.adjacency is None:
+            self.build_adjacency()
+        vertices, _, edges = ego_network(self.adjacency, center, self.depth)
+        entering = np.setdiff1d(vertices, self.shown, assume_unique=True)
+        leaving = np.setdiff1d(self.shown, vertices, assume_unique=True)
+        self.center, self.shown = vertex, vertices
+        graph_vertices = matrices.vertices
+        self.canvas.virtualizer.set_model([graph_vertices[i] for i in vertices.tolist()],
+                                          [self.edge_list[i] for i in edges.tolist()])
+        self.canvas.centerOn(vertex.x, vertex.y)
+        print(f"[Focus] {vertex.label}, k = {self.depth} : {len(vertices)} sommets "
+              f"(+{len(entering)} / -{len(leaving)})")
+        if not self.active:
+            self.active = True
+            self.active_changed.emit(True)
+        self.focused.emit(vertex.label, self.depth, len(vertices))
+
+    def build_adjacency(self):
+        """Adjacency lists of the edges of the canvas (one pass over the edges)."""
+        edges = self.canvas.edges
+        index = self.canvas.matrices.vertex_indices
+        src = np.fromiter((index[s] for s, _, _, _ in edges), dtype=np.int64, count=len(edges))
+        dst = np.fromiter((index[t] for _, t, _, _ in edges), dtype=np.int64, count=len(edges))
+        self.adjacency = Adjacency(len(self.canvas.matrices.vertices), src, dst)
+        self.edge_list = [edge for _, _, edge, _ in edges]
+
+    def show_all(self):
+        """Back to the full graph."""
+        if not self.active:
+            return
+        self.active = False
+        self.center = None
+        self.shown = np.empty(0, dtype=np.int64)
+        self.canvas.virtualizer.set_model(list(self.canvas.matrices.vertices),
+                                          [edge for _, _, edge, _ in self.canvas.edges])
+        print("[Focus] Retour au graphe complet")
+        self.active_changed.emit(False)
+
+    def on_graph_changed(self, event, details):
+        if event == "edge_weight_changed":
+            return  # Same neighbourhoods
+        # The adjacency lists no longer match the graph
+        self.adjacency = None
+        self.edge_list = []
+        self.show_all()
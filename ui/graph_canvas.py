@@ -2,10 +2,17 @@ from PyQt5.QtWidgets import (
     QGraphicsView, QGraphicsScene, QGraphicsEllipseItem, QGraphicsLineItem, QGraphicsTextItem, QInputDialog, QMessageBox, QDialog
 )
 from PyQt5.QtGui import QBrush, QPen, QPainterPath, QPolygonF, QTransform, QPainter
-from PyQt5.QtCore import Qt, QPointF, QLineF, pyqtSignal
+from PyQt5.QtCore import Qt, QPointF, QLineF, QRectF, pyqtSignal
+from contextlib import contextmanager
+import numpy as np
 from ui.vertex_item import VertexItem
 from ui.edge_input_dialog import EdgeInputDialog
 from ui.edge_item import EdgeItem
+from ui.virtual_vertex import VirtualVertex
+from ui.virtual_edge import VirtualEdge
+from ui.viewport_virtualizer import ViewportVirtualizer
+from ui.render_profiles import RENDER_PROFILES, auto_profile
+from ui.style_palette import PALETTE, STYLE_APPLIER
 from core.matrices import GraphMatrices
 from core.algorithms.mst.prim import run_prim
 from core.algorithms.mst.kruskal import run_kruskal
@@ -13,8 +20,18 @@ from core.algorithms.mst.kruskal import run_kruskal
 
 
 class GraphCanvas(QGraphicsView):
-    # Signal emitted when a vertex is clicked
-    vertex_clicked = pyqtSignal(VertexItem)
+    # Signal emitted when a vertex is clicked (carries the VirtualVertex)
+    vertex_clicked = pyqtSignal(object)
+    # Signal emitted when the active rendering profile changes
+    render_profile_changed = pyqtSignal(str)
+    # Signal emitted when a vertex is dragged (carries the VirtualVertex)
+    vertex_moved = pyqtSignal(object)
+    # Signal emitted when every vertex is moved at once (x and y arrays)
+    vertices_moved = pyqtSignal(object, object)
+    # Signal emitted when a displayed vertex is double-clicked (graph or community vertex)
+    vertex_double_clicked = pyqtSignal(object)
+    # Signal emitted in PATH_TREE mode when the vertex under the cursor changes (None off vertices)
+    vertex_hovered = pyqtSignal(object)
 
     def __init__(self, parent=None):
         super().__init__()
@@ -24,13 +41,17 @@ class GraphCanvas(QGraphicsView):
         self.setStyleSheet("background-color: white;")
         self.mode = "DEFAULT"
         self.selected_vertex = None
-        self.edges = []  # Liste d'arêtes : (source, target, line, text)
+        self.hovered_vertex = None
+        self.edges = []  # Liste d'arêtes : (source, target, edge, text)
 
         self.vertex_count = 0
 
         # Initialize graph matrices
         self.matrices = GraphMatrices()
 
+        # Only the visible part of the graph gets graphics items
+        self.virtualizer = ViewportVirtualizer(self)
+
         # Zoom settings
         self.scale_factor = 1.0
         self.min_scale = 0.1
@@ -40,19 +61,66 @@ class GraphCanvas(QGraphicsView):
         # Enable mouse tracking for better interaction
         self.setMouseTracking(True)
 
-        # Set rendering hints for better quality
-        self.setRenderHint(QPainter.Antialiasing)
-        self.setRenderHint(QPainter.SmoothPixmapTransform)
+        # Rendering profile: "auto" follows the number of items in the scene
+        self.render_profile_mode = "auto"
+        self.render_profile = None
+        self.apply_render_profile('quality')
 
         # Set drag mode for panning
         self.setDragMode(QGraphicsView.ScrollHandDrag)
 
 
+    def set_render_profile_mode(self, mode):
+        """Use a fixed rendering profile, or "auto" to follow the item count."""
+        self.render_profile_mode = mode
+        if mode == "auto":
+            self.update_render_profile()
+        else:
+            self.apply_render_profile(mode)
+
+    def update_render_profile(self):
+        """Switch profile automatically according to the materialised item count."""
+        if self.render_profile_mode != "auto":
+            return
+        name = auto_profile(self.virtualizer.item_count(), self.render_profile)
+        if name != self.render_profile:
+            self.apply_render_profile(name)
+
+    def apply_render_profile(self, name):
+        """Configure render hints, caching, indexing and viewport updates together."""
+        profile = RENDER_PROFILES[name]
+        self.setRenderHint(QPainter.Antialiasing, bool(profile['render_hints'] & QPainter.Antialiasing))
+        self.setRenderHint(QPainter.SmoothPixmapTransform, bool(profile['render_hints'] & QPainter.SmoothPixmapTransform))
+        self.setViewportUpdateMode(profile['viewport_update_mode'])
+        self.setOptimizationFlags(profile['optimization_flags'])
+        self.virtualizer.set_vertex_cache_mode(profile['vertex_cache_mode'])
+        self.render_profile = name
+        print(f"[Canvas] Profil de rendu : {name}")
+        self.render_profile_changed.emit(name)
+
+    def flush_styles(self):
+        """Push pending colour changes to the visible items (item-level repaint)."""
+        STYLE_APPLIER.flush()
+
+    @contextmanager
+    def bulk_update(self):
+        """Suspend scene indexing (per profile) while many items move at once."""
+        method = RENDER_PROFILES[self.render_profile]['bulk_index_method']
+        previous = self.scene.itemIndexMethod()
+        if method != previous:
+            self.scene.setItemIndexMethod(method)
+        try:
+            yield
+        finally:
+            if method != previous:
+                self.scene.setItemIndexMethod(previous)
+
     def set_mode(self, mode):
         self.mode = mode
         print(f"[Canvas] Mode mis à jour : {self.mode}")
         # Reset selection when changing modes
         self.reset_selection()
+        self.hovered_vertex = None
 
     def mousePressEvent(self, event):
         """Handle mouse press events."""
@@ -61,13 +129,17 @@ class GraphCanvas(QGraphicsView):
             clicked_vertex = None
 
             # Check if a vertex was clicked
-            for item in self.scene.items():
-                if isinstance(item, VertexItem) and item.contains(item.mapFromScene(pos)):
-                    clicked_vertex = item
+            for item in self.scene.items(pos):
+                if isinstance(item, VertexItem) and item.isVisible() and item.vertex is not None:
+                    clicked_vertex = item.vertex
                     break
 
+            if clicked_vertex is not None and clicked_vertex not in self.matrices.vertex_indices \
+                    and self.mode != "DEFAULT":
+                return  # Sommet d'affichage (communauté) : seulement déplaçable
+
             if clicked_vertex:
-                if self.mode in ["DIJKSTRA", "BELLMAN_FORD", "TRAVERSAL", "COLORING", "MST", "FLOW", "ALGORITHMS", "SHORTEST_PATH"]:
+                if self.mode in ["DIJKSTRA", "BELLMAN_FORD", "TRAVERSAL", "COLORING", "MST", "FLOW", "ALGORITHMS", "SHORTEST_PATH", "FOCUS", "PATH_TREE"]:
                     # Emit signal for all algorithm modes
                     print(f"[Canvas] Sommet {clicked_vertex.label} cliqué en mode {self.mode}")
                     self.vertex_clicked.emit(clicked_vertex)
@@ -89,16 +161,39 @@ class GraphCanvas(QGraphicsView):
         else:
             super().mousePressEvent(event)
 
+    def mouseMoveEvent(self, event):
+        """Report the graph vertex under the cursor in PATH_TREE mode."""
+        if self.mode == "PATH_TREE":
+            vertex = None
+            for item in self.scene.items(self.mapToScene(event.pos())):
+                if isinstance(item, VertexItem) and item.isVisible() and item.vertex is not None:
+                    vertex = item.vertex
+                    break
+            if vertex is not self.hovered_vertex:
+                self.hovered_vertex = vertex
+                self.vertex_hovered.emit(vertex)
+        super().mouseMoveEvent(event)
+
+    def mouseDoubleClickEvent(self, event):
+        """Report double-clicks on vertices (expands collapsed communities)."""
+        if event.button() == Qt.LeftButton:
+            pos = self.mapToScene(event.pos())
+            for item in self.scene.items(pos):
+                if isinstance(item, VertexItem) and item.isVisible() and item.vertex is not None:
+                    self.vertex_double_clicked.emit(item.vertex)
+                    return
+        super().mouseDoubleClickEvent(event)
+
     def handle_vertex_selection(self, vertex):
         # Réinitialiser la couleur de tous les sommets non sélectionnés
-        for item in self.scene.items():
-            if isinstance(item, VertexItem) and item != self.selected_vertex:
-                item.setBrush(QBrush(Qt.yellow))
+        for other in self.matrices.vertices:
+            if other != self.selected_vertex:
+                other.setBrush(PALETTE.brush(Qt.yellow))
 
         if self.selected_vertex is None:
             # Le premier sommet est selectionné
             self.selected_vertex = vertex
-            vertex.setBrush(QBrush(Qt.cyan))
+            vertex.setBrush(PALETTE.brush(Qt.cyan))
             print(f"[Canvas] Sommet sélectionné : {vertex.label}")
         else:
             if self.selected_vertex == vertex:
@@ -166,7 +261,7 @@ class GraphCanvas(QGraphicsView):
     def reset_selection(self):
         """Reset the selection of vertices."""
         if self.selected_vertex:
-            self.selected_vertex.setBrush(QBrush(Qt.yellow))
+            self.selected_vertex.setBrush(PALETTE.brush(Qt.yellow))
         self.selected_vertex = None        
 
     def is_valid_weight(self, weight):
@@ -178,6 +273,8 @@ class GraphCanvas(QGraphicsView):
             return False
 
     def remove_edge_by_line(self, line_item):
+        if isinstance(line_item, EdgeItem):
+            line_item = line_item.edge
         for edge in self.edges:
             if edge[2] == line_item:
                 source, target = edge[0], edge[1]
@@ -200,9 +297,7 @@ class GraphCanvas(QGraphicsView):
                     target.voisins.remove(source)
 
                 # Remove the line and text
-                self.scene.removeItem(edge[2])  # ligne
-                if edge[3]:
-                    self.scene.removeItem(edge[3])  # texte
+                self.virtualizer.remove_edge(edge[2])
                 self.edges.remove(edge)
                 break
 
@@ -226,9 +321,7 @@ class GraphCanvas(QGraphicsView):
                 target.voisins.remove(source)
 
 
-            self.scene.removeItem(edge[2])  # Remove the line
-            if edge[3]:
-                self.scene.removeItem(edge[3])  # Remove the weight text
+            self.virtualizer.remove_edge(edge[2])  # Remove the line and weight text
             self.edges.remove(edge)
 
     def add_vertex(self, x, y):
@@ -244,8 +337,8 @@ class GraphCanvas(QGraphicsView):
             self.vertex_count += 1
             label = str(self.vertex_count)
 
-        vertex = VertexItem(x, y, radius, label.strip())
-        self.scene.addItem(vertex)
+        vertex = VirtualVertex(x, y, radius, label.strip())
+        self.virtualizer.add_vertex(vertex)
 
         # Update matrices
         self.matrices.add_vertex(vertex)
@@ -258,37 +351,14 @@ class GraphCanvas(QGraphicsView):
         is_curvy = directed and any(s == target and t == source for s, t, _, _ in self.edges)
 
         #Creer une ligne entre les deux sommets
-        edge = EdgeItem (source, target, radius=source.radius, directed=directed, is_curvy=is_curvy)
-        self.scene.addItem(edge)
+        text = weight if weight.strip() else None
+        edge = VirtualEdge(source, target, radius=source.radius, directed=directed, is_curvy=is_curvy, text=text)
+        self.virtualizer.add_edge(edge)
         #update les voisins
         if target not in source.voisins:
             source.voisins.append(target)
         if source not in target.voisins:
-            target.voisins.append(source)       
-        # Ajouter le poids text
-        if weight.strip():
-            p1 = source.sceneBoundingRect().center()
-            p2 = target.sceneBoundingRect().center()
-            if source == target:
-                # position weight text for self-loops
-                loop_radius = source.radius + 10  # Adjust the radius to start outside the vertex
-                mx, my = p1.x() + loop_radius, p1.y() - loop_radius - 10  # Adjust position above the loop
-            elif is_curvy:
-                control_x = (p1.x() + p2.x()) / 2 + 40
-                control_y = (p1.y() + p2.y()) / 2 - 40
-                mx, my = control_x, control_y - 10            
-            else:
-                # Position weight text for regular edges
-                mx, my = (p1.x() + p2.x()) / 2, (p1.y() + p2.y()) / 2 - 10  # Adjust position above the line
-
-            # Create the text item
-            text = QGraphicsTextItem(weight)
-            text.setDefaultTextColor(Qt.red)
-            text.setZValue(2)  # Ensure text is above the line
-            text.setPos(mx - text.boundingRect().width() / 2, my - text.boundingRect().height() / 2)
-            self.scene.addItem(text)
-        else:
-            text = None
+            target.voisins.append(source)
 
         # Store the edge information
         self.edges.append((source, target, edge, text))
@@ -310,30 +380,20 @@ class GraphCanvas(QGraphicsView):
 
     def update_edges(self, moved_vertex):
         """Update the positions of edges connected to the moved vertex."""
-        for source, target, edge, text in self.edges:
-            if source == moved_vertex or target == moved_vertex:
-                edge.update_path()  # Update the edge path
-            if text:
-                # Update the position of the weight text
-                p1 = source.sceneBoundingRect().center()
-                p2 = target.sceneBoundingRect().center()
-                if source == target:
-                    # Update weight text for self-loops
-                    loop_radius = source.radius + 10
-                    mx, my = p1.x() + loop_radius, p1.y() - loop_radius - 10
-                elif edge.is_curvy:
-                    # Update weight text for curvy edges
-                    control_x = (p1.x() + p2.x()) / 2 + 40
-                    control_y = (p1.y() + p2.y()) / 2 - 40
-                    mx, my = control_x, control_y - 10        
-                else:
-                    # Update weight text for regular edges
-                    mx, my = (p1.x() + p2.x()) / 2, (p1.y() + p2.y()) / 2 - 10
-                text.setPos(mx - text.boundingRect().width() / 2, my - text.boundingRect().height() / 2)              
+        self.virtualizer.vertex_moved(moved_vertex)
+        # Only the displayed edges have a path to update (graph edges or community bundles)
+        for edge in self.virtualizer.active_edges:
+            if edge.source == moved_vertex or edge.target == moved_vertex:
+                edge.update_path()  # Update the edge path and its weight text
+        # Edges of the moved vertex may now cross the viewport
+        self.virtualizer.schedule_refresh()
+        if moved_vertex in self.matrices.vertex_indices:
+            self.vertex_moved.emit(moved_vertex)
 
     def reset_graph(self):
         """Reset the graph and Clear the canvas."""
         self.scene.clear() # Clear the scene
+        self.virtualizer.reset() # Forget the pooled items
         self.edges = [] # Reset the edges list 
         self.vertex_count = 0 #Reset the vertex counter
         self.selected_vertex = None # Reset the selected vertex
@@ -342,16 +402,25 @@ class GraphCanvas(QGraphicsView):
         # Reset matrices
         self.matrices.reset()
 
-        for item in self.scene.items():
-            if isinstance(item, VertexItem):
-                item.successors = []
-                item.predecessors = []
-                item.voisins = []
-
         print("[Canvas] Graph cleared and reset.")
 
     def clear(self):
         self.scene.clear()
+        self.virtualizer.reset()
+
+    def scrollContentsBy(self, dx, dy):
+        """Panning changes what is visible: rebind the pooled items."""
+        super().scrollContentsBy(dx, dy)
+        self.virtualizer.schedule_refresh()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.virtualizer.schedule_refresh()
+
+    def setTransform(self, transform, combine=False):
+        """Zooming changes what is visible: rebind the pooled items."""
+        super().setTransform(transform, combine)
+        self.virtualizer.schedule_refresh()
 
     def wheelEvent(self, event):
         """Handle mouse wheel events for zooming."""
@@ -456,7 +525,7 @@ class GraphCanvas(QGraphicsView):
         self.remove_vertex_edges(vertex)
         
         # Remove the vertex from the scene
-        self.scene.removeItem(vertex)
+        self.virtualizer.remove_vertex(vertex)
         
         # Update matrices
         self.matrices.remove_vertex(vertex)
@@ -472,8 +541,8 @@ class GraphCanvas(QGraphicsView):
 
     def add_vertex_from_matrix(self, x, y, label):
         """Add a vertex from matrix import with specific position and label."""
-        vertex = VertexItem(x, y, 20, label)
-        self.scene.addItem(vertex)
+        vertex = VirtualVertex(x, y, 20, label)
+        self.virtualizer.add_vertex(vertex)
         
         # Update matrices
         self.matrices.add_vertex(vertex)
@@ -486,9 +555,10 @@ class GraphCanvas(QGraphicsView):
         # Check if a directed edge already exists in the opposite direction
         is_curvy = directed and any(s == target and t == source for s, t, _, _ in self.edges)
 
-        # Create the edge
-        edge = EdgeItem(source, target, radius=source.radius, directed=directed, is_curvy=is_curvy)
-        self.scene.addItem(edge)
+        # Create the edge (weight text only shown if it's not 1)
+        text = str(weight) if weight != 1 else None
+        edge = VirtualEdge(source, target, radius=source.radius, directed=directed, is_curvy=is_curvy, text=text)
+        self.virtualizer.add_edge(edge)
         
         # Update neighbors
         if target not in source.voisins:
@@ -496,30 +566,6 @@ class GraphCanvas(QGraphicsView):
         if source not in target.voisins:
             target.voisins.append(source)
         
-        # Add weight text
-        text = None
-        if weight != 1:  # Only show weight if it's not 1
-            p1 = source.sceneBoundingRect().center()
-            p2 = target.sceneBoundingRect().center()
-            if source == target:
-                # Position weight text for self-loops
-                loop_radius = source.radius + 10
-                mx, my = p1.x() + loop_radius, p1.y() - loop_radius - 10
-            elif is_curvy:
-                control_x = (p1.x() + p2.x()) / 2 + 40
-                control_y = (p1.y() + p2.y()) / 2 - 40
-                mx, my = control_x, control_y - 10
-            else:
-                # Position weight text for regular edges
-                mx, my = (p1.x() + p2.x()) / 2, (p1.y() + p2.y()) / 2 - 10
-
-            # Create the text item
-            text = QGraphicsTextItem(str(weight))
-            text.setDefaultTextColor(Qt.red)
-            text.setZValue(2)
-            text.setPos(mx - text.boundingRect().width() / 2, my - text.boundingRect().height() / 2)
-            self.scene.addItem(text)
-
         # Store the edge information
         self.edges.append((source, target, edge, text))
         
@@ -528,4 +574,122 @@ class GraphCanvas(QGraphicsView):
         
         print(f"[Canvas] Arête créée depuis matrice entre {source.label} et {target.label}, poids = {weight}, orientée = {directed}")
 
+    def set_vertex_positions(self, x, y, final=True):
+        """
+        Move every vertex at once (layouts). x and y follow the order of
+        self.matrices.vertices. final=False marks an intermediate frame of
+        a running layout: vertices_moved is only emitted for final ones.
+        """
+        x = np.array(x, dtype=float)
+        y = np.array(y, dtype=float)
+        for vertex, vx, vy in zip(self.matrices.vertices, x.tolist(), y.tolist()):
+            vertex.x = vx
+            vertex.y = vy
+        self.virtualizer.positions_changed(x, y)
+        if final:
+            self.vertices_moved.emit(x, y)
+
+    def fit_graph(self):
+        """Zoom and scroll so that the whole graph is visible."""
+        vertices = self.matrices.vertices
+        if not vertices:
+            return
+        xs = [vertex.x for vertex in vertices]
+        ys = [vertex.y for vertex in vertices]
+        rect = QRectF(min(xs), min(ys), max(xs) - min(xs), max(ys) - min(ys)).adjusted(-50, -50, 50, 50)
+        view = self.viewport().rect()
+        self.scale_factor = max(self.min_scale, min(1.0, view.width() / rect.width(), view.height() / rect.height()))
+        self.setTransform(QTransform().scale(self.scale_factor, self.scale_factor))
+        self.centerOn(rect.center())
+
+    def set_edge_weight(self, edge, weight):
+        """Change the weight of an edge (VirtualEdge) and its displayed text."""
+        index = next((i for i, (s, t, _, d) in enumerate(self.matrices.edges)
+                      if s is edge.source and t is edge.target and d == edge.directed), None)
+        if index is None:
+            return
+        edge.text = str(weight) if weight != 1 else None
+        self.edges = [(s, t, e, edge.text if e is edge else text) for s, t, e, text in self.edges]
+        if edge.item is not None:
+            edge.item.bind(edge)  # Refresh the weight text
+        self.matrices.set_edge_weight(index, weight)
+        print(f"[Canvas] Poids de l'arête {edge.source.label} - {edge.target.label} : {weight}")
+
+    def add_vertices_bulk(self, positions, labels):
+        """
+        Add many vertices at once (imports): one virtualizer refresh and
+        one matrix notification instead of one per vertex.
+
+        Args:
+            positions: (n, 2) array-like of x, y
+            labels: n vertex labels
+
+        Returns:
+            The new VirtualVertex objects, in order
+        """
+        positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+        vertices = [VirtualVertex(x, y, 20, label) for (x, y), label in zip(positions.tolist(), labels)]
+        self.virtualizer.add_vertices(vertices)
+        self.matrices.add_vertices_bulk(vertices)
+        print(f"[Canvas] {len(vertices)} sommets ajoutés depuis matrice")
+        return vertices
+
+    def curvy_edges(self, src, dst, directed):
+        """
+        is_curvy flags of new edges (vertex indices): a directed edge is
+        curved when the reverse edge already exists on the canvas or comes
+        earlier in the list, as in create_edge_from_matrix().
+        """
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        directed = np.asarray(directed, dtype=bool)
+        if len(src) == 0 or not directed.any():
+            return np.zeros(len(src), dtype=bool)
+        n = len(self.matrices.vertices)
+        keys = src * n + dst
+        reverse = dst * n + src
+        index = self.matrices.vertex_indices
+        existing = np.fromiter((index[s] * n + index[t] for s, t, _, _ in self.edges),
+                               dtype=np.int64, count=len(self.edges))
+        unique_keys, first = np.unique(keys, return_index=True)
+        position = np.minimum(np.searchsorted(unique_keys, reverse), len(unique_keys) - 1)
+        earlier = (unique_keys[position] == reverse) & (first[position] < np.arange(len(keys)))
+        return directed & (earlier | np.isin(reverse, existing))
+
+    def add_edges_bulk(self, src, dst, weight, directed, is_curvy=None):
+        """
+        Add many edges at once (imports), same result as calling
+        create_edge_from_matrix() for each of them in order. Edges are
+        given as vertex indices (order of self.matrices.vertices) and are
+        not checked for duplicates.
+
+        Args:
+            src, dst: Source and target vertex indices
+            weight: Edge weights
+            directed: Per-edge directedness
+            is_curvy: Precomputed curvy_edges() flags, for a list added
+                in several batches
+        """
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        weight = np.asarray(weight, dtype=float)
+        directed = np.asarray(directed, dtype=bool)
+        if len(src) == 0:
+            return
+        if is_curvy is None:
+            is_curvy = self.curvy_edges(src, dst, directed)
+        vertices = self.matrices.vertices
+
+        new_edges = []
+        for s, t, w, d, c in zip(src.tolist(), dst.tolist(), weight.tolist(), directed.tolist(), is_curvy.tolist()):
+            source, target = vertices[s], vertices[t]
+            # Weight text only shown if it's not 1
+            text = str(w) if w != 1 else None
+            edge = VirtualEdge(source, target, radius=source.radius, directed=d, is_curvy=c, text=text)
+            new_edges.append(edge)
+            self.edges.append((source, target, edge, text))
+        self.virtualizer.add_edges(new_edges)
+        self.matrices.add_edges_bulk(src, dst, weight, directed)
+        print(f"[Canvas] {len(new_edges)} arêtes créées depuis matrice")
+
 
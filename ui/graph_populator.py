@@ -0,0 +1,83 @@
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+import time
+import numpy as np
+
+
+class GraphPopulator(QObject):
+    """
+    Adds the vertices and edges of a GraphData to the canvas on the GUI
+    thread with the canvas bulk API, batch after batch for a few
+    milliseconds at a time, so the window keeps repainting and the
+    progress dialog's Cancel button stays usable.
+    """
+    SLICE_MS = 15
+    # Items per bulk call; the clock is checked between batches
+    VERTEX_BATCH = 5000
+    EDGE_BATCH = 5000
+
+    # Vertices created, edges created
+    progress = pyqtSignal(int, int)
+    # True when everything was added, False when cancelled
+    finished = pyqtSignal(bool)
+
+    def __init__(self, canvas, data, parent=None):
+        super().__init__(parent)
+        self.canvas = canvas
+        self.data = data
+        self.vertices = []
+        self.next_edge = 0
+        self.first_vertex = 0  # Index du premier sommet importé dans le canevas
+        self.is_curvy = None
+        self.timer = QTimer(self)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self.step)
+
+    def is_done(self):
+        return len(self.vertices) == self.data.vertex_count and self.next_edge == self.data.edge_count
+
+    def start(self):
+        self.timer.start()
+
+    def cancel(self):
+        if self.timer.isActive():
+            self.timer.stop()
+            self.finished.emit(False)
+
+    def run_all(self):
+        """Populate synchronously (no time slicing)."""
+        while not self.is_done():
+            self.add_items(None)
+
+    def step(self):
+        self.add_items(time.perf_counter() + self.SLICE_MS / 1000)
+        self.progress.emit(len(self.vertices), self.next_edge)
+        if self.is_done():
+            self.timer.stop()
+            self.finished.emit(True)
+
+    def add_items(self, deadline):
+        """Add items until the deadline (or everything when deadline is None)."""
+        data = self.data
+        with self.canvas.bulk_update():
+            if not self.vertices:
+                self.first_vertex = len(self.canvas.matrices.vertices)
+            while len(self.vertices) < data.vertex_count:
+                start = len(self.vertices)
+                end = min(start + self.VERTEX_BATCH, data.vertex_count)
+                positions = np.column_stack([data.x[start:end], data.y[start:end]])
+                self.vertices.extend(self.canvas.add_vertices_bulk(positions, data.labels[start:end]))
+                if deadline is not None and time.perf_counter() > deadline:
+                    return
+            if self.is_curvy is None and data.edge_count:
+                # Computed once for the whole list, not per batch
+                self.is_curvy = self.canvas.curvy_edges(
+                    self.first_vertex + data.src, self.first_vertex + data.dst, data.directed)
+            while self.next_edge < data.edge_count:
+                start = self.next_edge
+                end = min(start + self.EDGE_BATCH, data.edge_count)
+                self.canvas.add_edges_bulk(
+                    self.first_vertex + data.src[start:end], self.first_vertex + data.dst[start:end],
+                    data.weight[start:end], data.directed[start:end], self.is_curvy[start:end])
+                self.next_edge = end
+                if deadline is not None and time.perf_counter() > deadline:
+                    return
@@ -0,0 +1,113 @@
+from PyQt5.QtWidgets import QProgressDialog, QMessageBox
+from PyQt5.QtCore import QObject, Qt, pyqtSignal
+from ui.graph_populator import GraphPopulator
+
+
+class GraphImportController(QObject):
+    """
+    Runs an import: the worker thread reads the file into a GraphData,
+    then a GraphPopulator adds it to the canvas in time slices, with one
+    progress dialog and Cancel button for both phases.
+    """
+    started = pyqtSignal()
+    # True when the graph was fully imported
+    finished = pyqtSignal(bool)
+
+    def __init__(self, canvas, parent_widget):
+        super().__init__(parent_widget)
+        self.canvas = canvas
+        self.parent_widget = parent_widget
+        self.worker = None
+        self.populator = None
+        self.progress_dialog = None
+        self.name = ""
+
+    def is_busy(self):
+        return self.progress_dialog is not None
+
+    def start(self, worker, name):
+        """Run an import worker; ignored if an import is already running."""
+        if self.is_busy():
+            return False
+        self.name = name
+        self.progress_dialog = QProgressDialog("Lecture du fichier...", "Annuler", 0, 100, self.parent_widget)
+        self.progress_dialog.setWindowTitle("Importation")
+        self.progress_dialog.setWindowModality(Qt.WindowModal)
+        self.progress_dialog.setAutoClose(False)
+        self.progress_dialog.setAutoReset(False)
+        self.progress_dialog.setMinimumDuration(0)
+        self.progress_dialog.canceled.connect(self.cancel)
+
+        self.worker = worker
+        worker.progress.connect(self.on_worker_progress)
+        worker.loaded.connect(self.on_worker_loaded)
+        worker.failed.connect(self.on_worker_failed)
+        worker.cancelled.connect(lambda: self.finish(None))
+        self.started.emit()
+        worker.start()
+        return True
+
+    def on_worker_progress(self, text, percent):
+        if self.progress_dialog is not None:
+            self.progress_dialog.setLabelText(text)
+            self.progress_dialog.setValue(percent)
+
+    def on_worker_loaded(self, data):
+        """The worker is done: populate the canvas from the GUI thread."""
+        if self.worker.cancel_requested:
+            self.finish(None)
+            return
+        self.worker.wait()
+        self.worker = None
+        # Clear existing graph
+        self.canvas.reset_graph()
+        self.progress_dialog.setRange(0, max(1, data.vertex_count + data.edge_count))
+        self.progress_dialog.setValue(0)
+        self.populator = GraphPopulator(self.canvas, data, self)
+        self.populator.progress.connect(
+            lambda vertices, edges: self.on_populate_progress(data, vertices, edges))
+        self.populator.finished.connect(lambda completed: self.on_populate_finished(data, completed))
+        self.populator.start()
+
+    def on_populate_progress(self, data, vertices, edges):
+        if self.progress_dialog is not None:
+            self.progress_dialog.setLabelText(
+                f"Sommets : {vertices}/{data.vertex_count}, arêtes : {edges}/{data.edge_count}")
+            self.progress_dialog.setValue(vertices + edges)
+
+    def on_populate_finished(self, data, completed):
+        self.populator = None
+        if not completed:
+            # Pas de graphe à moitié importé
+            self.canvas.reset_graph()
+        elif data.distance is not None:
+            self.canvas.matrices.set_distance_matrix(data.distance)
+        self.finish(f"Grapg creer avec success par {self.name}" if completed else None)
+
+    def on_worker_failed(self, message):
+        self.finish(None)
+        QMessageBox.critical(
+            self.parent_widget, 
+            "Error", 
+            f"Failed to import file: {message}"
+        )
+
+    def cancel(self):
+        """Cancel button of the progress dialog."""
+        if self.worker is not None:
+            self.worker.cancel()
+        elif self.populator is not None:
+            self.populator.cancel()
+
+    def finish(self, message):
+        """Close the progress dialog; message is shown on success."""
+        if self.worker is not None:
+            self.worker.wait()
+            self.worker = None
+        if self.progress_dialog is not None:
+            self.progress_dialog.canceled.disconnect(self.cancel)
+            self.progress_dialog.close()
+            self.progress_dialog = None
+        self.finished.emit(message is not None)
+        if message:
+            QMessageBox.information(self.parent_widget, "Success", message)
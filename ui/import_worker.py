@@ -0,0 +1,52 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+import os
+from core.formats import load_adjacency_file
+
+
+class ImportCancelled(Exception):
+    """Raised inside the worker when the user cancels the import."""
+
+
+class MatrixImportWorker(QThread):
+    """
+    Parses and validates a graph file and computes the graph arrays off
+    the GUI thread. Only the resulting GraphData crosses back; the scene
+    itself is populated by a GraphPopulator on the GUI thread.
+    """
+    # Phase description and percentage
+    progress = pyqtSignal(str, int)
+    # GraphData ready to be added to the canvas
+    loaded = pyqtSignal(object)
+    # Error message (not emitted on cancellation)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+    def __init__(self, file_path, loader=load_adjacency_file, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+        self.loader = loader  # loader(file_path, progress) -> GraphData
+        self.cancel_requested = False
+        self.file_size = 1
+
+    def cancel(self):
+        """Ask the worker to stop at the next progress check."""
+        self.cancel_requested = True
+
+    def check_cancelled(self):
+        if self.cancel_requested:
+            raise ImportCancelled()
+
+    def report_bytes(self, bytes_read):
+        self.check_cancelled()
+        self.progress.emit("Lecture du fichier...", min(100, bytes_read * 100 // self.file_size))
+
+    def run(self):
+        try:
+            self.file_size = max(1, os.path.getsize(self.file_path))
+            data = self.loader(self.file_path, progress=self.report_bytes)
+            self.check_cancelled()
+            self.loaded.emit(data)
+        except ImportCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            self.failed.emit(str(e))
@@ -0,0 +1,103 @@
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from ui.layout_worker import LayoutWorker
+
+
+class LayoutController(QObject):
+    """
+    Runs a layout in a LayoutWorker and applies its position frames to
+    the canvas, one batch per frame, so the graph can be watched while it
+    settles. Intermediate frames are not journaled; the positions the run
+    ends with are, as for an instant layout.
+
+    Adding or removing vertices or edges while the layout runs stops it:
+    its arrays no longer match the graph.
+    """
+    started = pyqtSignal()
+    # Fraction of the layout done (0-1)
+    progress = pyqtSignal(float)
+    # True when the layout ran to the end
+    finished = pyqtSignal(bool)
+
+    def __init__(self, canvas, parent=None):
+        super().__init__(parent)
+        self.canvas = canvas
+        self.worker = None
+        self.fitted = False
+
+    def is_running(self):
+        return self.worker is not None
+
+    def start(self, layout):
+        """Run a layout object (core.layout.start_layout); ignored if one is running."""
+        if self.is_running():
+            return False
+        self.worker = LayoutWorker(layout, self)
+        self.worker.frame_ready.connect(self.on_frame)
+        self.worker.done.connect(self.on_done)
+        self.worker.failed.connect(self.on_failed)
+        self.fitted = False
+        self.canvas.matrices.subscribe(self.on_graph_changed)
+        self.started.emit()
+        self.worker.start()
+        return True
+
+    def set_paused(self, paused):
+        if self.worker is not None:
+            self.worker.set_paused(paused)
+
+    def stop(self):
+        """Stop the layout; the positions reached are kept."""
+        if self.worker is not None:
+            self.worker.stop()
+
+    def on_frame(self, progress):
+        if self.worker is None:
+            return
+        frame = self.worker.take_frame()
+        if frame is None:
+            return
+        self.canvas.set_vertex_positions(*frame, final=False)
+        if not self.fitted:
+            self.canvas.fit_graph()
+            self.fitted = True
+        self.progress.emit(progress)
+
+    def on_done(self, completed):
+        if self.worker is None:
+            return
+        worker = self.finish()
+        self.canvas.set_vertex_positions(worker.layout.x, worker.layout.y)
+        self.canvas.fit_graph()
+        self.progress.emit(worker.layout.progress)
+        self.finished.emit(completed)
+
+    def on_failed(self, message):
+        if self.worker is None:
+            return
+        self.finish()
+        self.commit_positions()
+        print(f"[Layout] Échec de la disposition : {message}")
+        self.finished.emit(False)
+
+    def on_graph_changed(self, event, details):
+        if self.worker is None:
+            return
+        self.worker.stop()
+        self.worker.done.disconnect(self.on_done)
+        self.finish()
+        print("[Layout] Disposition interrompue : le graphe a changé")
+        # After the mutation in progress: journal the positions of the frames applied so far
+        QTimer.singleShot(0, self.commit_positions)
+        self.finished.emit(False)
+
+    def commit_positions(self):
+        """Re-apply the current model positions as final ones (journaled)."""
+        vertices = self.canvas.matrices.vertices
+        self.canvas.set_vertex_positions([vertex.x for vertex in vertices], [vertex.y for vertex in vertices])
+
+    def finish(self):
+        """Wait for the worker and stop listening; returns the worker."""
+        worker, self.worker = self.worker, None
+        worker.wait()
+        self.canvas.matrices.unsubscribe(self.on_graph_changed)
+        return worker
@@ -0,0 +1,59 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+import time
+
+
+class LayoutWorker(QThread):
+    """
+    Steps a layout (see core.layout.start_layout) off the GUI thread.
+
+    At most FRAME_INTERVAL apart, a copy of the positions is posted with
+    frame_ready, and no new one is posted until the GUI has taken it with
+    take_frame(): a slow GUI skips frames instead of queueing them. The
+    run can be paused, resumed and stopped at any iteration.
+    """
+    FRAME_INTERVAL = 0.05  # ~20 images par seconde
+
+    # Fraction of the layout done (0-1)
+    frame_ready = pyqtSignal(float)
+    # True when the layout ran to the end, False when stopped
+    done = pyqtSignal(bool)
+    failed = pyqtSignal(str)
+
+    def __init__(self, layout, parent=None):
+        super().__init__(parent)
+        self.layout = layout
+        self.stop_requested = False
+        self.paused = False
+        self.frame = None  # (x, y) not yet taken by the GUI
+
+    def stop(self):
+        """Stop after the current iteration; the positions reached are kept."""
+        self.stop_requested = True
+
+    def set_paused(self, paused):
+        self.paused = paused
+
+    def take_frame(self):
+        """The last posted (x, y) copies, or None; allows the next frame."""
+        frame, self.frame = self.frame, None
+        return frame
+
+    def post_frame(self):
+        if self.frame is None:
+            self.frame = (self.layout.x.copy(), self.layout.y.copy())
+            self.frame_ready.emit(self.layout.progress)
+
+    def run(self):
+        last_frame = 0.0
+        try:
+            while not self.layout.done and not self.stop_requested:
+                if self.paused:
+                    self.msleep(50)
+                    continue
+                self.layout.step()
+                if time.monotonic() - last_frame >= self.FRAME_INTERVAL:
+                    self.post_frame()
+                    last_frame = time.monotonic()
+            self.done.emit(self.layout.done)
+        except Exception as e:
+            self.failed.emit(str(e))
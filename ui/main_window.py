@@ -1,18 +1,35 @@
 from PyQt5.QtWidgets import (
     QMainWindow, QToolBar, QAction, QVBoxLayout, QHBoxLayout, QWidget, QPushButton,
-    QLabel, QComboBox, QMessageBox, QDialog, QInputDialog, QMenu
+    QLabel, QComboBox, QMessageBox, QDialog, QInputDialog, QMenu, QDockWidget, QFileDialog
 )
 from PyQt5.QtGui import QIcon, QColor
-from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtCore import Qt, QSize, QTimer
+import os
 from ui.toolbar import ToolBar
 from ui.graph_canvas import GraphCanvas
 from ui.matrix_dialog import MatrixDialog
+from ui.import_controller import GraphImportController
+from ui.import_worker import MatrixImportWorker
+from ui.autosave import AutosaveJournal
+from ui.layout_controller import LayoutController
+from ui.community_view import CommunityView
+from ui.focus_view import FocusView
+from ui.weight_filter import WeightFilter
+from ui.render_profiles import RENDER_PROFILES
 from core.matrices import GraphMatrices
+from core.formats import GraphData, export_filters, exporter_for, file_filters, importer_for
+from core.formats import table_filters, table_format_for, write_records
+from core.formats.project import save_project, load_project, DISTANCE_CACHE_LIMIT
+from core.formats.journal import recover_journal
+from core.layout import start_layout
 from core.algorithms.traversal.bfs import run_bfs
 from core.algorithms.traversal.dfs import run_dfs
-from core.algorithms.coloring.greedy_coloring import run_greedy_coloring
+from core.algorithms.coloring.greedy_coloring import run_greedy_coloring, coloring_table
 from core.algorithms.coloring.welsh_powell import run_welsh_powell
 from core.algorithms.shortest_path.dijkstra import run_dijkstra
+from core.algorithms.shortest_path.astar import run_astar
+from core.algorithms.shortest_path.bidirectional_dijkstra import run_bidirectional_dijkstra
+from core.algorithms.shortest_path.shortest_path_tree import ShortestPathTree
 from core.algorithms.shortest_path.bellman_ford import run_bellman_ford
 from core.algorithms.mst.prim import run_prim
 from core.algorithms.mst.kruskal import run_kruskal
@@ -31,6 +48,12 @@ class MainWindow(QMainWindow):
         # Créer les widgets
         self.toolbar = ToolBar()
         self.canvas = GraphCanvas(self)
+        self.matrix_dock = None  # Created the first time the matrices are shown
+        self.importer = GraphImportController(self.canvas, self)
+        # Callable returning the (fields, rows) of the last algorithm run, or None
+        self.last_result = None
+        # Journal of the graph edits, replayed after a crash
+        self.autosave = AutosaveJournal(self.canvas, parent=self)
 
         # Connecter les boutons à la méthode de changement de mode
         self.toolbar.default_btn.clicked.connect(lambda: self.set_mode("DEFAULT"))
@@ -46,12 +69,62 @@ class MainWindow(QMainWindow):
         # Connect matrices button
         self.toolbar.matrices_btn.clicked.connect(self.show_matrices)
 
+        # Project files
+        self.toolbar.save_btn.clicked.connect(self.save_graph)
+        self.toolbar.open_btn.clicked.connect(self.open_graph)
+
+        # Automatic layout of the current graph, run in a worker thread
+        self.layout_runner = LayoutController(self.canvas, self)
+        self.toolbar.layout_btn.clicked.connect(self.apply_layout)
+        self.toolbar.layout_pause_btn.toggled.connect(self.layout_runner.set_paused)
+        self.toolbar.layout_stop_btn.clicked.connect(self.layout_runner.stop)
+        self.layout_runner.started.connect(lambda: self.toolbar.set_layout_running(True))
+        self.layout_runner.finished.connect(lambda completed: self.toolbar.set_layout_running(False))
+        self.layout_runner.progress.connect(self.toolbar.show_layout_progress)
+
+        # Communities collapsed into super-vertices, expanded by double-click
+        self.communities = CommunityView(self.canvas, self)
+        self.toolbar.communities_btn.clicked.connect(self.collapse_communities)
+        self.toolbar.communities_all_btn.clicked.connect(self.communities.show_all)
+        self.communities.found.connect(self.toolbar.show_communities)
+        self.communities.active_changed.connect(self.toolbar.set_communities_active)
+        self.canvas.vertex_double_clicked.connect(self.communities.expand)
+
+        # k-hop neighbourhood of the clicked vertex (FOCUS mode)
+        self.focus = FocusView(self.canvas, self.toolbar.focus_depth.value(), self)
+        self.toolbar.focus_btn.clicked.connect(lambda: self.set_mode("FOCUS"))
+        self.toolbar.focus_depth.valueChanged.connect(self.focus.set_depth)
+        self.toolbar.focus_all_btn.clicked.connect(self.focus.show_all)
+        self.focus.focused.connect(self.toolbar.show_focus)
+        self.focus.active_changed.connect(self.toolbar.set_focus_active)
+        self.canvas.vertex_clicked.connect(self.on_vertex_clicked)
+
+        # Shortest paths from one source, re-targeted by hovering
+        self.path_tree = ShortestPathTree(self.canvas)
+        self.canvas.vertex_hovered.connect(self.path_tree.on_vertex_hovered)
+
+        # Edges shown only within a weight band
+        self.weight_filter = WeightFilter(self.canvas, self)
+        self.toolbar.filter_enabled.toggled.connect(self.update_weight_filter)
+        self.toolbar.filter_low.valueChanged.connect(self.update_weight_filter)
+        self.toolbar.filter_high.valueChanged.connect(self.update_weight_filter)
+        self.weight_filter.changed.connect(self.toolbar.show_weight_filter)
+        self.weight_filter.cleared.connect(self.toolbar.reset_weight_filter)
+
+        # Rendering profile selection and report
+        self.toolbar.render_profile.currentIndexChanged.connect(
+            lambda: self.canvas.set_render_profile_mode(self.toolbar.get_render_profile_mode()))
+        self.canvas.render_profile_changed.connect(
+            lambda name: self.toolbar.show_render_profile(RENDER_PROFILES[name]['label']))
+        self.toolbar.show_render_profile(RENDER_PROFILES[self.canvas.render_profile]['label'])
+
         # Connecter les boutons de la barre d'outils des algorithmes pour afficher les menus
         self.toolbar.algorithm_toolbar.traversal_btn.clicked.connect(self.show_traversal_algorithms)
         self.toolbar.algorithm_toolbar.coloring_btn.clicked.connect(self.show_coloring_algorithms)
         self.toolbar.algorithm_toolbar.mst_btn.clicked.connect(self.show_mst_algorithms)
         self.toolbar.algorithm_toolbar.shortest_path_btn.clicked.connect(self.show_shortest_path_algorithms)
         self.toolbar.algorithm_toolbar.flow_btn.clicked.connect(self.show_flow_algorithms)
+        self.toolbar.algorithm_toolbar.export_result_btn.clicked.connect(self.export_result)
         self.toolbar.algorithm_toolbar.back_btn.clicked.connect(lambda: self.set_mode("DEFAULT"))
 
         # Layout principal
@@ -62,10 +135,47 @@ class MainWindow(QMainWindow):
         central_widget.setLayout(layout)
         self.setCentralWidget(central_widget)
 
+        # Once the window is shown
+        QTimer.singleShot(0, self.offer_recovery)
+
+    def offer_recovery(self):
+        """Offer to recover the graph of a session that did not close cleanly."""
+        if not self.autosave.has_recovery_data():
+            self.autosave.start()
+            return
+        answer = QMessageBox.question(
+            self, "Récupération",
+            "La session précédente ne s'est pas terminée correctement.\n"
+            "Récupérer le graphe enregistré automatiquement ?",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes)
+        if answer != QMessageBox.Yes:
+            self.autosave.discard_recovery_data()
+            self.autosave.start()
+            return
+        worker = MatrixImportWorker(self.autosave.directory, recover_journal)
+        # Recording starts once the old journal has been read
+        for signal in (worker.loaded, worker.failed, worker.cancelled):
+            signal.connect(lambda *args: self.autosave.start())
+        self.importer.start(worker, "la récupération de session")
+
+    def closeEvent(self, event):
+        self.layout_runner.stop()
+        if self.layout_runner.is_running():
+            self.layout_runner.finish()
+        if self.communities.is_running():
+            self.communities.finish()
+        self.autosave.close()
+        super().closeEvent(event)
+
     def set_mode(self, mode):
         """Set the current mode and update the UI."""
         self.current_mode = mode
         print(f"Mode actuel : {mode}")
+        if mode != "DEFAULT":
+            # Editing and algorithms work on the full graph
+            self.communities.show_all()
+            if mode != "FOCUS":
+                self.focus.show_all()
         self.canvas.set_mode(mode)
 
         if mode == "ALGORITHMS":
@@ -119,12 +229,24 @@ class MainWindow(QMainWindow):
         """Show shortest path algorithms menu."""
         menu = QMenu(self)
         dijkstra_action = menu.addAction("Dijkstra")
+        astar_action = menu.addAction("A*")
+        bidirectional_action = menu.addAction("Dijkstra bidirectionnel")
+        tree_action = menu.addAction("Arbre des plus courts chemins")
         bellman_ford_action = menu.addAction("Bellman-Ford")
         
         action = menu.exec_(self.sender().mapToGlobal(self.sender().rect().bottomLeft()))
         if action == dijkstra_action:
             self.canvas.set_mode("SHORTEST_PATH")
             self.run_algorithm("SHORTEST_PATH", "Dijkstra")
+        elif action == astar_action:
+            self.canvas.set_mode("SHORTEST_PATH")
+            self.run_algorithm("SHORTEST_PATH", "A*")
+        elif action == bidirectional_action:
+            self.canvas.set_mode("SHORTEST_PATH")
+            self.run_algorithm("SHORTEST_PATH", "Dijkstra bidirectionnel")
+        elif action == tree_action:
+            self.canvas.set_mode("PATH_TREE")
+            self.run_algorithm("SHORTEST_PATH", "Arbre des plus courts chemins")
         elif action == bellman_ford_action:
             self.canvas.set_mode("SHORTEST_PATH")
             self.run_algorithm("SHORTEST_PATH", "Bellman-Ford")
@@ -141,24 +263,36 @@ class MainWindow(QMainWindow):
 
     def run_algorithm(self, category: str, algorithm: str):
         """Run the selected algorithm."""
+        matrices = self.algorithm_matrices()
         if category == "TRAVERSAL":
             if not self.canvas.matrices.vertices:
                 QMessageBox.warning(self, "Erreur", "Aucun sommet dans le graphe.")
                 return
             if algorithm == "BFS":
-                self.bfs_animator = run_bfs(self.canvas.matrices, self.canvas)
+                self.bfs_animator = run_bfs(matrices, self.canvas)
             elif algorithm == "DFS":
-                self.dfs_animator = run_dfs(self.canvas.matrices, self.canvas)
+                self.dfs_animator = run_dfs(matrices, self.canvas)
         elif category == "COLORING":
             if algorithm == "Greedy Coloring":
-                run_greedy_coloring(self.canvas.matrices, self.canvas)
+                color_map = run_greedy_coloring(matrices, self.canvas)
             elif algorithm == "Welsh-Powell":
-                run_welsh_powell(self.canvas.matrices, self.canvas)
+                color_map = run_welsh_powell(matrices, self.canvas)
+            self.last_result = lambda: coloring_table(color_map)
         elif category == "SHORTEST_PATH":
             if algorithm == "Dijkstra":
-                self.dijkstra_animator = run_dijkstra(self.canvas.matrices, self.canvas)
+                self.dijkstra_animator = run_dijkstra(matrices, self.canvas)
+                self.set_last_result(self.dijkstra_animator)
+            elif algorithm == "A*":
+                self.astar_animator = run_astar(matrices, self.canvas)
+                self.set_last_result(self.astar_animator)
+            elif algorithm == "Dijkstra bidirectionnel":
+                self.bidirectional_animator = run_bidirectional_dijkstra(matrices, self.canvas)
+                self.set_last_result(self.bidirectional_animator)
+            elif algorithm == "Arbre des plus courts chemins":
+                if self.path_tree.start(matrices):
+                    self.set_last_result(self.path_tree)
             elif algorithm == "Bellman-Ford":
-                run_bellman_ford(self.canvas.matrices, self.canvas)
+                run_bellman_ford(matrices, self.canvas)
         elif category == "MST":
             # Vérifier si le graphe est non orienté pour les deux
             for edge in self.canvas.edges:
@@ -166,20 +300,128 @@ class MainWindow(QMainWindow):
                     QMessageBox.warning(self, "Erreur", "L'algorithme MST nécessite un graphe non orienté.")
                     return
             if algorithm == "Prim":
-                self.prim_animator = run_prim(self.canvas.matrices, self.canvas)
+                self.prim_animator = run_prim(matrices, self.canvas)
+                self.set_last_result(self.prim_animator)
             elif algorithm == "Kruskal":
-                self.kruskal_animator = run_kruskal(self.canvas.matrices, self.canvas)
+                self.kruskal_animator = run_kruskal(matrices, self.canvas)
+                self.set_last_result(self.kruskal_animator)
         elif category == "FLOW":
             if algorithm == "Ford-Fulkerson":
-                run_ford_fulkerson(self.canvas.matrices, self.canvas)
+                self.flow_animator = run_ford_fulkerson(matrices, self.canvas)
+                self.set_last_result(self.flow_animator)
+
+    def set_last_result(self, animator):
+        """Remember the algorithm whose result "Exporter le résultat" writes."""
+        self.last_result = animator.result_table if animator is not None else None
+
+    def export_result(self):
+        """Stream the result of the last algorithm run to CSV, TSV or JSON Lines."""
+        table = self.last_result() if self.last_result is not None else None
+        if table is None:
+            QMessageBox.information(self, "Export", "Aucun résultat d'algorithme à exporter (lancez un algorithme jusqu'au bout).")
+            return
+        file_path, name_filter = QFileDialog.getSaveFileName(
+            self, "Exporter le résultat", "", ";;".join(table_filters()))
+        if not file_path:
+            return
+        fmt, file_path = table_format_for(file_path, name_filter)
+        fields, rows = table
+        try:
+            write_records(file_path, fields, rows, fmt)
+        except OSError as e:
+            QMessageBox.critical(self, "Erreur", f"Export impossible : {e}")
+            return
+        print(f"[MainWindow] Résultat exporté dans {file_path}")
 
     def get_vertex_naming_mode(self):
         return self.toolbar.get_naming_mode()
 
     def show_matrices(self):
-        """Show the graph matrices dialog."""
-        dialog = MatrixDialog(self.canvas, self)
-        dialog.exec_()
+        """Show the graph matrices in a non-modal dock that follows the edits."""
+        if self.matrix_dock is None:
+            self.matrix_dock = QDockWidget("Graph Matrices", self)
+            view = MatrixDialog(self.canvas, self.matrix_dock, self.importer)
+            view.setWindowFlags(Qt.Widget)  # Embedded, not a top-level dialog
+            self.matrix_dock.setWidget(view)
+            self.addDockWidget(Qt.RightDockWidgetArea, self.matrix_dock)
+        self.matrix_dock.show()
+        self.matrix_dock.raise_()
+
+    def save_graph(self):
+        """Save the graph as a .npz project, or export it (GraphML, DOT)."""
+        file_path, name_filter = QFileDialog.getSaveFileName(
+            self, "Enregistrer le graphe", "", ";;".join(["Projet graphe (*.npz)"] + export_filters()))
+        if not file_path:
+            return
+        matrices = self.canvas.matrices
+        data = GraphData.from_matrices(matrices)
+        exporter = exporter_for(file_path, name_filter)
+        try:
+            if exporter is not None:
+                writer, file_path = exporter
+                writer(file_path, data)
+            else:
+                if not file_path.lower().endswith(".npz"):
+                    file_path += ".npz"
+                # The distance matrix is cached only while it stays reasonably small
+                distance = matrices.get_distance_matrix() if data.vertex_count <= DISTANCE_CACHE_LIMIT else None
+                save_project(file_path, data, distance)
+        except OSError as e:
+            QMessageBox.critical(self, "Erreur", f"Enregistrement impossible : {e}")
+            return
+        print(f"[MainWindow] Graphe enregistré dans {file_path}")
+
+    def open_graph(self):
+        """Open a .npz project saved by save_graph(), or any importable file."""
+        if self.importer.is_busy():
+            return
+        file_path, name_filter = QFileDialog.getOpenFileName(
+            self, "Ouvrir un graphe", "", ";;".join(["Projet graphe (*.npz)"] + file_filters()))
+        if not file_path:
+            return
+        if file_path.lower().endswith(".npz"):
+            loader = load_project
+        else:
+            loader = importer_for(file_path, name_filter)
+        self.importer.start(MatrixImportWorker(file_path, loader), os.path.basename(file_path))
+
+    def apply_layout(self):
+        """Start the layout selected in the toolbar on the current graph."""
+        if self.importer.is_busy() or self.layout_runner.is_running() or not self.canvas.matrices.vertices:
+            return
+        # The layout moves the graph vertices
+        self.communities.show_all()
+        self.focus.show_all()
+        data = GraphData.from_matrices(self.canvas.matrices)
+        self.layout_runner.start(start_layout(data, self.toolbar.get_layout_kind()))
+        print(f"[MainWindow] Disposition lancée sur {data.vertex_count} sommets")
+
+    def collapse_communities(self):
+        """Detect the communities of the graph and show each one as a single vertex."""
+        if self.importer.is_busy() or self.layout_runner.is_running():
+            return
+        self.set_mode("DEFAULT")
+        self.focus.show_all()
+        self.communities.collapse()
+
+    def update_weight_filter(self):
+        """Apply the weight band of the toolbar, or show every edge."""
+        if not self.toolbar.filter_enabled.isChecked():
+            self.weight_filter.clear()
+        elif self.canvas.matrices.edges:
+            self.weight_filter.set_quantiles(*self.toolbar.get_weight_band())
+
+    def algorithm_matrices(self):
+        """The graph the algorithms run on: the filtered view if asked for."""
+        if self.toolbar.filter_algorithms.isChecked():
+            return self.weight_filter.filtered_matrices()
+        return self.canvas.matrices
+
+    def on_vertex_clicked(self, vertex):
+        if self.current_mode == "FOCUS":
+            self.focus.focus(vertex)
+        elif self.canvas.mode == "PATH_TREE":
+            self.path_tree.on_vertex_clicked(vertex)
 
     def create_algorithm_toolbar(self):
         """Create the algorithm toolbar."""
@@ -1,15 +1,29 @@
 from PyQt5.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QTableWidget, QTableWidgetItem,
-    QPushButton, QLabel, QHeaderView, QFileDialog, QMessageBox
+    QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QTableView, QWidget,
+    QPushButton, QLabel, QHeaderView, QFileDialog, QMessageBox, QDockWidget
 )
-from PyQt5.QtCore import Qt
-import numpy as np
+from PyQt5.QtCore import Qt, QTimer
+from ui.matrix_table_model import MatrixTableModel
+from ui.matrix_heatmap import MatrixHeatmapTab
+from ui.import_worker import MatrixImportWorker
+from ui.import_controller import GraphImportController
+from core.formats import GraphData, parse_adjacency_file, file_filters, importer_for
+from core.formats import table_filters, table_format_for
 import os
+import numpy as np
 
 class MatrixDialog(QDialog):
-    """Dialog for displaying graph matrices."""
+    """
+    Non-modal view of the graph matrices. While shown it listens to the
+    GraphMatrices mutation events and only updates the rows, columns and
+    cells that changed; it can live in its own window or in a QDockWidget.
+    """
+
+    # Fixed cell size: nothing has to be measured, whatever the matrix size
+    COLUMN_WIDTH = 60
+    ROW_HEIGHT = 24
     
-    def __init__(self, canvas, parent=None):
+    def __init__(self, canvas, parent=None, importer=None):
         super().__init__(parent)
         self.canvas = canvas
         self.setWindowTitle("Graph Matrices")
@@ -20,8 +34,8 @@ class MatrixDialog(QDialog):
         
         # Add import button at the top
         import_layout = QHBoxLayout()
-        import_label = QLabel("Importation de matrice d'adjacence :")
-        self.import_button = QPushButton("Import TXT File")
+        import_label = QLabel("Importation (matrice d'adjacence, liste d'arêtes, Matrix Market, .npy) :")
+        self.import_button = QPushButton("Import File")
         self.import_button.clicked.connect(self.import_from_file)
         import_layout.addWidget(import_label)
         import_layout.addWidget(self.import_button)
@@ -31,18 +45,50 @@ class MatrixDialog(QDialog):
         # Create tab widget
         self.tab_widget = QTabWidget()
         
-        # Create tabs for each matrix
-        self.create_adjacency_tab()
-        self.create_incidence_tab()
-        self.create_distance_tab()
+        # Live table models of the built tabs (tab index -> MatrixTableModel)
+        self.models = {}
+        # Set while the dialog itself rebuilds the graph (import)
+        self.live_updates_suspended = False
+        # Background imports (shared with the main window when given)
+        self.importer = importer if importer is not None else GraphImportController(canvas, self)
+        self.importer.started.connect(self.on_import_started)
+        self.importer.finished.connect(self.on_import_finished)
+
+        # Create tabs for each matrix; their content is built when first shown
+        self.tab_builders = [
+            ("Adjacency Matrix", self.create_adjacency_tab),
+            ("Incidence Matrix", self.create_incidence_tab),
+            ("Distance Matrix", self.create_distance_tab),
+            ("Heatmap", self.create_heatmap_tab),
+        ]
+        self.built_tabs = set()
+        # Built tabs too costly to update on every edit, reloaded when shown again
+        self.stale_tabs = set()
+        self.distance_tab = [builder for _, builder in self.tab_builders].index(self.create_distance_tab)
+        for title, _ in self.tab_builders:
+            container = QWidget()
+            container.setLayout(QVBoxLayout())
+            container.layout().setContentsMargins(0, 0, 0, 0)
+            self.tab_widget.addTab(container, title)
+        self.tab_widget.currentChanged.connect(self.ensure_tab)
+
+        # Coalesces the graph edits into one distance matrix computation
+        self.distance_timer = QTimer(self)
+        self.distance_timer.setSingleShot(True)
+        self.distance_timer.setInterval(100)
+        self.distance_timer.timeout.connect(self.reload_distance_tab)
         
         # Add tab widget to layout
         layout.addWidget(self.tab_widget)
         
-        # Add close button
+        # Add export and close buttons
         button_layout = QHBoxLayout()
+        export_button = QPushButton("Export Matrix")
+        export_button.setToolTip("Exporter la matrice de l'onglet courant (CSV, TSV, JSON Lines)")
+        export_button.clicked.connect(self.export_current_matrix)
         close_button = QPushButton("Close")
-        close_button.clicked.connect(self.accept)
+        close_button.clicked.connect(self.close_view)
+        button_layout.addWidget(export_button)
         button_layout.addStretch()
         button_layout.addWidget(close_button)
         layout.addLayout(button_layout)
@@ -50,79 +96,61 @@ class MatrixDialog(QDialog):
         self.setLayout(layout)
     
     def import_from_file(self):
-        """Import adjacency matrix from a txt file and create the graph."""
+        """Import a graph file (adjacency matrix, edge list, Matrix Market, .npy) and create the graph."""
+        # Open file dialog
+        file_path, name_filter = QFileDialog.getOpenFileName(
+            self, 
+            "Selectionnez un fichier de graphe", 
+            "", 
+            ";;".join(file_filters() + ["All files (*)"])
+        )
+        
+        if not file_path or self.importer.is_busy():
+            return
+        loader = importer_for(file_path, name_filter)
+        self.importer.start(MatrixImportWorker(file_path, loader), os.path.basename(file_path))
+
+    def current_matrix_kind(self):
+        """Matrix shown by the current tab: "adjacency", "incidence" or "distance"."""
+        _, builder = self.tab_builders[self.tab_widget.currentIndex()]
+        if builder == self.create_heatmap_tab:
+            container = self.tab_widget.currentWidget().layout().itemAt(0)
+            return container.widget().source_combo.currentData() if container is not None else "adjacency"
+        return {
+            self.create_adjacency_tab: "adjacency",
+            self.create_incidence_tab: "incidence",
+            self.create_distance_tab: "distance",
+        }[builder]
+
+    def export_current_matrix(self):
+        """Stream the matrix of the current tab to CSV, TSV or JSON Lines."""
+        kind = self.current_matrix_kind()
+        file_path, name_filter = QFileDialog.getSaveFileName(
+            self, "Exporter la matrice", kind, ";;".join(table_filters()))
+        if not file_path:
+            return
+        fmt, file_path = table_format_for(file_path, name_filter)
         try:
-            # Open file dialog
-            file_path, _ = QFileDialog.getOpenFileName(
-                self, 
-                "Selectionnez matrice d'adjacence _ file", 
-                "", 
-                "Text files (*.txt);;All files (*)"
-            )
-            
-            if not file_path:
-                return
-            
-            # Read and parse the file
-            adjacency_matrix = self.parse_adjacency_file(file_path)
-            
-            if adjacency_matrix is not None:
-                # Create graph from adjacency matrix
-                self.create_graph_from_matrix(adjacency_matrix)
-                
-                # Refresh the dialog
-                self.refresh_matrices()
-                
-                QMessageBox.information(
-                    self, 
-                    "Success", 
-                    f"Grapg creer avec success par {os.path.basename(file_path)}"
-                )
-                
-        except Exception as e:
-            QMessageBox.critical(
-                self, 
-                "Error", 
-                f"Failed to import file: {str(e)}"
-            )
+            self.canvas.matrices.write_matrix(kind, file_path, fmt)
+        except OSError as e:
+            QMessageBox.critical(self, "Error", f"Export impossible : {e}")
+            return
+        print(f"[MatrixDialog] Matrice {kind} exportée dans {file_path}")
+
+    def on_import_started(self):
+        # One rebuild at the end instead of one update per vertex and edge
+        self.live_updates_suspended = True
+        self.import_button.setEnabled(False)
+
+    def on_import_finished(self, completed):
+        self.live_updates_suspended = False
+        self.import_button.setEnabled(True)
+        self.refresh_matrices()
     
     def parse_adjacency_file(self, file_path):
         """Parse adjacency matrix from txt file."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                lines = file.readlines()
-            
-            # Remove empty lines and strip whitespace
-            lines = [line.strip() for line in lines if line.strip()]
-            
-            if not lines:
-                raise ValueError("fichier vide!")
-            
-            # Parse the matrix
-            matrix = []
-            for line in lines:
-                # Split by whitespace and convert to float
-                row = []
-                for value in line.split():
-                    try:
-                        if value.lower() in ['inf', 'infinity', '∞']:
-                            row.append(float('inf'))
-                        elif value.lower() in ['0', '0.0']:
-                            row.append(0.0)
-                        else:
-                            row.append(float(value))
-                    except ValueError:
-                        raise ValueError(f"valeur invalide dans matrix: {value}")
-                matrix.append(row)
-            
-            # Check if matrix is square
-            n = len(matrix)
-            for i, row in enumerate(matrix):
-                if len(row) != n:
-                    raise ValueError(f"Matrix n'est pas un carree. ligne {i} a {len(row)} elements, expected {n}")
-            
-            return np.array(matrix)
-            
+            return parse_adjacency_file(file_path)
         except Exception as e:
             raise ValueError(f"Error parsing file: {str(e)}")
     
@@ -136,150 +164,234 @@ class MatrixDialog(QDialog):
             if n == 0:
                 return
             
-            # Create vertices
-            vertices = []
-            for i in range(n):
-                vertex = self.canvas.add_vertex_from_matrix(i * 100 + 50, 100 + (i % 3) * 100, str(i + 1))
-                vertices.append(vertex)
-            
-            # Create edges based on adjacency matrix
-            for i in range(n):
-                for j in range(n):
-                    weight = adjacency_matrix[i, j]
-                    if weight > 0 and not np.isinf(weight):
-                        # Check if edge already exists (for undirected graphs)
-                        if i != j:  # No self-loops for now
-                            # Determine if graph is directed by checking asymmetry
-                            is_directed = (adjacency_matrix[i, j] != adjacency_matrix[j, i])
-                            
-                            # Only create edge if it doesn't exist or if it's directed
-                            if is_directed or i < j:  # For undirected, only create once
-                                self.canvas.create_edge_from_matrix(
-                                    vertices[i], 
-                                    vertices[j], 
-                                    weight, 
-                                    is_directed
-                                )
+            # Edges from np.nonzero, directedness from A != A.T, then one
+            # bulk call each for vertices and edges
+            data = GraphData.from_adjacency(np.asarray(adjacency_matrix, dtype=float))
+            self.canvas.add_vertices_bulk(np.column_stack([data.x, data.y]), data.labels)
+            self.canvas.add_edges_bulk(data.src, data.dst, data.weight, data.directed)
             
             print(f"[MatrixDialog] Graph created with {n} vertices")
             
         except Exception as e:
             raise ValueError(f"Error creating graph: {str(e)}")
     
+    def close_view(self):
+        """Close the dialog, or the dock widget it is shown in."""
+        dock = self.parentWidget()
+        if isinstance(dock, QDockWidget):
+            dock.close()
+        else:
+            self.accept()
+
+    def showEvent(self, event):
+        # Matrices may have changed while hidden: resynchronise, then listen
+        super().showEvent(event)
+        self.canvas.matrices.subscribe(self.on_graph_changed)
+        self.refresh_matrices()
+
+    def hideEvent(self, event):
+        # A hidden view costs nothing, it is rebuilt when shown again
+        self.canvas.matrices.unsubscribe(self.on_graph_changed)
+        self.distance_timer.stop()
+        super().hideEvent(event)
+
     def refresh_matrices(self):
-        """Refresh all matrix tabs."""
-        self.tab_widget.clear()
-        self.create_adjacency_tab()
-        self.create_incidence_tab()
-        self.create_distance_tab()
-    
+        """Refresh all matrix tabs (only the visible one is rebuilt now)."""
+        for index in range(self.tab_widget.count()):
+            self.clear_tab(index)
+        self.ensure_tab(self.tab_widget.currentIndex())
+
+    def clear_tab(self, index):
+        """Drop the content of a tab; it is built again when shown."""
+        layout = self.tab_widget.widget(index).layout()
+        while layout.count():
+            widget = layout.takeAt(0).widget()
+            if widget is not None:
+                widget.deleteLater()
+        self.built_tabs.discard(index)
+        self.stale_tabs.discard(index)
+        self.models.pop(index, None)
+
+    def ensure_tab(self, index):
+        """Build the content of a tab the first time it is shown, reload it if stale."""
+        if index in self.stale_tabs:
+            self.stale_tabs.discard(index)
+            self.schedule_reload(index)
+        if index < 0 or index in self.built_tabs:
+            return
+        self.built_tabs.add(index)
+        _, builder = self.tab_builders[index]
+        widget = builder()
+        if isinstance(widget, QTableView):
+            self.models[index] = widget.model()
+        self.tab_widget.widget(index).layout().addWidget(widget)
+
+    def on_graph_changed(self, event, details):
+        """Apply one GraphMatrices mutation to the tabs that are built."""
+        if self.live_updates_suspended:
+            return
+        if event in ("reset", "bulk_added"):
+            self.refresh_matrices()
+            return
+        updaters = {
+            self.create_adjacency_tab: self.update_adjacency_model,
+            self.create_incidence_tab: self.update_incidence_model,
+        }
+        for index in sorted(self.built_tabs):
+            _, builder = self.tab_builders[index]
+            if builder not in updaters:
+                # Distance table and heatmap (Floyd-Warshall): reloaded after
+                # a burst of edits, and only while their tab is shown
+                if index == self.tab_widget.currentIndex():
+                    self.schedule_reload(index)
+                else:
+                    self.stale_tabs.add(index)
+                continue
+            model = self.models.get(index)
+            if model is None or not updaters[builder](model, event, details):
+                # Switching between "empty" message and data: rebuild the tab
+                self.clear_tab(index)
+                if index == self.tab_widget.currentIndex():
+                    self.ensure_tab(index)
+
+    def schedule_reload(self, index):
+        """Reload the distance table or the heatmap shortly."""
+        if index == self.distance_tab:
+            self.distance_timer.start()
+        else:
+            container = self.tab_widget.widget(index).layout().itemAt(0)
+            if container is not None:
+                container.widget().schedule_reload()
+
+    def reload_distance_tab(self):
+        """Swap the distance matrix of the built distance tab."""
+        index = self.distance_tab
+        if index not in self.built_tabs:
+            return
+        if index != self.tab_widget.currentIndex():
+            self.stale_tabs.add(index)
+            return
+        model = self.models.get(index)
+        matrix = self.canvas.get_distance_matrix()
+        if model is None or model.message is not None or len(matrix) == 0:
+            # Switching between "empty" message and data: rebuild the tab
+            self.clear_tab(index)
+            self.ensure_tab(index)
+            return
+        labels = self.canvas.get_vertex_labels()
+        if labels == model.row_labels:
+            model.set_matrix(matrix)
+        else:
+            model.reset(matrix, labels, labels)
+
+    def update_square_model(self, model, matrix, event, details):
+        """
+        Incremental update of a vertex x vertex model (adjacency).
+        Returns False when the tab has to be rebuilt instead.
+        """
+        if model.message is not None or len(matrix) == 0:
+            # Still empty: the message stays valid, otherwise rebuild
+            return model.message is not None and len(matrix) == 0
+        if event == "vertex_added":
+            index = details["index"]
+            label = self.canvas.get_vertex_labels()[index]
+            model.set_matrix(matrix, cells=[])
+            model.insert_row(index, label)
+            model.insert_column(index, label)
+        elif event == "vertex_removed":
+            model.remove_row(details["index"])
+            model.remove_column(details["index"])
+            model.set_matrix(matrix, cells=[])
+        elif event in ("edge_added", "edge_weight_changed"):
+            source, target = details["source"], details["target"]
+            model.set_matrix(matrix, cells=[(source, target), (target, source)])
+        elif event == "edges_removed":
+            model.set_matrix(matrix, cells=details["cells"])
+        return True
+
+    def update_adjacency_model(self, model, event, details):
+        return self.update_square_model(model, self.canvas.get_adjacency_matrix(), event, details)
+
+    def update_incidence_model(self, model, event, details):
+        """Incremental update of the vertex x edge model, False to rebuild."""
+        matrix = self.canvas.get_incidence_matrix()
+        if model.message is not None or len(matrix) == 0:
+            # Toujours aucun arc : le message reste valable
+            return model.message is not None and len(matrix) == 0
+        if event == "vertex_added":
+            index = details["index"]
+            model.set_matrix(matrix, cells=[])
+            model.insert_row(index, self.canvas.get_vertex_labels()[index])
+        elif event == "vertex_removed":
+            for column in sorted(details["edge_indices"], reverse=True):
+                model.remove_column(column)
+            model.remove_row(details["index"])
+            model.set_matrix(matrix, cells=[])
+        elif event == "edge_added":
+            index = details["index"]
+            model.set_matrix(matrix, cells=[])
+            model.insert_column(index, self.canvas.get_edge_labels()[index])
+        elif event == "edge_weight_changed":
+            # The incidence matrix does not hold the weights
+            model.set_matrix(matrix, cells=[])
+        elif event == "edges_removed":
+            for column in sorted(details["indices"], reverse=True):
+                model.remove_column(column)
+            model.set_matrix(matrix, cells=[])
+        return True
+
+    def create_table_view(self, model):
+        """Table view with fixed section sizes over a lazy matrix model."""
+        view = QTableView()
+        view.setModel(model)
+        view.setWordWrap(False)
+        horizontal = view.horizontalHeader()
+        vertical = view.verticalHeader()
+        horizontal.setSectionResizeMode(QHeaderView.Fixed)
+        vertical.setSectionResizeMode(QHeaderView.Fixed)
+        horizontal.setDefaultSectionSize(self.COLUMN_WIDTH)
+        vertical.setDefaultSectionSize(self.ROW_HEIGHT)
+        if model.message is not None:
+            horizontal.setStretchLastSection(True)
+        return view
+
     def create_adjacency_tab(self):
         """Create the adjacency matrix tab."""
-        tab = QTableWidget()
-        self.tab_widget.addTab(tab, "Adjacency Matrix")
-        
         # Get matrix data
         matrix = self.canvas.get_adjacency_matrix()
         vertex_labels = self.canvas.get_vertex_labels()
         
         if len(matrix) == 0:
-            tab.setRowCount(1)
-            tab.setColumnCount(1)
-            tab.setItem(0, 0, QTableWidgetItem("Pas de sommets dans le graph"))
-            return
-        
-        # Set up table
-        n = len(vertex_labels)
-        tab.setRowCount(n)
-        tab.setColumnCount(n)
-        
-        # Set headers
-        tab.setHorizontalHeaderLabels(vertex_labels)
-        tab.setVerticalHeaderLabels(vertex_labels)
-        
-        # Fill table with matrix values
-        for i in range(n):
-            for j in range(n):
-                value = matrix[i, j]
-                item = QTableWidgetItem(str(value))
-                item.setTextAlignment(Qt.AlignCenter)
-                tab.setItem(i, j, item)
+            return self.create_table_view(
+                MatrixTableModel(matrix, [], [], message="Pas de sommets dans le graph"))
         
-        # Resize columns to content
-        tab.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        return self.create_table_view(MatrixTableModel(matrix, vertex_labels, vertex_labels))
     
     def create_incidence_tab(self):
         """Create the incidence matrix tab."""
-        tab = QTableWidget()
-        self.tab_widget.addTab(tab, "Incidence Matrix")
-        
         # Get matrix data
         matrix = self.canvas.get_incidence_matrix()
         vertex_labels = self.canvas.get_vertex_labels()
         edge_labels = self.canvas.get_edge_labels()
         
         if len(matrix) == 0 or len(edge_labels) == 0:
-            tab.setRowCount(1)
-            tab.setColumnCount(1)
-            tab.setItem(0, 0, QTableWidgetItem("pas d'arcs dans le graphe"))
-            return
-        
-        # Set up table
-        n_vertices = len(vertex_labels)
-        n_edges = len(edge_labels)
-        tab.setRowCount(n_vertices)
-        tab.setColumnCount(n_edges)
-        
-        # Set headers
-        tab.setHorizontalHeaderLabels(edge_labels)
-        tab.setVerticalHeaderLabels(vertex_labels)
+            return self.create_table_view(
+                MatrixTableModel(matrix, [], [], message="pas d'arcs dans le graphe"))
         
-        # Fill table with matrix values
-        for i in range(n_vertices):
-            for j in range(n_edges):
-                value = matrix[i, j]
-                item = QTableWidgetItem(str(int(value)))
-                item.setTextAlignment(Qt.AlignCenter)
-                tab.setItem(i, j, item)
-        
-        # Resize columns to content
-        tab.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        return self.create_table_view(MatrixTableModel(matrix, vertex_labels, edge_labels, kind="int"))
     
     def create_distance_tab(self):
         """Create the distance matrix tab."""
-        tab = QTableWidget()
-        self.tab_widget.addTab(tab, "Distance Matrix")
-        
         # Get matrix data
         matrix = self.canvas.get_distance_matrix()
         vertex_labels = self.canvas.get_vertex_labels()
         
         if len(matrix) == 0:
-            tab.setRowCount(1)
-            tab.setColumnCount(1)
-            tab.setItem(0, 0, QTableWidgetItem("Pas de sommets dans le graph"))
-            return
-        
-        # Set up table
-        n = len(vertex_labels)
-        tab.setRowCount(n)
-        tab.setColumnCount(n)
+            return self.create_table_view(
+                MatrixTableModel(matrix, [], [], message="Pas de sommets dans le graph"))
         
-        # Set headers
-        tab.setHorizontalHeaderLabels(vertex_labels)
-        tab.setVerticalHeaderLabels(vertex_labels)
-        
-        # Fill table with matrix values
-        for i in range(n):
-            for j in range(n):
-                value = matrix[i, j]
-                if np.isinf(value):
-                    text = "∞"
-                else:
-                    text = str(value)
-                item = QTableWidgetItem(text)
-                item.setTextAlignment(Qt.AlignCenter)
-                tab.setItem(i, j, item)
-        
-        # Resize columns to content
-        tab.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
\ No newline at end of file
+        return self.create_table_view(MatrixTableModel(matrix, vertex_labels, vertex_labels, kind="distance"))
+
+    def create_heatmap_tab(self):
+        """Create the heatmap tab (adjacency / distance matrix as an image)."""
+        return MatrixHeatmapTab(self.canvas)
@@ -0,0 +1,187 @@
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QPushButton, QRubberBand
+from PyQt5.QtGui import QImage, QPainter, QColor
+from PyQt5.QtCore import Qt, QRect, QSize, QTimer, pyqtSignal
+import numpy as np
+from core.matrices.heatmap import downsample, value_range, apply_colormap
+
+
+class HeatmapView(QWidget):
+    """
+    Paints a window of a matrix as an image. The window is block-pooled
+    down to the widget resolution, so the cost depends on the screen size
+    rather than on the matrix size. Drag a rectangle to zoom into a region,
+    double-click to go back to the whole matrix.
+    """
+    # Emitted on hover with (row, column), or (-1, -1) when outside the matrix
+    cell_hovered = pyqtSignal(int, int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMouseTracking(True)
+        self.setMinimumSize(200, 200)
+        self.matrix = np.zeros((0, 0))
+        self.mode = "mean"
+        self.window = (0, 0, 0, 0)  # (row0, row1, col0, col1) affichée
+        self.image = None
+        self.vmin, self.vmax = 0.0, 1.0
+        self.rubber_band = QRubberBand(QRubberBand.Rectangle, self)
+        self.drag_origin = None
+
+    def set_matrix(self, matrix, keep_zoom=False):
+        """Show a new matrix; keep_zoom keeps the window if the shape is unchanged."""
+        same_shape = np.shape(matrix) == np.shape(self.matrix)
+        self.matrix = matrix
+        if keep_zoom and same_shape:
+            self.render()
+        else:
+            self.reset_zoom()
+
+    def set_mode(self, mode):
+        self.mode = mode
+        self.render()
+
+    def reset_zoom(self):
+        rows, cols = self.matrix.shape if self.matrix.ndim == 2 else (0, 0)
+        self.window = (0, rows, 0, cols)
+        self.render()
+
+    def render(self):
+        """Pool the current window to the widget size and rebuild the image."""
+        row0, row1, col0, col1 = self.window
+        if row1 <= row0 or col1 <= col0:
+            self.image = None
+            self.update()
+            return
+        pooled = downsample(self.matrix[row0:row1, col0:col1],
+                            max(1, self.height()), max(1, self.width()), self.mode)
+        self.vmin, self.vmax = value_range(pooled)
+        rgb = apply_colormap(pooled, self.vmin, self.vmax)
+        height, width, _ = rgb.shape
+        # copy() detaches the image from the NumPy buffer
+        self.image = QImage(rgb.data, width, height, 3 * width, QImage.Format_RGB888).copy()
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor(Qt.white))
+        if self.image is not None:
+            painter.drawImage(self.rect(), self.image)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.render()
+
+    def cell_at(self, pos):
+        """Matrix (row, column) under a widget position, or None."""
+        row0, row1, col0, col1 = self.window
+        if row1 <= row0 or col1 <= col0 or not self.rect().contains(pos):
+            return None
+        row = row0 + int(pos.y() * (row1 - row0) / max(1, self.height()))
+        col = col0 + int(pos.x() * (col1 - col0) / max(1, self.width()))
+        return min(row, row1 - 1), min(col, col1 - 1)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self.drag_origin = event.pos()
+            self.rubber_band.setGeometry(QRect(self.drag_origin, QSize()))
+            self.rubber_band.show()
+
+    def mouseMoveEvent(self, event):
+        if self.drag_origin is not None:
+            self.rubber_band.setGeometry(QRect(self.drag_origin, event.pos()).normalized())
+        cell = self.cell_at(event.pos())
+        self.cell_hovered.emit(*(cell if cell else (-1, -1)))
+
+    def mouseReleaseEvent(self, event):
+        if event.button() != Qt.LeftButton or self.drag_origin is None:
+            return
+        self.rubber_band.hide()
+        start = self.cell_at(self.drag_origin)
+        end = self.cell_at(event.pos())
+        self.drag_origin = None
+        if start is None or end is None or start == end:
+            return
+        self.window = (min(start[0], end[0]), max(start[0], end[0]) + 1,
+                       min(start[1], end[1]), max(start[1], end[1]) + 1)
+        self.render()
+
+    def mouseDoubleClickEvent(self, event):
+        self.reset_zoom()
+
+    def leaveEvent(self, event):
+        self.cell_hovered.emit(-1, -1)
+        super().leaveEvent(event)
+
+
+class MatrixHeatmapTab(QWidget):
+    """Heatmap of the adjacency or distance matrix, with hover readout."""
+
+    def __init__(self, canvas, parent=None):
+        super().__init__(parent)
+        self.canvas = canvas
+        self.labels = []
+
+        layout = QVBoxLayout()
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("Matrice :"))
+        self.source_combo = QComboBox()
+        self.source_combo.addItem("Adjacence", "adjacency")
+        self.source_combo.addItem("Distances", "distance")
+        controls.addWidget(self.source_combo)
+        controls.addWidget(QLabel("Réduction :"))
+        self.mode_combo = QComboBox()
+        self.mode_combo.addItem("Moyenne", "mean")
+        self.mode_combo.addItem("Minimum", "min")
+        self.mode_combo.addItem("Maximum", "max")
+        controls.addWidget(self.mode_combo)
+        reset_button = QPushButton("Vue complète")
+        controls.addWidget(reset_button)
+        controls.addStretch()
+        layout.addLayout(controls)
+
+        self.view = HeatmapView()
+        layout.addWidget(self.view, 1)
+        self.readout = QLabel("Glissez pour zoomer, double-cliquez pour revenir à la vue complète.")
+        layout.addWidget(self.readout)
+        self.setLayout(layout)
+
+        self.source_combo.currentIndexChanged.connect(lambda: self.load_matrix())
+        self.mode_combo.currentIndexChanged.connect(
+            lambda: self.view.set_mode(self.mode_combo.currentData()))
+        reset_button.clicked.connect(self.view.reset_zoom)
+        self.view.cell_hovered.connect(self.show_cell)
+
+        # Coalesces the graph edits into one re-render
+        self.reload_timer = QTimer(self)
+        self.reload_timer.setSingleShot(True)
+        self.reload_timer.setInterval(100)
+        self.reload_timer.timeout.connect(lambda: self.load_matrix(keep_zoom=True))
+
+        self.load_matrix()
+
+    def schedule_reload(self):
+        """Reload the matrix shortly, after a burst of graph edits."""
+        self.reload_timer.start()
+
+    def load_matrix(self, keep_zoom=False):
+        if self.source_combo.currentData() == "distance":
+            matrix = self.canvas.get_distance_matrix()
+        else:
+            matrix = self.canvas.get_adjacency_matrix()
+        self.labels = self.canvas.get_vertex_labels()
+        self.view.mode = self.mode_combo.currentData()
+        self.view.set_matrix(matrix if np.ndim(matrix) == 2 else np.zeros((0, 0)), keep_zoom)
+
+    def show_cell(self, row, col):
+        """Show the exact value of the cell under the mouse."""
+        if row < 0:
+            row0, row1, col0, col1 = self.view.window
+            self.readout.setText(
+                f"Lignes {row0 + 1}-{row1}, colonnes {col0 + 1}-{col1} "
+                f"(min {self.view.vmin:g}, max {self.view.vmax:g})")
+            return
+        value = self.view.matrix[row, col]
+        text = "∞" if np.isinf(value) else f"{value:g}"
+        source = self.labels[row] if row < len(self.labels) else str(row + 1)
+        target = self.labels[col] if col < len(self.labels) else str(col + 1)
+        self.readout.setText(f"{source} → {target} : {text}")
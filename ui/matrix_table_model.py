@@ -0,0 +1,106 @@
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+import numpy as np
+
+
+class MatrixTableModel(QAbstractTableModel):
+    """
+    Read-only table model that reads cells lazily from a NumPy array.
+    Only the cells the view actually paints are formatted, so the cost of
+    showing a matrix no longer depends on its size.
+    """
+
+    def __init__(self, matrix, row_labels, column_labels, kind="float", message=None, parent=None):
+        super().__init__(parent)
+        self.matrix = matrix
+        self.row_labels = list(row_labels)
+        self.column_labels = list(column_labels)
+        self.kind = kind  # "float", "int" ou "distance"
+        self.message = message  # Texte affiché à la place d'une matrice vide
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        if self.message is not None:
+            return 1
+        return len(self.row_labels)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        if self.message is not None:
+            return 1
+        return len(self.column_labels)
+
+    def format_value(self, value):
+        """Format one cell the same way the old QTableWidgetItems did."""
+        if self.kind == "int":
+            return str(int(value))
+        if self.kind == "distance" and np.isinf(value):
+            return "∞"
+        return str(value)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            if self.message is not None:
+                return self.message
+            return self.format_value(self.matrix[index.row(), index.column()])
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if self.message is not None:
+            return str(section + 1)
+        labels = self.column_labels if orientation == Qt.Horizontal else self.row_labels
+        if 0 <= section < len(labels):
+            return labels[section]
+        return None
+
+    def set_matrix(self, matrix, cells=None):
+        """
+        Swap the backing array (its shape must match the headers) and
+        repaint the given (row, column) cells, or every cell when None.
+        """
+        self.matrix = matrix
+        rows, columns = self.rowCount(), self.columnCount()
+        if self.message is not None or rows == 0 or columns == 0:
+            return
+        if cells is None:
+            self.dataChanged.emit(self.index(0, 0), self.index(rows - 1, columns - 1))
+            return
+        for row, column in cells:
+            if 0 <= row < rows and 0 <= column < columns:
+                index = self.index(row, column)
+                self.dataChanged.emit(index, index)
+
+    def reset(self, matrix, row_labels, column_labels):
+        """Replace the matrix and the headers at once (shape changes included)."""
+        self.beginResetModel()
+        self.matrix = matrix
+        self.row_labels = list(row_labels)
+        self.column_labels = list(column_labels)
+        self.endResetModel()
+
+    def insert_row(self, row, label):
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.row_labels.insert(row, label)
+        self.endInsertRows()
+
+    def remove_row(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.row_labels[row]
+        self.endRemoveRows()
+
+    def insert_column(self, column, label):
+        self.beginInsertColumns(QModelIndex(), column, column)
+        self.column_labels.insert(column, label)
+        self.endInsertColumns()
+
+    def remove_column(self, column):
+        self.beginRemoveColumns(QModelIndex(), column, column)
+        del self.column_labels[column]
+        self.endRemoveColumns()
@@ -0,0 +1,60 @@
+from PyQt5.QtWidgets import QGraphicsItem, QGraphicsScene, QGraphicsView
+from PyQt5.QtGui import QPainter
+
+# Rendering profiles for GraphCanvas: each one configures render hints,
+# item caching, scene indexing, viewport update mode and optimisation flags
+# together, from best looking to cheapest to paint.
+RENDER_PROFILES = {
+    'quality': {
+        'label': "Qualité",
+        'render_hints': QPainter.Antialiasing | QPainter.SmoothPixmapTransform,
+        'vertex_cache_mode': QGraphicsItem.NoCache,
+        'viewport_update_mode': QGraphicsView.MinimalViewportUpdate,
+        'optimization_flags': QGraphicsView.OptimizationFlags(),
+        'bulk_index_method': QGraphicsScene.BspTreeIndex,
+    },
+    'balanced': {
+        'label': "Équilibré",
+        'render_hints': QPainter.Antialiasing,
+        'vertex_cache_mode': QGraphicsItem.DeviceCoordinateCache,
+        'viewport_update_mode': QGraphicsView.SmartViewportUpdate,
+        'optimization_flags': QGraphicsView.DontSavePainterState,
+        'bulk_index_method': QGraphicsScene.NoIndex,
+    },
+    'fast': {
+        'label': "Rapide",
+        'render_hints': QPainter.RenderHints(),
+        'vertex_cache_mode': QGraphicsItem.DeviceCoordinateCache,
+        'viewport_update_mode': QGraphicsView.BoundingRectViewportUpdate,
+        'optimization_flags': QGraphicsView.DontSavePainterState | QGraphicsView.DontAdjustForAntialiasing,
+        'bulk_index_method': QGraphicsScene.NoIndex,
+    },
+}
+
+# Materialised item counts at which the automatic mode moves up a profile
+AUTO_THRESHOLDS = [
+    (0, 'quality'),
+    (800, 'balanced'),
+    (4000, 'fast'),
+]
+
+# Fraction of a threshold to drop below before moving back down, so the
+# profile does not flicker while panning around a boundary
+AUTO_HYSTERESIS = 0.8
+
+
+def auto_profile(item_count, current=None):
+    """Pick the profile for the given number of items in the scene."""
+    target = AUTO_THRESHOLDS[0][1]
+    for threshold, name in AUTO_THRESHOLDS:
+        if item_count >= threshold:
+            target = name
+
+    if current in RENDER_PROFILES and current != target:
+        names = [name for _, name in AUTO_THRESHOLDS]
+        if names.index(target) < names.index(current):
+            # Moving down: only once clearly below the current profile's threshold
+            current_threshold = AUTO_THRESHOLDS[names.index(current)][0]
+            if item_count >= current_threshold * AUTO_HYSTERESIS:
+                return current
+    return target
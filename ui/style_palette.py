@@ -0,0 +1,66 @@
+from PyQt5.QtGui import QBrush, QPen, QColor
+from PyQt5.QtCore import QTimer
+
+
+class StylePalette:
+    """
+    Shared, pre-built pens and brushes. Animators ask the palette instead of
+    constructing a new QPen / QBrush at every step, so identical styles are
+    the same object and comparing them is cheap.
+    """
+
+    def __init__(self):
+        self._brushes = {}
+        self._pens = {}
+
+    def brush(self, color):
+        color = QColor(color)
+        key = color.rgba()
+        brush = self._brushes.get(key)
+        if brush is None:
+            brush = self._brushes[key] = QBrush(color)
+        return brush
+
+    def pen(self, color, width=2):
+        color = QColor(color)
+        key = (color.rgba(), width)
+        pen = self._pens.get(key)
+        if pen is None:
+            pen = self._pens[key] = QPen(color, width)
+        return pen
+
+
+class StyleDiffApplier:
+    """
+    Collects style changes made on model objects (VirtualVertex / VirtualEdge)
+    during a tick and pushes them to their bound items once per frame, so
+    each changed item repaints its own area instead of the whole scene.
+    """
+    FRAME_MS = 16
+
+    def __init__(self):
+        self._pending = {}  # objet du modèle -> None (ensemble ordonné)
+        self._timer = None
+
+    def mark(self, obj):
+        """Remember that obj's style changed; applied at the next frame."""
+        self._pending[obj] = None
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.setSingleShot(True)
+            self._timer.timeout.connect(self.flush)
+        if not self._timer.isActive():
+            self._timer.start(self.FRAME_MS)
+
+    def flush(self):
+        """Apply the pending changes to the items that are on screen."""
+        if self._timer is not None:
+            self._timer.stop()
+        pending, self._pending = self._pending, {}
+        for obj in pending:
+            if obj.item is not None:
+                obj.apply_style(obj.item)
+
+
+PALETTE = StylePalette()
+STYLE_APPLIER = StyleDiffApplier()
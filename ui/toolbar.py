@@ -1,9 +1,14 @@
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QPushButton, QLabel, QComboBox, QStackedWidget
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QPushButton, QLabel, QComboBox, QSpinBox, QStackedWidget, QCheckBox, QSlider
+)
 from PyQt5.QtCore import Qt
 from ui.algorithm_toolbar import AlgorithmToolbar
+from core.layout import LAYOUTS
 
 
 class ToolBar(QWidget):
+    FILTER_STEPS = 1000  # Crans des curseurs du filtre de poids
+
     def __init__(self):
         super().__init__()
         self.setFixedWidth(200)
@@ -22,6 +27,8 @@ class ToolBar(QWidget):
         self.algo_btn = QPushButton("ALGORITHMS")
         self.reset_btn = QPushButton("RESET GRAPH")
         self.matrices_btn = QPushButton("SHOW MATRICES")
+        self.save_btn = QPushButton("SAVE GRAPH")
+        self.open_btn = QPushButton("OPEN GRAPH")
 
         main_layout.addWidget(self.default_btn)
         main_layout.addWidget(self.add_vertex_btn)
@@ -30,12 +37,78 @@ class ToolBar(QWidget):
         main_layout.addWidget(self.algo_btn)
         main_layout.addWidget(self.reset_btn)
         main_layout.addWidget(self.matrices_btn)
+        main_layout.addWidget(self.save_btn)
+        main_layout.addWidget(self.open_btn)
 
         main_layout.addWidget(QLabel("Nom des sommets"))
         self.naming_mode = QComboBox()
         self.naming_mode.addItems(["Auto", "Custom"])
         main_layout.addWidget(self.naming_mode)
 
+        main_layout.addWidget(QLabel("Disposition"))
+        self.layout_kind = QComboBox()
+        for name, key, _ in LAYOUTS:
+            self.layout_kind.addItem(name, key)
+        main_layout.addWidget(self.layout_kind)
+        self.layout_btn = QPushButton("APPLY LAYOUT")
+        main_layout.addWidget(self.layout_btn)
+        self.layout_pause_btn = QPushButton("PAUSE LAYOUT")
+        self.layout_pause_btn.setCheckable(True)
+        self.layout_stop_btn = QPushButton("STOP LAYOUT")
+        main_layout.addWidget(self.layout_pause_btn)
+        main_layout.addWidget(self.layout_stop_btn)
+        self.layout_progress = QLabel()
+        main_layout.addWidget(self.layout_progress)
+        self.set_layout_running(False)
+
+        main_layout.addWidget(QLabel("Communautés"))
+        self.communities_btn = QPushButton("COLLAPSE COMMUNITIES")
+        self.communities_all_btn = QPushButton("SHOW ALL VERTICES")
+        main_layout.addWidget(self.communities_btn)
+        main_layout.addWidget(self.communities_all_btn)
+        self.communities_label = QLabel()
+        main_layout.addWidget(self.communities_label)
+        self.set_communities_active(False)
+
+        main_layout.addWidget(QLabel("Voisinage"))
+        self.focus_btn = QPushButton("FOCUS VERTEX")
+        main_layout.addWidget(self.focus_btn)
+        self.focus_depth = QSpinBox()
+        self.focus_depth.setRange(0, 20)
+        self.focus_depth.setValue(2)
+        self.focus_depth.setPrefix("k = ")
+        main_layout.addWidget(self.focus_depth)
+        self.focus_all_btn = QPushButton("LEAVE FOCUS")
+        main_layout.addWidget(self.focus_all_btn)
+        self.focus_label = QLabel()
+        main_layout.addWidget(self.focus_label)
+        self.set_focus_active(False)
+
+        main_layout.addWidget(QLabel("Filtre de poids"))
+        self.filter_enabled = QCheckBox("Filtrer les arêtes")
+        main_layout.addWidget(self.filter_enabled)
+        # Bornes en fraction des arêtes triées par poids (0-1000)
+        self.filter_low = QSlider(Qt.Horizontal)
+        self.filter_high = QSlider(Qt.Horizontal)
+        for slider in (self.filter_low, self.filter_high):
+            slider.setRange(0, self.FILTER_STEPS)
+            main_layout.addWidget(slider)
+        self.filter_high.setValue(self.FILTER_STEPS)
+        self.filter_label = QLabel()
+        main_layout.addWidget(self.filter_label)
+        self.filter_algorithms = QCheckBox("Algorithmes sur la vue filtrée")
+        main_layout.addWidget(self.filter_algorithms)
+
+        main_layout.addWidget(QLabel("Profil de rendu"))
+        self.render_profile = QComboBox()
+        self.render_profile.addItem("Auto", "auto")
+        self.render_profile.addItem("Qualité", "quality")
+        self.render_profile.addItem("Équilibré", "balanced")
+        self.render_profile.addItem("Rapide", "fast")
+        main_layout.addWidget(self.render_profile)
+        self.render_profile_label = QLabel()
+        main_layout.addWidget(self.render_profile_label)
+
         self.main_toolbar.setLayout(main_layout)
 
         # Create the algorithm toolbar
@@ -63,3 +136,64 @@ class ToolBar(QWidget):
     def get_naming_mode(self):
         """Get the current naming mode."""
         return self.naming_mode.currentText()
+
+    def get_layout_kind(self):
+        """Get the key of the selected layout."""
+        return self.layout_kind.currentData()
+
+    def set_layout_running(self, running):
+        """Enable the pause / stop buttons while a layout runs."""
+        self.layout_btn.setEnabled(not running)
+        self.layout_pause_btn.setEnabled(running)
+        self.layout_stop_btn.setEnabled(running)
+        if not running:
+            self.layout_pause_btn.setChecked(False)
+
+    def show_layout_progress(self, progress):
+        self.layout_progress.setText(f"Disposition : {progress:.0%}")
+
+    def set_communities_active(self, active):
+        """Enable going back to the full graph while communities are collapsed."""
+        self.communities_all_btn.setEnabled(active)
+        if not active:
+            self.communities_label.clear()
+
+    def show_communities(self, count, modularity):
+        self.communities_label.setText(f"{count} communautés (Q = {modularity:.3f})")
+
+    def set_focus_active(self, active):
+        """Enable leaving the focus view while it is shown."""
+        self.focus_all_btn.setEnabled(active)
+        if not active:
+            self.focus_label.clear()
+
+    def show_focus(self, label, depth, count):
+        self.focus_label.setText(f"{label} : {count} sommets à {depth} sauts")
+
+    def get_weight_band(self):
+        """(low, high) bounds of the weight filter, as fractions of the edges."""
+        low, high = sorted((self.filter_low.value(), self.filter_high.value()))
+        return low / self.FILTER_STEPS, high / self.FILTER_STEPS
+
+    def show_weight_filter(self, low, high, shown, total):
+        self.filter_label.setText(f"Poids [{low:g}, {high:g}] : {shown}/{total} arêtes")
+
+    def reset_weight_filter(self):
+        """Back to the unfiltered state, without emitting the control signals."""
+        for widget, value in ((self.filter_enabled, False), (self.filter_low, 0),
+                              (self.filter_high, self.FILTER_STEPS)):
+            widget.blockSignals(True)
+            if isinstance(widget, QCheckBox):
+                widget.setChecked(value)
+            else:
+                widget.setValue(value)
+            widget.blockSignals(False)
+        self.filter_label.clear()
+
+    def get_render_profile_mode(self):
+        """Get the selected rendering profile ("auto" or a profile name)."""
+        return self.render_profile.currentData()
+
+    def show_render_profile(self, label):
+        """Display the rendering profile currently in use."""
+        self.render_profile_label.setText(f"Actif : {label}")
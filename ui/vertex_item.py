@@ -7,6 +7,10 @@ from PyQt5.QtGui import QBrush, QPen, QColor, QFont
 from PyQt5.QtCore import Qt, QPointF
 
 class VertexItem(QGraphicsEllipseItem):
+    """
+    On-screen view of a VirtualVertex. Items are pooled by the canvas and
+    rebound to whichever vertex is currently visible.
+    """
     RADIUS = 20
 
     # Couleurs centralisées
@@ -14,11 +18,10 @@ class VertexItem(QGraphicsEllipseItem):
     COLOR_HOVER = QBrush(Qt.green)
     COLOR_SELECTED = QBrush(Qt.cyan)
 
-    def __init__(self, x, y, radius, label):
-        super().__init__(x - radius, y - radius, 2 * radius, 2 * radius)
+    def __init__(self, vertex=None):
+        super().__init__(-self.RADIUS, -self.RADIUS, 2 * self.RADIUS, 2 * self.RADIUS)
 
-        self.label = label  # pour affichage dans la console
-        self.radius = radius
+        self.vertex = None  # Sommet du modèle actuellement affiché
 
         # Style du sommet
         self.setBrush(self.COLOR_DEFAULT)
@@ -34,24 +37,34 @@ class VertexItem(QGraphicsEllipseItem):
         )
         self.setAcceptHoverEvents(True)
 
-        # Successeur et prédécesseur
-        self.voisins = []  # Liste des voisins connectés
-        self.successors = [] # Liste des successeurs connectés
-        self.predecessors = [] # Liste des prédécesseurs connectés
-        
         # Créer le texte associé
-        self.text_item = QGraphicsTextItem(label, self)
+        self.text_item = QGraphicsTextItem("", self)
         self.text_item.setDefaultTextColor(Qt.black)
+
+        if vertex is not None:
+            self.bind(vertex)
+
+    def bind(self, vertex):
+        """Display the given model vertex with this item."""
+        self.vertex = vertex
+        vertex.item = self
+        radius = vertex.radius
+        self.setRect(-radius, -radius, 2 * radius, 2 * radius)
+        self.setPos(vertex.x, vertex.y)
+        self.setBrush(vertex.brush())
+        self.text_item.setPlainText(vertex.label)
         self.center_text()
 
-    def set_color(self, color):
-        """Set the vertex color"""
-        if isinstance(color, QColor):
-            self.setBrush(QBrush(color))
-        elif isinstance(color, QBrush):
-            self.setBrush(color)
-        else:
-            raise TypeError("Color must be QColor or QBrush")
+    def unbind(self):
+        """Detach the item from its vertex so it can be recycled."""
+        if self.vertex is not None and self.vertex.item is self:
+            self.vertex.item = None
+        self.vertex = None
+        self.setSelected(False)
+
+    @property
+    def label(self):
+        return self.vertex.label if self.vertex is not None else ""
 
     def center_text(self):
         text_rect = self.text_item.boundingRect()
@@ -61,28 +74,32 @@ class VertexItem(QGraphicsEllipseItem):
         )
 
     def hoverEnterEvent(self, event):
-        if self.brush() == self.COLOR_DEFAULT:  # Only change color if in default state
-            self.setBrush(self.COLOR_HOVER)
+        if self.vertex is not None and self.vertex.brush() == self.COLOR_DEFAULT:  # Only change color if in default state
+            self.vertex.setBrush(self.COLOR_HOVER)
         super().hoverEnterEvent(event)
 
     def hoverLeaveEvent(self, event):
-        if self.brush() == self.COLOR_HOVER:  # Only change back if in hover state
-            self.setBrush(self.COLOR_DEFAULT)
+        if self.vertex is not None and self.vertex.brush() == self.COLOR_HOVER:  # Only change back if in hover state
+            self.vertex.setBrush(self.COLOR_DEFAULT)
         super().hoverLeaveEvent(event)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton and self.scene().views()[0].mode == "DEFAULT":
-            self.setBrush(self.COLOR_SELECTED)
+            self.vertex.setBrush(self.COLOR_SELECTED)
             super().mousePressEvent(event)
         elif event.button() == Qt.RightButton:
             # Afficher le menu contextuel
-            self.show_context_menu(event)       
-            
+            self.show_context_menu(event)
+
     def mouseMoveEvent(self, event):
         """Handle vertex movement and notify the canvas to update edges."""
         super().mouseMoveEvent(event)
+        if self.vertex is None:
+            return
+        # Keep the model position in sync with the dragged item
+        self.vertex.move_to(self.pos().x(), self.pos().y())
         # Notify the parent canvas to update edges
         if self.scene():
             canvas = self.scene().views()[0]  # Assuming the first view is the GraphCanvas
             if hasattr(canvas, 'update_edges'):
-                canvas.update_edges(self)        
\ No newline at end of file
+                canvas.update_edges(self.vertex)
@@ -0,0 +1,351 @@
+import numpy as np
+from PyQt5.QtCore import QRectF, QTimer
+from PyQt5.QtWidgets import QGraphicsItem
+from ui.vertex_item import VertexItem
+from ui.edge_item import EdgeItem
+
+
+class ViewportVirtualizer:
+    """
+    Keeps QGraphicsItems only for the part of the graph that intersects the
+    viewport (plus a margin). Geometry stays in the model (VirtualVertex /
+    VirtualEdge); a pool of VertexItem and EdgeItem objects is bound to
+    whatever is on screen and recycled as the user pans and zooms.
+    """
+
+    def __init__(self, canvas, margin=200, max_vertex_items=5000, max_edge_items=10000):
+        self.canvas = canvas
+        self.margin = margin  # Marge autour de la vue, en pixels écran
+        self.max_vertex_items = max_vertex_items
+        self.max_edge_items = max_edge_items
+
+        self.vertices = []
+        self.edges = []
+        self.vertex_index = {}  # vertex -> position dans self.vertices
+        self.hidden_edges = set()  # Arêtes du modèle masquées par un filtre
+
+        self.active_vertices = {}  # vertex -> VertexItem lié
+        self.active_edges = {}  # edge -> EdgeItem lié
+        self.vertex_pool = []  # VertexItem libres (cachés)
+        self.edge_pool = []  # EdgeItem libres (cachés)
+        self.vertex_cache_mode = QGraphicsItem.NoCache
+
+        # Géométrie du modèle sous forme de tableaux pour les requêtes de visibilité
+        self._xs = np.empty(0)
+        self._ys = np.empty(0)
+        self._radii = np.empty(0)
+        self._edge_src = np.empty(0, dtype=np.int64)
+        self._edge_dst = np.empty(0, dtype=np.int64)
+        self._edge_shown = np.empty(0, dtype=bool)
+        self._edge_positions = None  # edge -> position dans self.edges, construit au besoin
+        self._dirty = False
+
+        # Coalesce refresh requests (scroll, zoom, import) into one per event loop pass
+        self._refresh_timer = QTimer()
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self.refresh)
+
+    # ------------------------------------------------------------------
+    # Model bookkeeping
+    # ------------------------------------------------------------------
+    def add_vertex(self, vertex):
+        self.vertex_index[vertex] = len(self.vertices)
+        self.vertices.append(vertex)
+        self._dirty = True
+        self.schedule_refresh()
+
+    def add_vertices(self, vertices):
+        """Add many vertices with a single refresh."""
+        for vertex in vertices:
+            self.vertex_index[vertex] = len(self.vertices)
+            self.vertices.append(vertex)
+        self._dirty = True
+        self.schedule_refresh()
+
+    def remove_vertex(self, vertex):
+        if vertex not in self.vertex_index:
+            return
+        self._release_vertex(vertex)
+        self.vertices.pop(self.vertex_index[vertex])
+        self.vertex_index = {v: i for i, v in enumerate(self.vertices)}
+        self._dirty = True
+        self.schedule_refresh()
+
+    def add_edge(self, edge):
+        self.edges.append(edge)
+        self._dirty = True
+        self.schedule_refresh()
+
+    def add_edges(self, edges):
+        """Add many edges with a single refresh."""
+        self.edges.extend(edges)
+        self._dirty = True
+        self.schedule_refresh()
+
+    def remove_edge(self, edge):
+        self._release_edge(edge)
+        self.hidden_edges.discard(edge)
+        if edge in self.edges:
+            self.edges.remove(edge)
+        self._dirty = True
+        self.schedule_refresh()
+
+    def set_model(self, vertices, edges):
+        """
+        Display other vertices and edges (aggregated or focus views of the
+        graph). Only the items of what leaves the model are released; the
+        rest stays bound, and what enters is bound at the next refresh.
+        """
+        self.vertices = list(vertices)
+        self.edges = list(edges)
+        self.vertex_index = {v: i for i, v in enumerate(self.vertices)}
+        kept_edges = set(self.edges)
+        with self.canvas.bulk_update():
+            for vertex in [v for v in self.active_vertices if v not in self.vertex_index]:
+                self._release_vertex(vertex)
+            for edge in [e for e in self.active_edges if e not in kept_edges]:
+                self._release_edge(edge)
+        self._dirty = True
+        self.canvas.scene.setSceneRect(QRectF())
+        self.schedule_refresh()
+
+    def set_edges_hidden(self, edges, hidden):
+        """
+        Hide or show model edges without removing them (filters). Only the
+        given edges are touched: hidden ones lose their item now, shown
+        ones get one at the next refresh if they are on screen.
+        """
+        edges = list(edges)
+        if not edges:
+            return
+        if hidden:
+            self.hidden_edges.update(edges)
+        else:
+            self.hidden_edges.difference_update(edges)
+        if not self._dirty:
+            if self._edge_positions is None:
+                self._edge_positions = {e: i for i, e in enumerate(self.edges)}
+            positions = [self._edge_positions[e] for e in edges if e in self._edge_positions]
+            self._edge_shown[positions] = not hidden
+        if hidden:
+            with self.canvas.bulk_update():
+                for edge in edges:
+                    self._release_edge(edge)
+        self.schedule_refresh()
+
+    def vertex_moved(self, vertex):
+        """Keep the position arrays in sync after a drag, without a full rebuild."""
+        index = self.vertex_index.get(vertex)
+        if index is not None and not self._dirty and index < len(self._xs):
+            self._xs[index] = vertex.x
+            self._ys[index] = vertex.y
+            self._grow_scene_rect(vertex.x, vertex.y, vertex.x, vertex.y, vertex.radius)
+
+    def positions_changed(self, xs, ys):
+        """
+        Every vertex may have moved (layouts): take the new position arrays,
+        given in the order of self.vertices, and move the bound items.
+        """
+        if not self._dirty and len(xs) == len(self._xs):
+            self._xs = np.array(xs, dtype=float)
+            self._ys = np.array(ys, dtype=float)
+        else:
+            self._dirty = True
+        with self.canvas.bulk_update():
+            for vertex, item in self.active_vertices.items():
+                item.setPos(vertex.x, vertex.y)
+            for edge in self.active_edges:
+                edge.update_path()
+        # The graph may have shrunk as well as grown
+        self.canvas.scene.setSceneRect(QRectF())
+        if not self._dirty and len(self._xs):
+            self._grow_scene_rect(self._xs.min(), self._ys.min(), self._xs.max(), self._ys.max(),
+                                  self._radii.max())
+        self.schedule_refresh()
+
+    def reset(self):
+        """Forget everything; the scene has already been cleared by the canvas."""
+        self._refresh_timer.stop()
+        for vertex in self.active_vertices:
+            vertex.item = None
+        for edge in self.active_edges:
+            edge.item = None
+        self.vertices = []
+        self.edges = []
+        self.vertex_index = {}
+        self.hidden_edges = set()
+        self.active_vertices = {}
+        self.active_edges = {}
+        self.vertex_pool = []
+        self.edge_pool = []
+        self._xs = np.empty(0)
+        self._ys = np.empty(0)
+        self._radii = np.empty(0)
+        self._edge_src = np.empty(0, dtype=np.int64)
+        self._edge_dst = np.empty(0, dtype=np.int64)
+        self._edge_shown = np.empty(0, dtype=bool)
+        self._edge_positions = None
+        self._dirty = False
+        self.canvas.scene.setSceneRect(QRectF())
+
+    def _rebuild_arrays(self):
+        self._xs = np.fromiter((v.x for v in self.vertices), dtype=float, count=len(self.vertices))
+        self._ys = np.fromiter((v.y for v in self.vertices), dtype=float, count=len(self.vertices))
+        self._radii = np.fromiter((v.radius for v in self.vertices), dtype=float, count=len(self.vertices))
+        index = self.vertex_index
+        self._edge_src = np.fromiter((index[e.source] for e in self.edges), dtype=np.int64, count=len(self.edges))
+        self._edge_dst = np.fromiter((index[e.target] for e in self.edges), dtype=np.int64, count=len(self.edges))
+        if self.hidden_edges:
+            hidden = self.hidden_edges
+            self._edge_shown = np.fromiter((e not in hidden for e in self.edges), dtype=bool, count=len(self.edges))
+        else:
+            self._edge_shown = np.ones(len(self.edges), dtype=bool)
+        self._edge_positions = None
+        self._dirty = False
+
+        if len(self._xs):
+            self._grow_scene_rect(self._xs.min(), self._ys.min(), self._xs.max(), self._ys.max(),
+                                  self._radii.max())
+
+    def _grow_scene_rect(self, left, top, right, bottom, radius=VertexItem.RADIUS):
+        # Items only exist for the visible part of the graph, so the scene
+        # cannot infer its extent by itself any more: grow it from the model.
+        pad = max(radius, VertexItem.RADIUS) + self.margin
+        bounds = QRectF(left - pad, top - pad, right - left + 2 * pad, bottom - top + 2 * pad)
+        scene = self.canvas.scene
+        scene.setSceneRect(scene.sceneRect().united(bounds))
+
+    # ------------------------------------------------------------------
+    # Visibility
+    # ------------------------------------------------------------------
+    def schedule_refresh(self):
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start(0)
+
+    def visible_rect(self):
+        """Scene rectangle covered by the viewport, enlarged by the margin."""
+        view = self.canvas
+        rect = view.mapToScene(view.viewport().rect()).boundingRect()
+        margin = self.margin / max(view.scale_factor, 1e-6)
+        return rect.adjusted(-margin, -margin, margin, margin)
+
+    def refresh(self):
+        """Bind pooled items to what is visible and recycle the rest."""
+        if self._dirty:
+            self._rebuild_arrays()
+
+        rect = self.visible_rect()
+        left, top, right, bottom = rect.left(), rect.top(), rect.right(), rect.bottom()
+        cx, cy = rect.center().x(), rect.center().y()
+        xs, ys = self._xs, self._ys
+        radius = self._radii  # Super-sommets des communautés plus grands que les autres
+
+        # Vertices whose disc intersects the visible rectangle
+        vertex_mask = (xs >= left - radius) & (xs <= right + radius) & \
+                      (ys >= top - radius) & (ys <= bottom + radius)
+        visible_idx = self._closest(np.flatnonzero(vertex_mask), xs, ys, cx, cy, self.max_vertex_items)
+
+        # Edges whose bounding box intersects the visible rectangle
+        visible_edge_idx = np.empty(0, dtype=np.int64)
+        if len(self._edge_src):
+            sx, sy = xs[self._edge_src], ys[self._edge_src]
+            tx, ty = xs[self._edge_dst], ys[self._edge_dst]
+            edge_mask = (np.maximum(sx, tx) >= left) & (np.minimum(sx, tx) <= right) & \
+                        (np.maximum(sy, ty) >= top) & (np.minimum(sy, ty) <= bottom) & self._edge_shown
+            mx, my = (sx + tx) / 2, (sy + ty) / 2
+            visible_edge_idx = self._closest(np.flatnonzero(edge_mask), mx, my, cx, cy, self.max_edge_items)
+
+        visible_vertices = {self.vertices[i] for i in visible_idx.tolist()}
+        visible_edges = {self.edges[i] for i in visible_edge_idx.tolist()}
+
+        grabber = self.canvas.scene.mouseGrabberItem()
+        released_vertices = [v for v in self.active_vertices
+                             if v not in visible_vertices and self.active_vertices[v] is not grabber]
+        released_edges = [e for e in self.active_edges if e not in visible_edges]
+        bound_vertices = [v for v in visible_vertices if v not in self.active_vertices]
+        bound_edges = [e for e in visible_edges if e not in self.active_edges]
+        changes = len(released_vertices) + len(released_edges) + len(bound_vertices) + len(bound_edges)
+
+        if changes:
+            with self.canvas.bulk_update():
+                # Release first so that the freed items can be reused right away
+                for vertex in released_vertices:
+                    self._release_vertex(vertex)
+                for edge in released_edges:
+                    self._release_edge(edge)
+                for vertex in bound_vertices:
+                    self._bind_vertex(vertex)
+                for edge in bound_edges:
+                    self._bind_edge(edge)
+                self._trim_pools()
+
+        if hasattr(self.canvas, 'update_render_profile'):
+            self.canvas.update_render_profile()
+
+    @staticmethod
+    def _closest(indices, xs, ys, cx, cy, limit):
+        """Keep at most `limit` indices, preferring those nearest the view centre."""
+        if len(indices) <= limit:
+            return indices
+        dist = (xs[indices] - cx) ** 2 + (ys[indices] - cy) ** 2
+        return indices[np.argpartition(dist, limit)[:limit]]
+
+    # ------------------------------------------------------------------
+    # Pools
+    # ------------------------------------------------------------------
+    def _bind_vertex(self, vertex):
+        if self.vertex_pool:
+            item = self.vertex_pool.pop()
+        else:
+            item = VertexItem()
+            item.setCacheMode(self.vertex_cache_mode)
+            item.text_item.setCacheMode(self.vertex_cache_mode)
+            self.canvas.scene.addItem(item)
+        item.bind(vertex)
+        item.show()
+        self.active_vertices[vertex] = item
+
+    def _release_vertex(self, vertex):
+        item = self.active_vertices.pop(vertex, None)
+        if item is None:
+            return
+        item.hide()
+        item.unbind()
+        self.vertex_pool.append(item)
+
+    def _bind_edge(self, edge):
+        if self.edge_pool:
+            item = self.edge_pool.pop()
+        else:
+            item = EdgeItem()
+            self.canvas.scene.addItem(item)
+        item.bind(edge)
+        item.show()
+        self.active_edges[edge] = item
+
+    def _release_edge(self, edge):
+        item = self.active_edges.pop(edge, None)
+        if item is None:
+            return
+        item.hide()
+        item.unbind()
+        self.edge_pool.append(item)
+
+    def _trim_pools(self):
+        # Keep a spare pool proportional to what is on screen, drop the rest
+        scene = self.canvas.scene
+        while len(self.vertex_pool) > max(len(self.active_vertices), 64):
+            scene.removeItem(self.vertex_pool.pop())
+        while len(self.edge_pool) > max(len(self.active_edges), 64):
+            scene.removeItem(self.edge_pool.pop())
+
+    def set_vertex_cache_mode(self, mode):
+        """Apply a cache mode to every vertex item, bound or pooled."""
+        self.vertex_cache_mode = mode
+        for item in list(self.active_vertices.values()) + self.vertex_pool:
+            item.setCacheMode(mode)
+            item.text_item.setCacheMode(mode)
+
+    def item_count(self):
+        """Number of items currently materialised in the scene."""
+        return len(self.active_vertices) + len(self.active_edges)
@@ -0,0 +1,112 @@
+from PyQt5.QtGui import QPen
+from PyQt5.QtCore import Qt
+from ui.style_palette import PALETTE, STYLE_APPLIER
+
+
+class VirtualEdge:
+    """
+    Model-side edge between two VirtualVertex objects. The pen and weight
+    label are kept here; a pooled EdgeItem is attached (self.item) only
+    while the edge intersects the visible region of the canvas.
+    """
+
+    def __init__(self, source, target, radius=20, directed=False, is_curvy=False, text=None, link=True):
+        self.source = source
+        self.target = target
+        self.radius = radius
+        self.directed = directed
+        self.is_curvy = is_curvy
+        self.text = text  # Poids affiché (None si aucun)
+        self._pen = PALETTE.pen(Qt.black, 2)
+        self.item = None  # EdgeItem lié lorsque l'arête est visible
+
+        if not link:
+            return  # Display-only edge (community bundles): the neighbourhoods stay as they are
+
+        # Update successors and predecessors
+        if self.directed:
+            self.source.successors.append(self.target)
+            self.target.predecessors.append(self.source)
+        self.source.voisins.append(self.target)
+        self.target.voisins.append(self.source)
+
+    def setPen(self, pen):
+        """Store the pen; the bound item, if any, is updated at the next frame."""
+        if pen == self._pen:
+            return
+        self._pen = pen
+        if self.item is not None:
+            STYLE_APPLIER.mark(self)
+
+    def apply_style(self, item):
+        item.setPen(self._pen)
+
+    def pen(self):
+        return self._pen
+
+    def update_path(self):
+        """Recompute the on-screen path; nothing to do while not materialised."""
+        if self.item is not None:
+            self.item.update_path()
+
+    def set_source(self, source):
+        # Remove the old source from the target's predecessors and voisins
+        if self.directed and self.source in self.target.predecessors:
+            self.target.predecessors.remove(self.source)
+        if self.source in self.target.voisins:
+            self.target.voisins.remove(self.source)
+
+        self.source = source
+        # Update successors, predecessors, and voisins
+        if self.directed:
+            self.source.successors.append(self.target)
+            self.target.predecessors.append(self.source)
+        self.source.voisins.append(self.target)
+        self.target.voisins.append(self.source)
+        self.debug_successors_predecessors_voisins()
+
+        self.update_path()
+
+    def set_target(self, target):
+        # Remove the old target from the source's successors and voisins
+        if self.directed and self.target in self.source.successors:
+            self.source.successors.remove(self.target)
+        if self.target in self.source.voisins:
+            self.source.voisins.remove(self.target)
+
+        self.target = target
+
+        # Update successors, predecessors, and voisins
+        if self.directed:
+            self.source.successors.append(self.target)
+            self.target.predecessors.append(self.source)
+        self.source.voisins.append(self.target)
+        self.target.voisins.append(self.source)
+        self.debug_successors_predecessors_voisins()
+
+        self.update_path()
+
+    def remove_edge(self):
+        """Update successors, predecessors, and voisins when the edge goes away."""
+        if self.directed:
+            # Remove the target from the source's successors
+            if self.target in self.source.successors:
+                self.source.successors.remove(self.target)
+            # Remove the source from the target's predecessors
+            if self.source in self.target.predecessors:
+                self.target.predecessors.remove(self.source)
+        # Remove each other from voisins
+        if self.target in self.source.voisins:
+            self.source.voisins.remove(self.target)
+        if self.source in self.target.voisins:
+            self.target.voisins.remove(self.source)
+        print(f"[Debug] Edge removed: {self.source.label} -> {self.target.label}")
+
+    def debug_successors_predecessors_voisins(self):
+        """Debug function to print successors, predecessors, and voisins."""
+        print(f"[Debug] Source: {self.source.label}")
+        print(f"  Successors: {[v.label for v in self.source.successors]}")
+        print(f"  Voisins: {[v.label for v in self.source.voisins]}")
+        print(f"[Debug] Target: {self.target.label}")
+        print(f"  Predecessors: {[v.label for v in self.target.predecessors]}")
+        print(f"  Voisins: {[v.label for v in self.target.voisins]}")
@@ -0,0 +1,63 @@
+from PyQt5.QtGui import QBrush, QColor
+from PyQt5.QtCore import QPointF, QRectF
+from ui.vertex_item import VertexItem
+from ui.style_palette import PALETTE, STYLE_APPLIER
+
+
+class VirtualVertex:
+    """
+    Model-side vertex: position, label, style and neighbourhood live here.
+    A pooled VertexItem is attached (self.item) only while the vertex
+    intersects the visible region of the canvas.
+    """
+
+    def __init__(self, x, y, radius, label):
+        self.x = x
+        self.y = y
+        self.radius = radius
+        self.label = label
+
+        # Successeur et prédécesseur
+        self.voisins = []  # Liste des voisins connectés
+        self.successors = []  # Liste des successeurs connectés
+        self.predecessors = []  # Liste des prédécesseurs connectés
+
+        self._brush = VertexItem.COLOR_DEFAULT
+        self.item = None  # VertexItem lié lorsque le sommet est visible
+
+    def set_color(self, color):
+        """Set the vertex color"""
+        if isinstance(color, QColor):
+            self.setBrush(PALETTE.brush(color))
+        elif isinstance(color, QBrush):
+            self.setBrush(color)
+        else:
+            raise TypeError("Color must be QColor or QBrush")
+
+    def setBrush(self, brush):
+        """Store the brush; the bound item, if any, is updated at the next frame."""
+        if brush == self._brush:
+            return
+        self._brush = brush
+        if self.item is not None:
+            STYLE_APPLIER.mark(self)
+
+    def apply_style(self, item):
+        item.setBrush(self._brush)
+
+    def brush(self):
+        return self._brush
+
+    def center(self):
+        return QPointF(self.x, self.y)
+
+    def sceneBoundingRect(self):
+        """Same geometry as the VertexItem would report, without needing one."""
+        return QRectF(self.x - self.radius, self.y - self.radius, 2 * self.radius, 2 * self.radius)
+
+    def move_to(self, x, y):
+        """Move the vertex in the model and keep the bound item in sync."""
+        self.x = x
+        self.y = y
+        if self.item is not None and self.item.pos() != QPointF(x, y):
+            self.item.setPos(x, y)
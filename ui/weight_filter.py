@@ -0,0 +1,99 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+import numpy as np
+from core.matrices import WeightIndex
+
+
+class WeightFilter(QObject):
+    """
+    Shows only the edges whose weight lies in a band [low, high]. The
+    edges are indexed once by weight (WeightIndex); moving a bound looks
+    up by bisection the edges entering or leaving the band, and only
+    those are hidden or shown by the viewport virtualizer. The graph is
+    not modified, so no matrix is rebuilt.
+
+    Any edit of the graph drops the index and shows every edge again.
+    """
+    # low, high, number of edges shown, number of edges
+    changed = pyqtSignal(float, float, int, int)
+    # The filter was cleared (graph edited or filter turned off)
+    cleared = pyqtSignal()
+
+    def __init__(self, canvas, parent=None):
+        super().__init__(parent)
+        self.canvas = canvas
+        self.index = None  # WeightIndex of the graph edges, None until needed
+        self.edge_list = []  # VirtualEdge of every edge of matrices.edges (None if not drawn)
+        self.span = None  # (start, stop) dans l'ordre trié, None si pas de filtre
+        self.low = self.high = 0.0
+        canvas.matrices.subscribe(self.on_graph_changed)
+
+    def is_active(self):
+        return self.span is not None
+
+    def build_index(self):
+        edges = self.canvas.matrices.edges
+        self.index = WeightIndex(np.fromiter((float(w) for _, _, w, _ in edges), dtype=np.float64, count=len(edges)))
+        # Canvas item of each model edge, matched by end points (in order for parallel edges)
+        items = {}
+        for source, target, edge, _ in reversed(self.canvas.edges):
+            items.setdefault((source, target), []).append(edge)
+        self.edge_list = []
+        for source, target, _, _ in edges:
+            drawn = items.get((source, target))
+            self.edge_list.append(drawn.pop() if drawn else None)
+
+    def items(self, indices):
+        """Canvas items of the given model edges."""
+        edge_list = self.edge_list
+        return [edge_list[i] for i in indices.tolist() if edge_list[i] is not None]
+
+    def set_quantiles(self, low, high):
+        """Band given as fractions of the edges, by increasing weight (0-1)."""
+        if self.index is None:
+            self.build_index()
+        self.set_range(self.index.quantile(low), self.index.quantile(high))
+
+    def set_range(self, low, high):
+        """Show only the edges whose weight is in [low, high]."""
+        if self.index is None:
+            self.build_index()
+        index = self.index
+        span = index.span(low, high)
+        old = self.span if self.span is not None else (0, len(index))
+        entering, leaving = index.changes(old, span)
+        virtualizer = self.canvas.virtualizer
+        virtualizer.set_edges_hidden(self.items(leaving), True)
+        virtualizer.set_edges_hidden(self.items(entering), False)
+        self.span, self.low, self.high = span, low, high
+        shown = span[1] - span[0]
+        print(f"[Filter] Poids dans [{low:g}, {high:g}] : {shown}/{len(index)} arêtes "
+              f"(+{len(entering)} / -{len(leaving)})")
+        self.changed.emit(low, high, shown, len(index))
+
+    def clear(self):
+        """Show every edge again."""
+        if self.span is None:
+            return
+        hidden = np.concatenate([self.index.order[:self.span[0]], self.index.order[self.span[1]:]])
+        self.canvas.virtualizer.set_edges_hidden(self.items(hidden), False)
+        self.span = None
+        self.cleared.emit()
+
+    def kept_edges(self):
+        """Indices (in matrices.edges) of the edges shown, or None without filter."""
+        if self.span is None:
+            return None
+        return self.index.edges(self.span)
+
+    def filtered_matrices(self):
+        """The graph restricted to the edges shown, for algorithms."""
+        matrices = self.canvas.matrices
+        kept = self.kept_edges()
+        return matrices if kept is None else matrices.filtered(kept)
+
+    def on_graph_changed(self, event, details):
+        # The index no longer matches the graph
+        if self.span is not None:
+            self.clear()
+        self.index = None
+        self.edge_list = []